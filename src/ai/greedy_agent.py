@@ -0,0 +1,89 @@
+import numpy as np
+from typing import Optional
+from game.constants import ALIEN_AUTO_MOVE_SPEED
+from game.input_state import InputState
+
+class GreedyAgent:
+    """Simple scripted player: hunt the nearest human, return to base when full.
+
+    Buys the cheapest affordable upgrade whenever it has the resources, or,
+    given an UpgradePlanner, follows its plan; see with_planner. The plan is
+    redone after each purchase, and every replan_every seconds of game time
+    while it has nothing to buy or its next purchase stays unaffordable.
+    """
+
+    def __init__(self, buy_upgrades: bool = True, planner=None, plan_horizon: float = 600.0,
+                 replan_every: float = 10.0):
+        self.buy_upgrades = buy_upgrades
+        self.planner = planner
+        self.plan_horizon = plan_horizon
+        self.replan_every = replan_every
+        self._target = None
+        self._plan = None
+        self._plan_levels = None
+        self._planned_at = None
+
+    @classmethod
+    def with_planner(cls, plan_horizon: float = 600.0, replan_every: float = 10.0,
+                     **planner_args) -> "GreedyAgent":
+        """Agent following an UpgradePlanner that models how it actually moves.
+
+        It plays click-to-move at ALIEN_AUTO_MOVE_SPEED, so speed upgrades
+        earn it nothing.
+        """
+        from .upgrade_planner import UpgradePlanner
+        planner_args.setdefault("fixed_speed", ALIEN_AUTO_MOVE_SPEED)
+        return cls(planner=UpgradePlanner(**planner_args), plan_horizon=plan_horizon,
+                   replan_every=replan_every)
+
+    def act(self, world) -> InputState:
+        alien = world.alien
+        purchase = self.choose_upgrade(world) if self.buy_upgrades else None
+
+        if alien.cargo >= alien.max_cargo:
+            target = (world.base_x, world.base_y)
+        else:
+            target = self.nearest_human(world)
+            if target is None:
+                target = (world.base_x, world.base_y) if alien.cargo else None
+
+        # Only issue a new move order when the target changes
+        if target == self._target and alien.moving_to_target:
+            target = None
+        else:
+            self._target = target
+        return InputState(target=target, purchase=purchase)
+
+    def nearest_human(self, world) -> Optional[tuple]:
+        humans = world.humans
+        alive = humans.alive_indices()
+        if not len(alive):
+            return None
+        dx = humans.x[alive] - world.alien.x
+        dy = humans.y[alive] - world.alien.y
+        index = alive[np.argmin(dx * dx + dy * dy)]
+        return (float(humans.x[index]), float(humans.y[index]))
+
+    def choose_upgrade(self, world) -> Optional[str]:
+        upgrade_system = world.upgrade_system
+        if self.planner is not None:
+            return self.planned_upgrade(world)
+
+        best_name, best_cost = None, None
+        for name in upgrade_system.upgrades:
+            if upgrade_system.can_afford(name):
+                cost = sum(upgrade_system.get_upgrade_cost(name))
+                if best_cost is None or cost < best_cost:
+                    best_name, best_cost = name, cost
+        return best_name
+
+    def planned_upgrade(self, world) -> Optional[str]:
+        levels = tuple(upgrade.level for upgrade in world.upgrade_system.upgrades.values())
+        if levels != self._plan_levels or world.time - self._planned_at >= self.replan_every:
+            self._plan = self.planner.plan_for_world(world, self.plan_horizon)
+            self._plan_levels = levels
+            self._planned_at = world.time
+        name = self._plan.next_upgrade()
+        if name is not None and world.upgrade_system.can_afford(name):
+            return name
+        return None
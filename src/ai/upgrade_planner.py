@@ -0,0 +1,344 @@
+import math
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from game.constants import *
+from game.human import TYPE_PROBABILITIES
+from game.resource_manager import NUM_RESOURCES, RESOURCE_INDEX
+from game.upgrade_system import Upgrade, create_default_upgrades
+
+class ThroughputModel:
+    """Expected resource income per second for a given set of upgrade levels.
+
+    The alien is modelled as running trips: hop to the nearest human
+    `max_cargo` times, then travel to the base and back out. Hop length is
+    the mean nearest-neighbour distance of the human field minus the capture
+    reach (alien size + human size); income per trip is cargo split by the
+    human type probabilities plus the efficiency bonus in meat.
+
+    Pass fixed_speed (ALIEN_AUTO_MOVE_SPEED) to model click-to-move
+    play, which does not benefit from speed upgrades.
+    """
+
+    def __init__(self, upgrades: Dict[str, Upgrade] = None, num_humans: int = 20,
+                 base_pos: Tuple[float, float] = (50, 50), fixed_speed: Optional[float] = None):
+        self.upgrades = upgrades if upgrades is not None else create_default_upgrades()
+        self.names = tuple(self.upgrades)
+        self.fixed_speed = fixed_speed
+        self.type_probabilities = np.asarray(TYPE_PROBABILITIES)
+
+        # Humans spawn uniformly with a 100px margin
+        width, height = SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200
+        self.hop_distance = 0.5 * math.sqrt(width * height / max(1, num_humans))
+
+        # Mean distance from the base to a uniformly placed human, on a coarse grid
+        xs, ys = np.meshgrid(np.linspace(100, SCREEN_WIDTH - 100, 24),
+                             np.linspace(100, SCREEN_HEIGHT - 100, 16))
+        self.base_distance = float(np.hypot(xs - base_pos[0], ys - base_pos[1]).mean())
+
+        # Rates are memoized per levels tuple
+        self._rates: Dict[Tuple[int, ...], np.ndarray] = {}
+
+    def stats(self, levels: Sequence[int]) -> Dict[str, float]:
+        """Alien stats after applying the given upgrade levels"""
+        stats = {"speed": float(ALIEN_SPEED), "cargo": float(ALIEN_MAX_CARGO),
+                 "size": float(ALIEN_SIZE), "efficiency": 0.0}
+        for name, level in zip(self.names, levels):
+            upgrade = self.upgrades[name]
+            if upgrade.effect_type == "stat" and upgrade.effect_target in stats:
+                stats[upgrade.effect_target] += upgrade.effect_value * level
+        return stats
+
+    def rates(self, levels: Tuple[int, ...]) -> np.ndarray:
+        rates = self._rates.get(levels)
+        if rates is not None:
+            return rates
+
+        stats = self.stats(levels)
+        speed = self.fixed_speed if self.fixed_speed is not None else stats["speed"]
+        cargo = int(stats["cargo"])
+        reach = stats["size"] + HUMAN_SIZE
+        hop = max(self.hop_distance - reach, 0.2 * self.hop_distance)
+
+        trip_time = (cargo * hop + 2 * self.base_distance) / speed
+        per_trip = cargo * HUMAN_VALUE * self.type_probabilities
+        per_trip[RESOURCE_INDEX["meat"]] += stats["efficiency"]
+
+        rates = self._rates[levels] = per_trip / trip_time
+        return rates
+
+class UpgradePlan:
+    """Result of UpgradePlanner.plan: purchase schedule plus expected income curve"""
+
+    def __init__(self, purchases: List[Tuple[float, str]], income_curve: List[Tuple[float, np.ndarray]],
+                 start_resources: np.ndarray, costs: List[np.ndarray], horizon: float, score: float):
+        self.purchases = purchases        # (time, upgrade name), in order
+        self.income_curve = income_curve  # (start time, income per second) segments
+        self.start_resources = start_resources
+        self.costs = costs                # cost vector of each purchase
+        self.horizon = horizon
+        self.score = score
+
+    def next_upgrade(self) -> Optional[str]:
+        return self.purchases[0][1] if self.purchases else None
+
+    def resources_at(self, time: float) -> np.ndarray:
+        """Expected holdings at a time within the plan"""
+        resources = self.start_resources.astype(np.float64)
+        purchase = 0
+        for i, (start, rate) in enumerate(self.income_curve):
+            end = self.income_curve[i + 1][0] if i + 1 < len(self.income_curve) else math.inf
+            resources += rate * max(0.0, min(time, end) - start)
+            # A purchase starts each segment after the first
+            if end <= time and purchase < len(self.costs):
+                resources -= self.costs[purchase]
+                purchase += 1
+            if end > time:
+                break
+        return resources
+
+    def rate_at(self, time: float) -> np.ndarray:
+        current = self.income_curve[0][1]
+        for start, rate in self.income_curve:
+            if start > time:
+                break
+            current = rate
+        return current
+
+class UpgradePlanner:
+    """Searches upgrade purchase orders that maximize weighted holdings at a horizon.
+
+    Every upgrade is bought as soon as it becomes affordable at the modelled
+    income rate. The search expands one purchase per layer over all states at
+    once with NumPy. States reaching the same upgrade levels (encoded as a
+    mixed-radix code) earn at the same rate, so one dominates another when it
+    got there no later and, waiting until the other's arrival, holds at
+    least as much of every resource; only undominated states are kept.
+    Branches whose optimistic bound (see gain_bound) cannot beat the best
+    plan so far are cut. Income rates for every levels tuple are computed
+    once per planner.
+
+    The search is exact while each layer stays within max_width states.
+    Wider layers keep only the max_width states worth the most so far (a
+    beam), so long weighted plans stay fast enough to replan online; the
+    beam can miss the best plan, though rarely and by very little. Pass
+    max_width=None for the exact search.
+
+    The default model assumes keyboard play at the upgraded speed; pass
+    fixed_speed for click-to-move players such as GreedyAgent.
+    """
+
+    def __init__(self, upgrades: Dict[str, Upgrade] = None, model: ThroughputModel = None,
+                 weights: Sequence[float] = (1.0, 0.0, 0.0, 0.0), fixed_speed: Optional[float] = None,
+                 max_width: Optional[int] = 128):
+        self.upgrades = upgrades if upgrades is not None else create_default_upgrades()
+        self.model = model if model is not None else ThroughputModel(self.upgrades, fixed_speed=fixed_speed)
+        self.names = tuple(self.upgrades)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.max_width = max_width
+
+        # Mixed-radix encoding of levels tuples
+        self.max_levels = np.array([self.upgrades[name].max_level for name in self.names])
+        radix = self.max_levels + 1
+        self.strides = np.ones(len(self.names), dtype=np.int64)
+        for u in range(len(self.names) - 2, -1, -1):
+            self.strides[u] = self.strides[u + 1] * radix[u + 1]
+
+        # Income for every levels tuple, indexed by code
+        all_levels = np.array(list(np.ndindex(*radix)), dtype=np.int64)
+        self.rate_table = np.array([self.model.rates(tuple(levels)) for levels in all_levels.tolist()])
+        self.value_rates = self.rate_table @ self.weights
+
+        # Cost of buying the next level: (upgrade, current level, resource)
+        self.costs = np.zeros((len(self.names), int(self.max_levels.max()) + 1, NUM_RESOURCES))
+        for u, name in enumerate(self.names):
+            upgrade = self.upgrades[name]
+            for level in range(upgrade.max_level):
+                self.costs[u, level] = upgrade.cost_at(level)
+
+        # Everything still purchasable from each levels tuple costs this much in total:
+        # holdings beyond it can never be spent
+        remaining = self.costs[:, ::-1].cumsum(axis=1)[:, ::-1]  # (upgrade, from level, resource)
+        self.remaining_cost = remaining[np.arange(len(self.names)), all_levels].sum(axis=1)
+
+        # Weighted cost of reaching each levels tuple from level zero
+        spent = np.concatenate([np.zeros((len(self.names), 1, NUM_RESOURCES)),
+                                self.costs.cumsum(axis=1)], axis=1) @ self.weights
+        self.spent_value = spent[np.arange(len(self.names)), all_levels].sum(axis=1)
+        self.radix = tuple(radix.tolist())
+        self._gain_table = (None, None)  # (horizon, table) of the last gain_bound
+
+    def encode(self, levels: Sequence[int]) -> int:
+        return int(np.dot(levels, self.strides))
+
+    def plan(self, horizon: float, levels: Sequence[int] = None, resources=None) -> UpgradePlan:
+        """Best purchase schedule over the next `horizon` seconds"""
+        levels = tuple(levels) if levels is not None else (0,) * len(self.names)
+        resources = (np.zeros(NUM_RESOURCES) if resources is None
+                     else np.asarray(resources, dtype=np.float64))
+        weights = self.weights
+
+        # Current layer of states as parallel arrays
+        codes = np.array([self.encode(levels)])
+        state_levels = np.array([levels], dtype=np.int64)
+        times = np.zeros(1)
+        holdings = resources[None, :].copy()
+
+        gain = self.gain_bound(horizon)
+        best_score = float(resources @ weights + self.value_rates[codes[0]] * horizon)
+        best = (-1, 0)  # (layer, index); layer -1 is the start state
+        history = []    # per layer: (parent index, upgrade bought, purchase time)
+        rows = np.zeros(1, dtype=np.int64)  # Index of each live state in its history layer
+
+        num_upgrades = len(self.names)
+        while len(codes):
+            # Every state buys every upgrade it hasn't maxed out, as soon as it can afford it
+            parent = np.repeat(np.arange(len(codes)), num_upgrades)
+            bought = np.tile(np.arange(num_upgrades), len(codes))
+            level = state_levels[parent, bought]
+            buyable = level < self.max_levels[bought]
+            parent, bought, level = parent[buyable], bought[buyable], level[buyable]
+
+            cost = self.costs[bought, level]
+            rate = self.rate_table[codes[parent]]
+            missing = cost - holdings[parent]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                waits = np.where(missing > 1e-9, missing / rate, 0.0)
+            waits[np.isnan(waits)] = np.inf
+            wait = waits.max(axis=1)
+
+            buy_time = times[parent] + wait
+            child_holdings = holdings[parent] + rate * wait[:, None] - cost
+            child_codes = codes[parent] + self.strides[bought]
+            bound = child_holdings @ weights + gain(child_codes, horizon - buy_time)
+            keep = (buy_time <= horizon) & (bound > best_score)
+            if not keep.any():
+                break
+
+            parent, bought, times = parent[keep], bought[keep], buy_time[keep]
+            holdings, codes = child_holdings[keep], child_codes[keep]
+            state_levels = state_levels[parent].copy()
+            state_levels[np.arange(len(parent)), bought] += 1
+
+            survivors = self.undominated(codes, times, holdings)
+
+            parent, bought, times = parent[survivors], bought[survivors], times[survivors]
+            holdings, state_levels, codes = holdings[survivors], state_levels[survivors], codes[survivors]
+            scores = holdings @ weights + self.value_rates[codes] * (horizon - times)
+            history.append((rows[parent], bought, times))
+
+            top = int(np.argmax(scores))
+            if scores[top] > best_score:
+                best_score, best = float(scores[top]), (len(history) - 1, top)
+
+            # Don't expand states that can no longer beat the best plan found so far
+            bound = holdings @ weights + gain(codes, horizon - times)
+            rows = np.flatnonzero(bound > best_score)
+            if self.max_width is not None and len(rows) > self.max_width:
+                # Beam: carry on with the states that are worth the most so far
+                top = np.argpartition(-scores[rows], self.max_width)[:self.max_width]
+                rows = np.sort(rows[top])
+            codes, times, holdings, state_levels = codes[rows], times[rows], holdings[rows], state_levels[rows]
+
+        return self.build_plan(levels, resources, history, best, horizon, best_score)
+
+    def gain_bound(self, horizon: float, steps: int = 32):
+        """Upper bound on what states can still add to their value, as gain(codes, remaining).
+
+        Income never drops after a purchase, so a state that ends at levels L
+        gains at most value_rate(L) * remaining minus the weighted cost of
+        getting to L. The best such L at or above each levels tuple is found
+        for a grid of remaining times by a running maximum along each upgrade
+        axis. The gain is convex in the remaining time, so interpolating
+        between grid points overestimates it and the bound stays valid.
+        """
+        cached_horizon, table = self._gain_table
+        if cached_horizon != horizon or table.shape[1] != steps:
+            grid = np.linspace(0.0, horizon, steps)
+            best = self.value_rates[:, None] * grid[None, :] - self.spent_value[:, None]
+            best = best.reshape(self.radix + (steps,))
+            for axis in range(len(self.radix)):
+                best = np.flip(np.maximum.accumulate(np.flip(best, axis), axis=axis), axis)
+            table = best.reshape(-1, steps) + self.spent_value[:, None]
+            self._gain_table = (horizon, table)
+        spacing = horizon / (steps - 1) if horizon > 0 else 1.0
+
+        def gain(codes: np.ndarray, remaining: np.ndarray) -> np.ndarray:
+            position = np.clip(remaining / spacing, 0.0, steps - 1)
+            low = np.minimum(position.astype(np.int64), steps - 2)
+            frac = position - low
+            return table[codes, low] * (1.0 - frac) + table[codes, low + 1] * frac
+        return gain
+
+    def undominated(self, codes: np.ndarray, times: np.ndarray, holdings: np.ndarray) -> np.ndarray:
+        """Indices of the states not dominated by another state with the same levels.
+
+        States with the same levels earn at the same rate. A dominates B when
+        A arrived no later and, with A's holdings grown until B's arrival:
+          - A holds at least as much of every resource as B, counting only up
+            to what the remaining upgrades could still spend, so A can make
+            each of B's later purchases no later than B (income never drops
+            after a purchase), and
+          - A's holdings are worth at least B's under the planner's weights,
+            so A ends at least as well off.
+        Of identical states the first is kept.
+        """
+        order = np.lexsort((times, codes))
+        codes, times, holdings = codes[order], times[order], holdings[order]
+        count = len(codes)
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        sizes = np.diff(np.r_[starts, count])
+
+        # Every pair i < j of states with the same levels, all groups at once;
+        # rows are sorted by time, so i can dominate j, and j can dominate i only on a tie
+        group_size = np.repeat(sizes, sizes)
+        next_row = np.arange(count) + 1
+        after = np.repeat(starts, sizes) + group_size - next_row  # later rows in the same group
+        i = np.repeat(np.arange(count), after)
+        j = np.repeat(next_row - np.cumsum(after) + after, after) + np.arange(len(i))
+        tie = times[i] == times[j]
+        i, j = np.r_[i, j[tie]], np.r_[j, i[tie]]
+
+        # Worth of state i's holdings grown until state j's arrival, over state j's;
+        # checked first since it is cheap and rules out most pairs
+        worth = holdings @ self.weights
+        wait = times[j] - times[i]
+        value = worth[i] + wait * self.value_rates[codes[i]] - worth[j]
+        close = value >= -1e-9
+        i, j, wait, value = i[close], j[close], wait[close], value[close]
+
+        grown = holdings[i] + wait[:, None] * self.rate_table[codes[i]]
+        need = self.remaining_cost[codes[i]]
+        spendable = np.minimum(grown, need) - np.minimum(holdings[j], need)
+
+        covers = (spendable >= -1e-9).all(axis=1)
+        strict = (wait > 0) | (spendable > 1e-9).any(axis=1) | (value > 1e-9)
+        dominated = np.zeros(count, dtype=bool)
+        dominated[j[covers & (strict | (i < j))]] = True
+        return np.sort(order[~dominated])
+
+    def plan_for_world(self, world, horizon: float) -> UpgradePlan:
+        """Plan from a live world's current upgrade levels and holdings"""
+        upgrades = world.upgrade_system.upgrades
+        levels = tuple(upgrades[name].level if name in upgrades else 0 for name in self.names)
+        return self.plan(horizon, levels, world.resources.balances)
+
+    def build_plan(self, levels, resources, history, best, horizon: float, score: float) -> UpgradePlan:
+        # Walk parent pointers back from the best state
+        steps = []
+        layer, index = best
+        while layer >= 0:
+            parent, bought, times = history[layer]
+            steps.append((float(times[index]), int(bought[index])))
+            index = int(parent[index])
+            layer -= 1
+        steps.reverse()
+
+        purchases, costs = [], []
+        current = list(levels)
+        income_curve = [(0.0, self.rate_table[self.encode(current)])]
+        for time, u in steps:
+            costs.append(self.costs[u, current[u]])
+            current[u] += 1
+            purchases.append((time, self.names[u]))
+            income_curve.append((time, self.rate_table[self.encode(current)]))
+        return UpgradePlan(purchases, income_curve, resources, costs, horizon, score)
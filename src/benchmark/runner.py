@@ -0,0 +1,298 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from typing import Callable, Dict, List
+
+# Render off-screen; must be set before pygame opens a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game.constants import *
+from game.game_world import GameWorld
+from game.input_state import NO_INPUT
+from game.profiler import Profiler
+from ai.greedy_agent import GreedyAgent
+from ui.upgrade_menu import UpgradeMenu
+
+# Bump when the JSON layout changes so old result files are not compared blindly
+RESULTS_VERSION = 1
+
+class AllocationProfiler(Profiler):
+    """Profiler that also charges traced memory to phases (tracemalloc must be running).
+
+    For every phase it accumulates the peak bytes allocated above the level
+    the phase started at (how much short-lived garbage it produces) and the
+    net bytes it left allocated (growth).
+    """
+
+    def __init__(self):
+        super().__init__(capacity=1)
+        self.peak_bytes: Dict[str, int] = {}
+        self.net_bytes: Dict[str, int] = {}
+        self.memory_mark = 0
+
+    def _charge(self, name: str, now: float):
+        super()._charge(name, now)
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak_bytes[name] = self.peak_bytes.get(name, 0) + peak - self.memory_mark
+        self.net_bytes[name] = self.net_bytes.get(name, 0) + current - self.memory_mark
+
+    def _mark(self, now: float):
+        super()._mark(now)
+        tracemalloc.reset_peak()
+        self.memory_mark = tracemalloc.get_traced_memory()[0]
+
+    def reset(self):
+        super().reset()
+        self.peak_bytes.clear()
+        self.net_bytes.clear()
+
+class Scenario:
+    """A scripted benchmark run.
+
+    setup(world) prepares the world once; script(world, tick, rng) runs
+    before every tick and is not timed. With agent set, a GreedyAgent plays.
+    """
+
+    def __init__(self, name: str, description: str, num_humans: int = 20, agent: bool = True,
+                 menu: bool = False, setup: Callable = None, script: Callable = None):
+        self.name = name
+        self.description = description
+        self.num_humans = num_humans
+        self.agent = agent
+        self.menu = menu
+        self.setup = setup
+        self.script = script
+
+def emit_bursts(world, tick: int, rng: np.random.Generator):
+    # A few collection bursts every tick keeps hundreds of particles alive
+    for x, y in rng.uniform((0, 0), (SCREEN_WIDTH, SCREEN_HEIGHT), size=(4, 2)):
+        world.particles.create_collection_burst(x, y, RED)
+
+def shop_activity(world, tick: int, rng: np.random.Generator):
+    # Income changes affordability; a purchase now and then rebuilds a card
+    world.resources.add_meat(1)
+    if tick % 120 == 119:
+        names = list(world.upgrade_system.upgrades)
+        world.purchase_upgrade(names[(tick // 120) % len(names)])
+
+def max_upgrades(world):
+    upgrade_system = world.upgrade_system
+    for name, upgrade in upgrade_system.upgrades.items():
+        while upgrade.level < upgrade.max_level:
+            world.resources.grant(upgrade_system.get_upgrade_cost(name))
+            world.purchase_upgrade(name)
+
+def idle_income(world):
+    world.resources.meat_per_second = 0.7
+    world.resources.eggs_per_second = 0.2
+
+def default_scenarios(num_humans: int = 2000) -> List[Scenario]:
+    return [
+        Scenario("baseline", "Default world, greedy agent"),
+        Scenario("crowd", f"{num_humans} humans, greedy agent", num_humans=num_humans),
+        Scenario("particles", "Sustained particle bursts", script=emit_bursts),
+        Scenario("upgrade_menu", "Upgrade menu open with changing balances",
+                 menu=True, script=shop_activity),
+        Scenario("maxed_upgrades", "Every upgrade at max level", setup=max_upgrades),
+        Scenario("long_idle", "No input, idle income only", agent=False, setup=idle_income),
+    ]
+
+def run_ticks(scenario: Scenario, screen: pygame.Surface, ticks: int, seed: int,
+              profiler: Profiler, warmup: int = 0) -> Dict[str, float]:
+    """Play a scenario, timing update and render separately; returns totals in seconds"""
+    world = GameWorld(seed=seed, num_humans=scenario.num_humans)
+    if scenario.setup:
+        scenario.setup(world)
+    menu = None
+    if scenario.menu:
+        menu = UpgradeMenu(world)
+        menu.visible = True
+    agent = GreedyAgent() if scenario.agent else None
+    rng = np.random.default_rng(seed)
+
+    update_time = render_time = 0.0
+    clock = time.perf_counter
+    for tick in range(warmup + ticks):
+        if tick == warmup:
+            # Drop whatever the warmup ticks charged to the outer phases
+            profiler.reset()
+            world.set_profiler(profiler)
+            update_time = render_time = 0.0
+
+        controls = agent.act(world) if agent else NO_INPUT
+        if scenario.script:
+            scenario.script(world, tick, rng)
+
+        start = clock()
+        profiler.push("update")
+        world.update(FIXED_DT, controls=controls)
+        middle = clock()
+
+        profiler.switch("render")
+        screen.fill(BLACK)
+        world.render(screen)
+        if menu:
+            profiler.push("render.menu")
+            menu.render(screen)
+            profiler.pop()
+        pygame.display.flip()
+        profiler.pop()
+        end = clock()
+
+        if tick >= warmup:
+            profiler.end_frame()
+            update_time += middle - start
+            render_time += end - middle
+
+    if menu:
+        menu.detach()
+    return {"update": update_time, "render": render_time, "humans": world.humans.count}
+
+def benchmark_scenario(scenario: Scenario, screen: pygame.Surface, ticks: int, seed: int,
+                       warmup: int = 120, alloc_ticks: int = 300) -> Dict:
+    """Timing pass, then (unless alloc_ticks is 0) a shorter pass under tracemalloc"""
+    profiler = Profiler(capacity=ticks)
+    totals = run_ticks(scenario, screen, ticks, seed, profiler, warmup)
+
+    # Per-tick cost of update and render is the sum of their phases
+    def distribution(prefix: str) -> Dict[str, float]:
+        samples = sum(profiler.history(name) for name in profiler.phases if name.startswith(prefix))
+        percentiles = np.percentile(samples, (50, 95, 99))
+        return {"mean": float(samples.mean()), "p50": float(percentiles[0]),
+                "p95": float(percentiles[1]), "p99": float(percentiles[2])}
+
+    result = {
+        "description": scenario.description,
+        "ticks": ticks,
+        "humans": totals["humans"],
+        "ticks_per_sec": ticks / totals["update"],
+        "update_ms_per_tick": distribution("update"),
+        "render_ms_per_frame": distribution("render"),
+        "phases_ms": {name: {"mean": mean, "p50": p50, "p95": p95, "p99": p99, "max": peak}
+                      for name, mean, p50, p95, p99, peak in profiler.summary() if name != "frame"},
+    }
+
+    if alloc_ticks:
+        allocations = AllocationProfiler()
+        tracemalloc.start()
+        try:
+            run_ticks(scenario, screen, alloc_ticks, seed, allocations, warmup)
+        finally:
+            tracemalloc.stop()
+        result["alloc_bytes_per_tick"] = {
+            name: {"peak": allocations.peak_bytes[name] / alloc_ticks,
+                   "net": allocations.net_bytes[name] / alloc_ticks}
+            for name in allocations.peak_bytes
+        }
+    return result
+
+def run_suite(scenarios: List[Scenario], ticks: int, seed: int, alloc_ticks: int,
+              warmup: int = 120) -> Dict:
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = {
+        "version": RESULTS_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "video_driver": pygame.display.get_driver(),
+        },
+        "settings": {"ticks": ticks, "seed": seed, "alloc_ticks": alloc_ticks, "warmup": warmup},
+        "scenarios": {},
+    }
+    try:
+        for scenario in scenarios:
+            results["scenarios"][scenario.name] = benchmark_scenario(
+                scenario, screen, ticks, seed, warmup, alloc_ticks)
+    finally:
+        pygame.quit()
+    return results
+
+def print_results(results: Dict):
+    print(f"{'scenario':16s} {'ticks/s':>9s} {'render p50':>11s} {'p95':>7s} {'p99':>7s}  top allocator")
+    for name, result in results["scenarios"].items():
+        render = result["render_ms_per_frame"]
+        allocations = result.get("alloc_bytes_per_tick")
+        top = ""
+        if allocations:
+            phase = max(allocations, key=lambda p: allocations[p]["peak"])
+            top = f"{phase} {allocations[phase]['peak'] / 1024:.1f} KiB/tick"
+        print(f"{name:16s} {result['ticks_per_sec']:9.0f} {render['p50']:9.3f}ms "
+              f"{render['p95']:7.3f} {render['p99']:7.3f}  {top}")
+
+def compare_results(old: Dict, new: Dict, tolerance: float = 0.20) -> List[str]:
+    """Print changes per scenario; returns the ones whose median update or render time
+    grew beyond tolerance (medians are far less noisy than means or tails)"""
+    if old.get("version") != new.get("version"):
+        return [f"results version {old.get('version')} != {new.get('version')}; not comparable"]
+    regressions = []
+    for name, result in new["scenarios"].items():
+        before = old["scenarios"].get(name)
+        if before is None:
+            continue
+        changes = {}
+        for metric in ("update_ms_per_tick", "render_ms_per_frame"):
+            for stat in ("p50", "p95"):
+                changes[metric, stat] = result[metric][stat] / max(before[metric][stat], 1e-9) - 1.0
+        ticks_change = result["ticks_per_sec"] / before["ticks_per_sec"] - 1.0
+        print(f"{name:16s} ticks/s {ticks_change:+7.1%}  "
+              f"update p50 {changes['update_ms_per_tick', 'p50']:+7.1%} "
+              f"p95 {changes['update_ms_per_tick', 'p95']:+7.1%}  "
+              f"render p50 {changes['render_ms_per_frame', 'p50']:+7.1%} "
+              f"p95 {changes['render_ms_per_frame', 'p95']:+7.1%}")
+        for metric in ("update_ms_per_tick", "render_ms_per_frame"):
+            if changes[metric, "p50"] > tolerance:
+                regressions.append(f"{name}: {metric} p50 {changes[metric, 'p50']:+.1%}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless benchmark scenarios")
+    parser.add_argument("--scenarios", default=None,
+                        help="comma-separated scenario names (default: all)")
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--humans", type=int, default=2000, help="population of the crowd scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--alloc-ticks", type=int, default=300,
+                        help="ticks traced for allocations (0 to skip)")
+    parser.add_argument("--json", default=None, help="write results to this file")
+    parser.add_argument("--compare", default=None, help="earlier results file to compare against")
+    # Medians still move 10-15% run to run on a busy machine
+    parser.add_argument("--tolerance", type=float, default=0.20,
+                        help="relative slowdown of a median that counts as a regression")
+    args = parser.parse_args()
+
+    scenarios = default_scenarios(args.humans)
+    if args.scenarios:
+        wanted = args.scenarios.split(",")
+        unknown = set(wanted) - {scenario.name for scenario in scenarios}
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+        scenarios = [scenario for scenario in scenarios if scenario.name in wanted]
+
+    results = run_suite(scenarios, args.ticks, args.seed, args.alloc_ticks)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_results(json.load(f), results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
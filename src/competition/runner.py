@@ -0,0 +1,209 @@
+import argparse
+import multiprocessing as mp
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+# Fixed-layout state record published by every instance
+STATE_DTYPE = np.dtype([
+    ("version", np.uint32),      # Seqlock counter: odd while the record is being written
+    ("instance", np.int32),
+    ("tick", np.int64),
+    ("alien_x", np.float32),
+    ("alien_y", np.float32),
+    ("cargo", np.int32),
+    ("max_cargo", np.int32),
+    ("resources", np.int64, 4),  # meat, eggs, dna, cells
+    ("levels", np.int32, 4),     # speed, cargo, size, efficiency
+    ("score", np.float64),
+    ("finished", np.uint8),
+])
+
+def _state_array(shm: shared_memory.SharedMemory, num_instances: int) -> np.ndarray:
+    return np.ndarray((num_instances,), dtype=STATE_DTYPE, buffer=shm.buf)
+
+def _publish(record, world, tick: int, score: float, finished: bool = False):
+    """Write one instance's state under the seqlock so readers never see a torn record"""
+    alien = world.alien
+    resources = world.resources
+    record["version"] += 1
+    record["tick"] = tick
+    record["alien_x"] = alien.x
+    record["alien_y"] = alien.y
+    record["cargo"] = alien.cargo
+    record["max_cargo"] = alien.max_cargo
+    record["resources"] = resources.balances
+    record["levels"] = [u.level for u in world.upgrade_system.upgrades.values()]
+    record["score"] = score
+    record["finished"] = finished
+    record["version"] += 1
+
+def score_world(world) -> float:
+    """Total resources earned: current holdings plus everything spent on upgrades"""
+    resources = world.resources
+    score = int(resources.balances.sum())
+    for upgrade in world.upgrade_system.upgrades.values():
+        paid_levels = upgrade.level * (upgrade.level + 1) // 2
+        score += paid_levels * (upgrade.cost_meat + upgrade.cost_eggs
+                                + upgrade.cost_dna + upgrade.cost_cells)
+    return float(score)
+
+def run_instance(shm_name: str, num_instances: int, index: int, seed: Optional[int],
+                 ticks: int, publish_every: int = 10) -> float:
+    """Worker entry point: run one headless game and publish its state"""
+    from game.constants import FIXED_DT
+    from game.game_world import GameWorld
+    from ai.greedy_agent import GreedyAgent
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        states = _state_array(shm, num_instances)
+        record = states[index]
+        world = GameWorld(headless=True, seed=seed)
+        agent = GreedyAgent()
+
+        for tick in range(1, ticks + 1):
+            world.update(FIXED_DT, controls=agent.act(world))
+            if tick % publish_every == 0:
+                _publish(record, world, tick, score_world(world))
+
+        score = score_world(world)
+        _publish(record, world, ticks, score, finished=True)
+        del states, record  # Release buffer views before closing
+        return score
+    finally:
+        shm.close()
+
+class CompetitionRunner:
+    """Runs K headless instances in a process pool with shared-memory state.
+
+    Each instance owns one STATE_DTYPE record in a single shared block, so the
+    coordinator (and any visualizer attached by name) reads every instance
+    without pickling or pipes.
+    """
+
+    def __init__(self, num_instances: int, ticks: int = 36000, seed: int = 0,
+                 processes: Optional[int] = None, publish_every: int = 10):
+        self.num_instances = num_instances
+        self.ticks = ticks
+        self.seed = seed
+        self.processes = processes
+        self.publish_every = publish_every
+
+        self.shm = shared_memory.SharedMemory(create=True, size=STATE_DTYPE.itemsize * num_instances)
+        self.states = _state_array(self.shm, num_instances)
+        self.states[:] = np.zeros(num_instances, dtype=STATE_DTYPE)
+        self.states["instance"] = np.arange(num_instances)
+
+        self.pool = None
+        self.results = None
+
+    @property
+    def name(self) -> str:
+        """Shared-memory block name, for attaching a visualizer"""
+        return self.shm.name
+
+    def start(self):
+        self.pool = mp.Pool(self.processes)
+        jobs = [(self.name, self.num_instances, i, self.seed + i, self.ticks, self.publish_every)
+                for i in range(self.num_instances)]
+        self.results = self.pool.starmap_async(run_instance, jobs)
+
+    def done(self) -> bool:
+        return self.results is not None and self.results.ready()
+
+    def wait(self, timeout: Optional[float] = None) -> List[float]:
+        scores = self.results.get(timeout)
+        self.pool.close()
+        self.pool.join()
+        self.pool = None
+        return scores
+
+    def snapshot(self) -> np.ndarray:
+        return read_consistent(self.states)
+
+    def leaderboard(self) -> np.ndarray:
+        snapshot = self.snapshot()
+        return snapshot[np.argsort(-snapshot["score"], kind="stable")]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        del self.states
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TornReadError(RuntimeError):
+    """A record was still being written after every re-read of read_consistent"""
+
+def _torn(snapshot: np.ndarray, states: np.ndarray) -> np.ndarray:
+    """Records copied mid-write (odd version) or rewritten since they were copied"""
+    return (snapshot["version"] % 2 == 1) | (snapshot["version"] != states["version"])
+
+def read_consistent(states: np.ndarray, retries: int = 100) -> np.ndarray:
+    """Copy all records, re-reading any caught mid-write by its instance.
+
+    Raises TornReadError if some record is still torn after `retries` re-reads.
+    """
+    snapshot = states.copy()
+    for _ in range(retries):
+        torn = _torn(snapshot, states)
+        if not torn.any():
+            return snapshot
+        time.sleep(0)  # Let a writer that was preempted mid-record finish
+        snapshot[torn] = states[torn]
+    torn = _torn(snapshot, states)
+    if torn.any():
+        raise TornReadError(f"instances {np.flatnonzero(torn).tolist()} still being written "
+                            f"after {retries} retries")
+    return snapshot
+
+class CompetitionView:
+    """Read-only attachment to a running competition (e.g. from a visualizer process)"""
+
+    def __init__(self, name: str, num_instances: int):
+        self.shm = shared_memory.SharedMemory(name=name)
+        self.states = _state_array(self.shm, num_instances)
+
+    def snapshot(self) -> np.ndarray:
+        return read_consistent(self.states)
+
+    def close(self):
+        del self.states
+        self.shm.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a headless multi-instance competition")
+    parser.add_argument("--instances", type=int, default=32)
+    parser.add_argument("--ticks", type=int, default=36000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    with CompetitionRunner(args.instances, args.ticks, args.seed, args.processes) as runner:
+        runner.start()
+        while not runner.done():
+            time.sleep(1.0)
+            try:
+                leader = runner.leaderboard()[0]
+            except TornReadError:
+                continue  # An instance kept rewriting its record; report next time
+            print(f"tick {leader['tick']}: leader #{leader['instance']} score {leader['score']:.0f}")
+        runner.wait()
+
+        print("Final standings:")
+        for rank, record in enumerate(runner.leaderboard(), 1):
+            print(f"{rank:3d}. instance {record['instance']:3d}  score {record['score']:8.0f}  "
+                  f"levels {record['levels'].tolist()}")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,19 @@ import pygame
 import math
 from typing import Tuple
 from .constants import *
+from .input_state import InputState
+from .sprite_cache import alien_sprites
+from ui.text_cache import text_cache
+
+# Evolution tiers by total upgrade levels: (levels needed, body color)
+EVOLUTION_TIERS = (
+    (0, PURPLE),           # Base alien
+    (1, (150, 0, 200)),    # Slightly evolved
+    (5, (200, 50, 150)),   # More evolved
+    (10, (255, 100, 100)), # Highly evolved
+    (15, (255, 200, 0)),   # Legendary
+)
+GLOW_STEP = 8  # Cargo glow intensity is quantized so sprites can be reused
 
 class Alien:
     def __init__(self, x: float, y: float):
@@ -19,35 +32,56 @@ class Alien:
         self.vel_x = 0.0
         self.vel_y = 0.0
         
-        # Animation properties
-        self.animation_timer = 0.0
+        # Position at the start of the last tick, for render interpolation
+        self.prev_x = x
+        self.prev_y = y
+        
+        # Animation clock, kept as a tick count so one update covering many
+        # ticks lands on exactly the same time as that many single-tick updates
+        self.animation_ticks = 0
+        self.animation_dt = FIXED_DT
         self.base_size = self.size
         
+        # (total upgrade levels, tier, spikes), cached until an upgrade is bought
+        self._evolution = None
+        
         # Mouse control properties
         self.target_x = self.x
         self.target_y = self.y
         self.moving_to_target = False
-        self.auto_move_speed = 250  # Speed when moving to mouse click
+        self.auto_move_speed = ALIEN_AUTO_MOVE_SPEED  # Speed when moving to mouse click
+    
+    @property
+    def animation_timer(self) -> float:
+        return self.animation_ticks * self.animation_dt
     
-    def update(self, dt: float, keys_pressed, mouse_pos=None):
+    @animation_timer.setter
+    def animation_timer(self, value: float):
+        self.animation_ticks = round(value / self.animation_dt)
+    
+    def update(self, dt: float, controls: InputState, mouse_pos=None, ticks: int = 1):
+        """Advance one tick of dt, or `ticks` idle ticks at once (movement is not scaled)"""
         if not self.alive:
             return
+        
+        self.prev_x = self.x
+        self.prev_y = self.y
             
         self.vel_x = 0.0
         self.vel_y = 0.0
         
         # Check for keyboard input first (overrides mouse movement)
         keyboard_input = False
-        if keys_pressed[pygame.K_w] or keys_pressed[pygame.K_UP]:
+        if controls.up:
             self.vel_y = -1.0
             keyboard_input = True
-        if keys_pressed[pygame.K_s] or keys_pressed[pygame.K_DOWN]:
+        if controls.down:
             self.vel_y = 1.0
             keyboard_input = True
-        if keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]:
+        if controls.left:
             self.vel_x = -1.0
             keyboard_input = True
-        if keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]:
+        if controls.right:
             self.vel_x = 1.0
             keyboard_input = True
         
@@ -87,7 +121,8 @@ class Alien:
         self.y = max(self.size, min(SCREEN_HEIGHT - self.size, self.y))
         
         # Update animation
-        self.animation_timer += dt
+        self.animation_ticks += ticks
+        self.animation_dt = dt
         
         # Pulse effect when carrying cargo
         if self.cargo > 0:
@@ -119,73 +154,111 @@ class Alien:
         self.target_y = y
         self.moving_to_target = True
     
+    def invalidate_evolution(self, upgrade_name: str = None):
+        """Drop the cached evolution state (called when upgrade levels change)"""
+        self._evolution = None
+    
+    def get_evolution(self):
+        """(total upgrade levels, evolution tier, spike count), recomputed only after purchases"""
+        if self._evolution is None:
+            total_upgrades = 0
+            if hasattr(self, '_upgrade_system_ref'):
+                for upgrade in self._upgrade_system_ref.upgrades.values():
+                    total_upgrades += upgrade.level
+            
+            tier = 0
+            for index, (needed, _) in enumerate(EVOLUTION_TIERS):
+                if total_upgrades >= needed:
+                    tier = index
+            
+            # Evolution indicator spikes, shown from 5 upgrade levels
+            spikes = min(8, total_upgrades // 2) if total_upgrades >= 5 else 0
+            self._evolution = (total_upgrades, tier, spikes)
+        return self._evolution
+    
+    def get_total_upgrades(self) -> int:
+        return self.get_evolution()[0]
+    
+    def get_evolution_tier(self) -> int:
+        return self.get_evolution()[1]
+    
     def get_evolution_color(self):
         """Get alien color based on upgrade levels"""
-        total_upgrades = 0
-        if hasattr(self, '_upgrade_system_ref'):
-            for upgrade in self._upgrade_system_ref.upgrades.values():
-                total_upgrades += upgrade.level
-        
-        # Evolution colors based on total upgrade levels
-        if total_upgrades == 0:
-            return PURPLE  # Base alien
-        elif total_upgrades < 5:
-            return (150, 0, 200)  # Slightly evolved
-        elif total_upgrades < 10:
-            return (200, 50, 150)  # More evolved
-        elif total_upgrades < 15:
-            return (255, 100, 100)  # Highly evolved
-        else:
-            return (255, 200, 0)  # Legendary
+        return EVOLUTION_TIERS[self.get_evolution()[1]][1]
     
-    def render(self, screen: pygame.Surface):
-        if not self.alive:
-            return
-            
-        # Base color with evolution
-        color = self.get_evolution_color()
+    def get_render_pos(self, alpha: float = 1.0) -> Tuple[float, float]:
+        """Position blended between the last two simulation ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
+    def get_render_rect(self, alpha: float = 1.0) -> pygame.Rect:
+        """Screen area covered by the alien body and spikes"""
+        x, y = self.get_render_pos(alpha)
+        reach = self.sprite_reach(self.size)
+        return pygame.Rect(int(x) - reach, int(y) - reach, reach * 2 + 1, reach * 2 + 1)
+    
+    @staticmethod
+    def sprite_reach(size: int) -> int:
+        return size + size // 3 + 3
+    
+    def get_glow_level(self) -> int:
+        """Quantized cargo glow intensity (0 when empty)"""
+        if self.cargo <= 0:
+            return 0
+        glow_intensity = int(50 * (1.0 + math.sin(self.animation_timer * 6)))
+        return glow_intensity // GLOW_STEP * GLOW_STEP
+    
+    @staticmethod
+    def build_sprite(tier: int, spikes: int, size: int, glow: int, cargo: int) -> pygame.Surface:
+        """Draw the alien body, evolution spikes, cargo glow and cargo count"""
+        reach = Alien.sprite_reach(size)
+        sprite = pygame.Surface((reach * 2 + 1, reach * 2 + 1), pygame.SRCALPHA)
+        x = y = reach
         
-        # Cargo effect overlay
-        if self.cargo > 0:
-            # Pulsing glow when carrying cargo
-            glow_intensity = int(50 * (1.0 + math.sin(self.animation_timer * 6)))
+        # Base color with evolution, plus cargo glow overlay
+        color = EVOLUTION_TIERS[tier][1]
+        if cargo > 0:
             color = (
-                min(255, color[0] + glow_intensity),
-                min(255, color[1] + glow_intensity // 2),
-                min(255, color[2] + glow_intensity)
+                min(255, color[0] + glow),
+                min(255, color[1] + glow // 2),
+                min(255, color[2] + glow)
             )
         
-        # Draw alien with current size (includes pulse animation)
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
+        pygame.draw.circle(sprite, color, (x, y), size)
         
         # Draw evolution indicators (spikes for higher evolution)
-        total_upgrades = 0
-        if hasattr(self, '_upgrade_system_ref'):
-            for upgrade in self._upgrade_system_ref.upgrades.values():
-                total_upgrades += upgrade.level
-        
-        if total_upgrades >= 5:
-            # Draw spikes around the alien
-            num_spikes = min(8, total_upgrades // 2)
-            for i in range(num_spikes):
-                angle = (2 * math.pi * i) / num_spikes
-                spike_length = self.size // 3
-                start_x = self.x + math.cos(angle) * self.size
-                start_y = self.y + math.sin(angle) * self.size
-                end_x = self.x + math.cos(angle) * (self.size + spike_length)
-                end_y = self.y + math.sin(angle) * (self.size + spike_length)
-                pygame.draw.line(screen, color, (int(start_x), int(start_y)), (int(end_x), int(end_y)), 3)
+        for i in range(spikes):
+            angle = (2 * math.pi * i) / spikes
+            spike_length = size // 3
+            start_x = x + math.cos(angle) * size
+            start_y = y + math.sin(angle) * size
+            end_x = x + math.cos(angle) * (size + spike_length)
+            end_y = y + math.sin(angle) * (size + spike_length)
+            pygame.draw.line(sprite, color, (int(start_x), int(start_y)), (int(end_x), int(end_y)), 3)
         
         # Draw cargo count
-        if self.cargo > 0:
-            font = pygame.font.Font(None, 24)
-            text = font.render(str(self.cargo), True, WHITE)
-            text_rect = text.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(text, text_rect)
+        if cargo > 0:
+            text_cache.blit_number(sprite, cargo, (x, y), 24, WHITE, center=True)
+        return sprite
     
-    def render_target_indicator(self, screen: pygame.Surface):
+    def submit_sprite(self, queue, layer: int, alpha: float = 1.0):
+        """Queue the alien as one cached sprite"""
+        if not self.alive:
+            return
+        
+        x, y = self.get_render_pos(alpha)
+        _, tier, spikes = self.get_evolution()
+        key = (tier, spikes, self.size, self.get_glow_level(), self.cargo)
+        sprite = alien_sprites.get(key, lambda: self.build_sprite(*key))
+        
+        reach = self.sprite_reach(self.size)
+        queue.submit(sprite, (int(x) - reach, int(y) - reach), layer)
+    
+    def render_target_indicator(self, screen: pygame.Surface, alpha: float = 1.0):
         """Draw target indicator when moving to mouse click"""
         if self.moving_to_target:
+            x, y = self.get_render_pos(alpha)
+            
             # Draw target crosshair
             pygame.draw.circle(screen, (255, 255, 0), (int(self.target_x), int(self.target_y)), 8, 2)
             pygame.draw.line(screen, (255, 255, 0), 
@@ -196,6 +269,9 @@ class Alien:
                            (int(self.target_x), int(self.target_y + 12)), 2)
             
             # Draw line from alien to target
-            pygame.draw.line(screen, (255, 255, 0, 100),
-                           (int(self.x), int(self.y)),
-                           (int(self.target_x), int(self.target_y)), 1)
\ No newline at end of file
+            line_rect = pygame.draw.line(screen, (255, 255, 0, 100),
+                                         (int(x), int(y)),
+                                         (int(self.target_x), int(self.target_y)), 1)
+            crosshair_rect = pygame.Rect(int(self.target_x) - 13, int(self.target_y) - 13, 27, 27)
+            return line_rect.union(crosshair_rect)
+        return None
\ No newline at end of file
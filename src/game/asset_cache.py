@@ -0,0 +1,90 @@
+import ast
+import os
+import struct
+import pygame
+from collections import OrderedDict
+from typing import Dict
+
+# File layout: magic, index length, repr'd index, then raw RGBA pixels.
+# The index is read back with ast.literal_eval, so keys must be plain literals.
+ASSET_MAGIC = b"AIAS"
+ASSET_VERSION = 1
+HEADER = struct.Struct("<4sI")
+
+def _literal(key) -> bool:
+    try:
+        return ast.literal_eval(repr(key)) == key
+    except (ValueError, SyntaxError):
+        return False
+
+def save_assets(path: str, caches: Dict[str, OrderedDict]) -> int:
+    """Write pre-rendered surfaces of named LRU caches (least recent first); returns entries saved.
+
+    Only per-pixel alpha surfaces are kept: text and sprites, not opaque overlays.
+    """
+    entries, chunks = [], []
+    offset = 0
+    for name, surfaces in caches.items():
+        for key, surface in surfaces.items():
+            if not surface.get_flags() & pygame.SRCALPHA or not _literal(key):
+                continue
+            pixels = pygame.image.tostring(surface, "RGBA")
+            entries.append((name, key, surface.get_width(), surface.get_height(), offset, len(pixels)))
+            chunks.append(pixels)
+            offset += len(pixels)
+
+    index = repr({"version": ASSET_VERSION, "pygame": pygame.version.ver, "entries": entries}).encode()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(ASSET_MAGIC, len(index)))
+        f.write(index)
+        for pixels in chunks:
+            f.write(pixels)
+    os.replace(temp_path, path)
+    return len(entries)
+
+def load_assets(path: str, caches: Dict[str, OrderedDict]) -> int:
+    """Fill named caches from a file written by save_assets; returns entries loaded.
+
+    A missing, foreign, stale (other format or pygame version) or damaged
+    file loads nothing: the caches simply fill up as usual while the game
+    runs. Every entry is checked and built before any cache is touched.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, index_length = HEADER.unpack_from(data)
+        if magic != ASSET_MAGIC:
+            return 0
+        index = ast.literal_eval(data[HEADER.size:HEADER.size + index_length].decode())
+        if not isinstance(index, dict):
+            return 0
+        if index.get("version") != ASSET_VERSION or index.get("pygame") != pygame.version.ver:
+            return 0
+
+        base = HEADER.size + index_length
+        convert = pygame.display.get_surface() is not None
+        loaded = []
+        for name, key, width, height, offset, length in index["entries"]:
+            if length != width * height * 4 or offset < 0 or base + offset + length > len(data):
+                return 0
+            if name not in caches:
+                continue
+            pixels = data[base + offset:base + offset + length]
+            surface = pygame.image.frombuffer(pixels, (width, height), "RGBA")
+            # Converting copies into the display's pixel format (fast blits, no shared buffer)
+            loaded.append((name, key, surface.convert_alpha() if convert else surface.copy()))
+    except (OSError, struct.error, ValueError, SyntaxError, UnicodeDecodeError,
+            KeyError, TypeError, MemoryError, RecursionError, pygame.error):
+        return 0
+
+    count = 0
+    for name, key, surface in loaded:
+        surfaces = caches[name]
+        if key not in surfaces:
+            surfaces[key] = surface
+            count += 1
+    return count
@@ -2,13 +2,21 @@ SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# Fixed simulation timestep (rendering runs independently and interpolates)
+FIXED_DT = 1.0 / FPS
+MAX_FRAME_TIME = 0.25  # Clamp long frames to avoid a spiral of catch-up updates
+
 ALIEN_SIZE = 20
 ALIEN_SPEED = 200
+ALIEN_AUTO_MOVE_SPEED = 250  # Click-to-move speed (not affected by speed upgrades)
 ALIEN_MAX_CARGO = 5
 
 HUMAN_SIZE = 10
 HUMAN_VALUE = 1
 
+# Spatial hash cell size for collision broadphase (~ alien + human diameter)
+SPATIAL_CELL_SIZE = 64
+
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
@@ -0,0 +1,75 @@
+import pygame
+from typing import Callable, List
+from .constants import *
+
+class DirtyRectRenderer:
+    """Incremental renderer that presents only the screen areas that changed.
+
+    The static layer (base and living humans) is drawn once into a cached
+    background surface and patched locally when humans die or respawn. Each
+    frame the areas covered by last frame's dynamic layer are restored from
+    the background, the dynamic layer is drawn on top, and only the union of
+    old and new areas is pushed to the display with pygame.display.update.
+    """
+
+    def __init__(self):
+        self.background = None
+        self.world = None
+        self.previous_rects: List[pygame.Rect] = []
+        self.valid = False
+
+    def invalidate(self):
+        """Force a full background rebuild and full-screen present next frame"""
+        self.valid = False
+
+    def rebuild_background(self, screen: pygame.Surface, world):
+        if self.background is None or self.background.get_size() != screen.get_size():
+            self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill(BLACK)
+        world.render_static(self.background)
+
+        world.humans.enable_change_log()
+        world.humans.drain_changes()
+        self.world = world
+        self.valid = True
+
+    def patch_background(self, world) -> List[pygame.Rect]:
+        """Redraw the background around humans that died or respawned"""
+        rects = []
+        for index in set(world.humans.drain_changes()):
+            human = world.humans[index]
+            size = human.size + 1
+            rect = pygame.Rect(int(human.x) - size, int(human.y) - size, size * 2 + 1, size * 2 + 1)
+            self.background.fill(BLACK, rect)
+            world.render_static(self.background, rect)
+            rects.append(rect)
+        return rects
+
+    def render(self, screen: pygame.Surface, world, alpha: float = 1.0,
+               overlay: Callable = None) -> List[pygame.Rect]:
+        """Draw a frame and present it; returns the rects that were updated.
+        
+        overlay(screen) may draw on top of the frame and return the rects it touched.
+        """
+        if not self.valid or world is not self.world:
+            self.rebuild_background(screen, world)
+            screen.blit(self.background, (0, 0))
+            self.previous_rects = world.render_dynamic(screen, alpha)
+            if overlay:
+                self.previous_rects += overlay(screen)
+            pygame.display.flip()
+            return [screen.get_rect()]
+
+        # Erase last frame's dynamic layer and anything changed in the static layer
+        restore = self.previous_rects + self.patch_background(world)
+        for rect in restore:
+            screen.blit(self.background, rect, rect)
+
+        drawn = world.render_dynamic(screen, alpha)
+        if overlay:
+            drawn += overlay(screen)
+        self.previous_rects = drawn
+
+        rects = restore + drawn
+        pygame.display.update(rects)
+        return rects
@@ -0,0 +1,48 @@
+import heapq
+import itertools
+from typing import Callable, Optional
+
+class EventScheduler:
+    """Priority queue of timed callbacks on a simulation clock.
+
+    Only events whose deadline has passed are touched when time advances, so
+    per-tick cost depends on how many things actually happen rather than on
+    how many things are waiting. Events with equal deadlines run in the
+    order they were scheduled.
+    """
+
+    def __init__(self, time: float = 0.0):
+        self.time = time
+        self._queue = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def schedule(self, delay: float, callback: Callable, *args):
+        self.schedule_at(self.time + delay, callback, *args)
+
+    def schedule_at(self, when: float, callback: Callable, *args):
+        heapq.heappush(self._queue, (when, next(self._counter), callback, args))
+
+    def next_event_time(self) -> Optional[float]:
+        return self._queue[0][0] if self._queue else None
+
+    def advance(self, dt: float) -> int:
+        return self.advance_to(self.time + dt)
+
+    def advance_to(self, when: float) -> int:
+        """Run every event due by `when` and move the clock there; returns the count run"""
+        processed = 0
+        queue = self._queue
+        while queue and queue[0][0] <= when:
+            event_time, _, callback, args = heapq.heappop(queue)
+            # Callbacks observe the clock at their own deadline
+            self.time = max(self.time, event_time)
+            callback(*args)
+            processed += 1
+        self.time = max(self.time, when)
+        return processed
+
+    def clear(self):
+        self._queue.clear()
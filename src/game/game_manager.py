@@ -1,14 +1,26 @@
 import pygame
-import sys
 import os
 from typing import Dict, Any
 from enum import Enum
 from .constants import *
-
-# Add ui module to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from .asset_cache import load_assets, save_assets
+from .dirty_renderer import DirtyRectRenderer
+from .profiler import Profiler
+from .sprite_cache import alien_sprites, circle_sprites
 from ui.menu import MainMenu, PauseMenu
-from ui.upgrade_menu import UpgradeMenu
+from ui.text_cache import text_cache
+from ui.profiler_overlay import ProfilerOverlay
+
+# World, save and replay modules are imported when the world is built, not at startup
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+QUICKSAVE_PATH = os.path.join(DATA_DIR, 'quicksave.sav')
+PROFILE_PATH = os.path.join(DATA_DIR, 'profile.csv')
+ASSET_CACHE_PATH = os.path.join(DATA_DIR, 'asset_cache.bin')
+
+def asset_caches() -> Dict[str, Any]:
+    """Caches of pre-rendered surfaces kept across runs"""
+    return {"text": text_cache.surfaces, "circles": circle_sprites.sprites, "aliens": alien_sprites.sprites}
 
 class GameState(Enum):
     MENU = "menu"
@@ -17,7 +29,8 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, seed: int = None, dirty_rects: bool = False, record_path: str = None,
+                 asset_cache_path: str = ASSET_CACHE_PATH):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("AI Invasion RPG")
         self.clock = pygame.time.Clock()
@@ -27,14 +40,38 @@ class GameManager:
         
         self.running = True
         self.state = GameState.MENU
-        self.dt = 0.0
+        self.dt = FIXED_DT
+        self.seed = seed
         
-        from .game_world import GameWorld
+        # Unsimulated time carried between frames by the fixed-timestep loop
+        self.accumulator = 0.0
+        
+        # Optional incremental renderer for gameplay frames (see DirtyRectRenderer)
+        self.dirty_renderer = DirtyRectRenderer() if dirty_rects else None
+        
+        # Per-phase frame timings; F3 toggles the overlay, F4 exports them to CSV
+        self.profiler = Profiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        
+        # Text and sprites rendered by earlier runs (written back on exit)
+        self.asset_cache_path = asset_cache_path
+        if asset_cache_path:
+            load_assets(asset_cache_path, asset_caches())
         
-        self.world = GameWorld()
+        # Replay recording of the current world. Restarts and quick loads start
+        # a new segment in its own file (see segment_path)
+        self.record_path = record_path
+        self.recorder = None
+        self.recorder_path = None
+        self.record_segments = 0
+        
+        # Only the main menu is needed for the first frame. The world and the
+        # in-game menus are built by create_world, behind the menu once it is
+        # on screen or when the game is started, whichever comes first.
+        self.world = None
+        self.pause_menu = None
+        self.upgrade_menu = None
         self.main_menu = MainMenu(self)
-        self.pause_menu = PauseMenu(self)
-        self.upgrade_menu = UpgradeMenu(self.world)
     
     def handle_events(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -69,67 +106,159 @@ class GameManager:
                     self.upgrade_menu.visible = not self.upgrade_menu.visible
                 elif event.key == pygame.K_q and self.state == GameState.PLAYING:
                     # Claim completed quests
-                    completed_quests = self.world.quest_system.get_completed_quests()
-                    for i in range(len(completed_quests)):
-                        self.world.quest_system.claim_quest_reward(0)  # Always claim first completed quest
+                    self.world.claim_completed_quests()
                 elif event.key == pygame.K_r and self.state == GameState.GAME_OVER:
                     self.restart_game()
+                elif event.key == pygame.K_F5 and self.state == GameState.PLAYING:
+                    self.quick_save()
+                elif event.key == pygame.K_F9 and self.state == GameState.PLAYING:
+                    self.quick_load()
+                elif event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
+                elif event.key == pygame.K_F4:
+                    self.profiler.export_csv(PROFILE_PATH)
     
     def update(self):
         if self.state == GameState.PLAYING:
             mouse_pos = pygame.mouse.get_pos()
             self.world.update(self.dt, mouse_pos)
     
-    def render(self):
+    def render(self, alpha: float = 1.0):
+        if self.dirty_renderer:
+            if self.state == GameState.PLAYING and not self.upgrade_menu.visible:
+                self.dirty_renderer.render(self.screen, self.world, alpha, self.render_overlay)
+                return
+            # Menus and overlays cover the screen; rebuild once gameplay resumes
+            self.dirty_renderer.invalidate()
+        
         self.screen.fill(BLACK)
         
         if self.state == GameState.MENU:
             self.main_menu.render(self.screen)
         elif self.state == GameState.PLAYING:
-            self.world.render(self.screen)
+            self.world.render(self.screen, alpha)
             if self.upgrade_menu.visible:
                 self.upgrade_menu.render(self.screen)
         elif self.state == GameState.PAUSED:
-            self.world.render(self.screen)
+            self.world.render(self.screen, alpha)
             self.pause_menu.render(self.screen)
         elif self.state == GameState.GAME_OVER:
             self.render_game_over()
         
+        self.render_overlay(self.screen)
+        self.profiler.push("render.present")
         pygame.display.flip()
+        self.profiler.pop()
+    
+    def render_overlay(self, screen: pygame.Surface):
+        self.profiler.push("render.profiler")
+        rects = self.profiler_overlay.render(screen)
+        self.profiler.pop()
+        return rects
     
     def render_pause_overlay(self):
-        font = pygame.font.Font(None, 72)
-        text = font.render("PAUSED", True, WHITE)
+        text = text_cache.render("PAUSED", 72, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.screen.blit(text, text_rect)
         
-        font_small = pygame.font.Font(None, 36)
-        text_small = font_small.render("Press ESC to continue", True, WHITE)
+        text_small = text_cache.render("Press ESC to continue", 36, WHITE)
         text_small_rect = text_small.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         self.screen.blit(text_small, text_small_rect)
     
     def render_game_over(self):
-        font = pygame.font.Font(None, 72)
-        text = font.render("GAME OVER", True, RED)
+        text = text_cache.render("GAME OVER", 72, RED)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.screen.blit(text, text_rect)
         
-        font_small = pygame.font.Font(None, 36)
-        text_small = font_small.render("Press R to restart", True, WHITE)
+        text_small = text_cache.render("Press R to restart", 36, WHITE)
         text_small_rect = text_small.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         self.screen.blit(text_small, text_small_rect)
     
+    def create_world(self):
+        """Build the world and the in-game menus"""
+        from .game_world import GameWorld
+        self.pause_menu = PauseMenu(self)
+        self.attach_world(GameWorld(seed=self.seed))
+    
+    def start_game(self):
+        if self.world is None:
+            self.create_world()
+        self.state = GameState.PLAYING
+    
     def restart_game(self):
         from .game_world import GameWorld
-        self.world = GameWorld()
+        self.set_world(GameWorld(seed=self.seed))
+    
+    def attach_world(self, world):
+        """Make world the current one, with its own upgrade menu and recording"""
+        from ui.upgrade_menu import UpgradeMenu
+        if self.recorder:
+            self.recorder.save(self.recorder_path)
+            self.recorder.detach()
+        if self.upgrade_menu:
+            self.upgrade_menu.detach()
+        
+        self.world = world
+        self.world.set_profiler(self.profiler)
+        self.upgrade_menu = UpgradeMenu(self.world)
+        if self.record_path:
+            from .replay import ReplayRecorder
+            self.recorder = ReplayRecorder(self.world)
+            self.recorder_path = self.segment_path(self.record_segments)
+            self.record_segments += 1
+        
+        self.accumulator = 0.0
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
+    
+    def segment_path(self, segment: int) -> str:
+        """File of a recording segment: record_path, then e.g. session.1.rpl, session.2.rpl"""
+        if segment == 0:
+            return self.record_path
+        root, ext = os.path.splitext(self.record_path)
+        return f"{root}.{segment}{ext}"
+    
+    def set_world(self, world):
+        self.attach_world(world)
         self.state = GameState.PLAYING
     
+    def quick_save(self):
+        from .save_system import save_world
+        os.makedirs(os.path.dirname(QUICKSAVE_PATH), exist_ok=True)
+        save_world(self.world, QUICKSAVE_PATH)
+    
+    def quick_load(self):
+        from .save_system import load_world
+        if os.path.exists(QUICKSAVE_PATH):
+            # Idle income keeps accruing while the game is closed
+            self.set_world(load_world(QUICKSAVE_PATH, catch_up=True))
+    
     def run(self):
         while self.running:
-            self.dt = self.clock.tick(FPS) / 1000.0
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            self.accumulator += frame_time
             
+            self.profiler.push("events")
             self.handle_events()
-            self.update()
-            self.render()
+            
+            # Advance the simulation in fixed steps, independent of frame rate
+            self.profiler.switch("update")
+            while self.accumulator >= FIXED_DT:
+                self.update()
+                self.accumulator -= FIXED_DT
+            
+            # Interpolate between the last two ticks for smooth rendering
+            self.profiler.switch("render")
+            self.render(self.accumulator / FIXED_DT)
+            self.profiler.pop()
+            self.profiler.end_frame()
+            
+            # Build the game behind the main menu once its first frame is up
+            if self.world is None:
+                self.create_world()
         
+        if self.recorder:
+            self.recorder.save(self.recorder_path)
+        if self.asset_cache_path:
+            save_assets(self.asset_cache_path, asset_caches())
         return
\ No newline at end of file
@@ -1,113 +1,300 @@
 import pygame
-import random
-import sys
-import os
-from typing import List
+import math
+import numpy as np
 from .alien import Alien
-from .human import Human
-from .resource_manager import ResourceManager
+from .human_population import HumanPopulation
+from .resource_manager import ResourceManager, RESOURCE_INDEX, NUM_RESOURCES
 from .upgrade_system import UpgradeSystem
 from .particle_system import ParticleSystem
 from .quest_system import QuestSystem
+from .input_state import InputState, NO_INPUT
+from .rng import make_rng, make_np_rng
+from .event_scheduler import EventScheduler
+from .render_queue import RenderQueue, LAYER_HUMANS, LAYER_ALIEN, LAYER_EFFECTS
 from .constants import *
-
-# Add ui module to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from ui.hud import HUD
+from ui.text_cache import text_cache, get_font
 
 class GameWorld:
-    def __init__(self):
+    def __init__(self, headless: bool = False, seed: int = None, num_humans: int = 20):
+        # Headless worlds run the simulation only: no HUD fonts, particles or keyboard polling
+        self.headless = headless
+        
+        # Per-world RNG streams: same seed + same inputs = identical simulation
+        self.seed = seed
+        self.rng = make_np_rng(seed, "world")
+        
+        # Simulation clock and timed events (respawns, idle income payouts)
+        self.events = EventScheduler()
+        self.idle_payout_scheduled = False
+        self.next_idle_payout = None  # Deadline of the queued payout, if any
+        
         self.alien = Alien(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        self.humans: List[Human] = []
-        self.resources = ResourceManager()
+        self.humans = HumanPopulation(rng=make_np_rng(seed, "humans"), scheduler=self.events)
+        self.resources = ResourceManager(clock=lambda: self.events.time)
         
         self.base_x = 50
         self.base_y = 50
         self.base_size = 40
         
-        self.spawn_humans()
+        self.spawn_humans(num_humans)
         
         # Add frame counter for debugging
         self.frame_count = 0
         
-        # Initialize HUD
-        self.hud = HUD()
+        # Optional ReplayRecorder; attaches itself when constructed
+        self.recorder = None
+        
+        # Optional Profiler timing update and render phases (see set_profiler)
+        self.profiler = None
+        
+        # Presentation attachments (optional, see attach_presentation)
+        self.hud = None
+        self.particles = None
+        
+        # Sprites drawn this frame, batched per layer (see RenderQueue)
+        self.render_queue = RenderQueue()
         
         # Initialize upgrade system
         self.upgrade_system = UpgradeSystem(self.alien, self.resources)
         
-        # Initialize particle system
-        self.particles = ParticleSystem()
-        
-        # Initialize quest system
-        self.quest_system = QuestSystem(self.resources, self.upgrade_system)
-    
-    def spawn_humans(self):
-        num_humans = 20
-        for _ in range(num_humans):
-            while True:
-                x = random.randint(100, SCREEN_WIDTH - 100)
-                y = random.randint(100, SCREEN_HEIGHT - 100)
-                
-                distance_from_alien = ((x - self.alien.x) ** 2 + (y - self.alien.y) ** 2) ** 0.5
-                distance_from_base = ((x - self.base_x) ** 2 + (y - self.base_y) ** 2) ** 0.5
-                
-                if distance_from_alien > 100 and distance_from_base > 80:
-                    self.humans.append(Human(x, y))
-                    break
-    
-    def update(self, dt: float, mouse_pos=None):
+        # Initialize quest system; progress is driven by resource/upgrade change notifications
+        self.quest_system = QuestSystem(self.resources, self.upgrade_system,
+                                        rng=make_rng(seed, "quests"))
+        
+        if not headless:
+            self.attach_presentation()
+    
+    def set_profiler(self, profiler):
+        self.profiler = profiler
+        self.quest_system.profiler = profiler
+    
+    def attach_presentation(self):
+        """Attach the HUD and particle effects used when the world is drawn"""
+        if self.hud is None:
+            self.hud = HUD()
+        if self.particles is None:
+            self.particles = ParticleSystem(rng=make_np_rng(self.seed, "particles"))
+    
+    def spawn_humans(self, num_humans: int = 20):
+        """Place humans at random positions away from the alien and the base"""
+        placed = 0
+        while placed < num_humans:
+            # Sample candidates in bulk and keep the ones far enough from alien and base
+            batch = (num_humans - placed) * 2
+            xs = self.rng.integers(100, SCREEN_WIDTH - 100, size=batch, endpoint=True)
+            ys = self.rng.integers(100, SCREEN_HEIGHT - 100, size=batch, endpoint=True)
+            
+            distance_from_alien = np.hypot(xs - self.alien.x, ys - self.alien.y)
+            distance_from_base = np.hypot(xs - self.base_x, ys - self.base_y)
+            valid = (distance_from_alien > 100) & (distance_from_base > 80)
+            
+            take = min(num_humans - placed, int(np.count_nonzero(valid)))
+            self.humans.add_many(xs[valid][:take], ys[valid][:take])
+            placed += take
+    
+    def update(self, dt: float, mouse_pos=None, controls: InputState = None):
         self.frame_count += 1
-        keys_pressed = pygame.key.get_pressed()
         
-        self.alien.update(dt, keys_pressed, mouse_pos)
+        # Poll the keyboard only when no explicit input was supplied
+        if controls is None:
+            if self.headless:
+                controls = NO_INPUT
+            else:
+                controls = InputState.from_keys(pygame.key.get_pressed())
+        if self.recorder:
+            self.recorder.begin_tick(controls)
+        
+        profiler = self.profiler
+        if profiler:
+            profiler.push("update.alien")
+        self.apply_input(controls)
+        
+        self.alien.update(dt, controls, mouse_pos)
         
-        for human in self.humans:
-            human.update(dt)
+        # Run due respawns and idle payouts; waiting humans cost nothing per tick
+        if profiler:
+            profiler.switch("update.humans")
+        self.schedule_idle_payout()
+        self.events.advance_to(self.tick_time(self.frame_count, dt))
         
+        if profiler:
+            profiler.switch("update.collisions")
         self.check_collisions()
+        if profiler:
+            profiler.switch("update.base")
         self.check_base_interaction()
         
-        self.resources.update(dt)
-        
         # Update HUD with delta time for animations
-        self.hud.update(self, dt)
+        if profiler:
+            profiler.switch("update.hud")
+        if self.hud:
+            self.hud.update(self, dt)
         
         # Update particle system
-        self.particles.update(dt)
+        if profiler:
+            profiler.switch("update.particles")
+        if self.particles:
+            self.particles.update(dt)
+        if profiler:
+            profiler.pop()
         
-        # Update quest system
-        self.quest_system.update()
+        if self.recorder:
+            self.recorder.end_tick()
+    
+    @property
+    def time(self) -> float:
+        return self.events.time
+    
+    @staticmethod
+    def tick_time(tick: int, dt: float = FIXED_DT) -> float:
+        """Clock time of a tick. Derived from the tick count rather than summed,
+        so stepping and fast-forwarding read the same clock on the same tick."""
+        return tick * dt
+    
+    def first_tick_at(self, when: float, dt: float = FIXED_DT) -> int:
+        """First tick whose clock time reaches `when` (when an event due then fires)"""
+        tick = math.ceil(when / dt)
+        while self.tick_time(tick, dt) < when:
+            tick += 1
+        while tick > 0 and self.tick_time(tick - 1, dt) >= when:
+            tick -= 1
+        return tick
+    
+    def schedule_idle_payout(self):
+        """Put the next idle income payout on the event queue once income exists"""
+        if not self.idle_payout_scheduled and self.resources.has_idle_income():
+            self.schedule_idle_payout_at(self.time + self.resources.time_until_next_payout())
+    
+    def schedule_idle_payout_at(self, when: float):
+        self.idle_payout_scheduled = True
+        self.next_idle_payout = when
+        self.events.schedule_at(when, self._on_idle_payout, when)
+    
+    def reschedule_idle_payout(self):
+        """Requeue the idle payout after the ledger's idle timer moved outside the event queue"""
+        self.idle_payout_scheduled = False
+        self.next_idle_payout = None
+        self.schedule_idle_payout()
+    
+    def _on_idle_payout(self, when: float):
+        if when != self.next_idle_payout:
+            return  # Superseded by reschedule_idle_payout
+        if self.profiler:
+            self.profiler.push("update.resources")
+        # Bring the idle timer exactly to the payout boundary
+        self.resources.advance(self.resources.time_until_next_payout())
+        self.idle_payout_scheduled = False
+        self.next_idle_payout = None
+        self.schedule_idle_payout()
+        if self.profiler:
+            self.profiler.pop()
+    
+    def advance_idle(self, max_seconds: float, dt: float = FIXED_DT) -> int:
+        """Headless fast-forward while the alien is idle.
+        
+        Jumps straight to the tick on which the next scheduled event fires
+        (capped at max_seconds) instead of stepping through empty ticks, and
+        returns the number of ticks advanced. The result is identical to
+        stepping with no input. Does nothing while the alien is moving to a
+        target; while its cargo pulse could reach a human, it advances a
+        single ordinary tick.
+        """
+        if self.alien.moving_to_target:
+            return 0
+        
+        alien = self.alien
+        if alien.cargo > 0 and len(self.humans.query_circle(alien.x, alien.y, int(alien.base_size * 1.2))):
+            # The pulse changes the alien's size every tick, so a collision can
+            # happen on any of them
+            self.update(dt, controls=NO_INPUT)
+            return 1
+        
+        self.schedule_idle_payout()
+        last_tick = self.frame_count + max(1, math.ceil(max_seconds / dt - 1e-9))
+        next_event = self.events.next_event_time()
+        if next_event is not None:
+            last_tick = min(last_tick, self.first_tick_at(next_event, dt))
+        # Stay on the fixed-tick grid so skipping matches stepping tick by tick
+        ticks = max(1, last_tick - self.frame_count)
+        
+        if self.recorder:
+            self.recorder.record_skip(max_seconds)
+        self.frame_count += ticks
+        self.alien.update(dt, NO_INPUT, ticks=ticks)
+        self.events.advance_to(self.tick_time(self.frame_count, dt))
+        
+        self.check_collisions()
+        self.check_base_interaction()
+        if self.recorder:
+            self.recorder.end_tick()
+        return ticks
+    
+    def apply_input(self, controls: InputState):
+        """Apply the discrete (non-movement) actions of a tick's input"""
+        if controls.target is not None:
+            self.set_alien_target(*controls.target)
+        if controls.purchase:
+            self.purchase_upgrade(controls.purchase)
+        if controls.claim_quests:
+            self.claim_completed_quests()
+    
+    def set_alien_target(self, x: float, y: float):
+        self.alien.set_target(x, y)
+        if self.recorder:
+            self.recorder.record_target(x, y)
+    
+    def purchase_upgrade(self, upgrade_name: str) -> bool:
+        success = self.upgrade_system.purchase_upgrade(upgrade_name)
+        if success and self.recorder:
+            self.recorder.record_purchase(upgrade_name)
+        if success and self.particles:
+            # Create particle effect at alien location
+            self.particles.create_upgrade_effect(self.alien.x, self.alien.y)
+        return success
+    
+    def claim_completed_quests(self) -> int:
+        """Claim every completed quest, returning how many were claimed"""
+        claimed = 0
+        # Snapshot: claiming moves quests out of the completed bucket
+        for quest in list(self.quest_system.get_completed_quests()):
+            if self.quest_system.claim_quest(quest):
+                claimed += 1
+        if claimed and self.recorder:
+            self.recorder.record_claim()
+        return claimed
     
     def handle_mouse_click(self, mouse_pos: tuple, button: int):
         """Handle mouse clicks for movement and interactions"""
         mouse_x, mouse_y = mouse_pos
         
         if button == 1:  # Left click - move to position
-            self.alien.set_target(mouse_x, mouse_y)
+            self.set_alien_target(mouse_x, mouse_y)
         elif button == 3:  # Right click - smart actions
             # Check if right-clicking near base and alien has cargo
             distance_to_base = ((mouse_x - self.base_x) ** 2 + (mouse_y - self.base_y) ** 2) ** 0.5
             
             if distance_to_base < 100 and self.alien.cargo > 0:
                 # Right-click near base with cargo = auto-move to base
-                self.alien.set_target(self.base_x, self.base_y)
+                self.set_alien_target(self.base_x, self.base_y)
             else:
                 # Regular right-click movement
-                self.alien.set_target(mouse_x, mouse_y)
+                self.set_alien_target(mouse_x, mouse_y)
     
     def check_collisions(self):
-        alien_rect = self.alien.get_rect()
-        
-        for human in self.humans:
-            if human.alive:
-                human_rect = human.get_rect()
-                if alien_rect.colliderect(human_rect):
-                    # Store human type in cargo - resources awarded at base
-                    if self.alien.consume_human(human.resource_type):
-                        # Create particle effect for collection
-                        self.particles.create_collection_burst(human.x, human.y, human.color)
-                        human.consume()  # Remove human from world
+        # Spatial hash broadphase + circle narrowphase against living humans only
+        hits = self.humans.query_circle(self.alien.x, self.alien.y, self.alien.size)
+        humans = self.humans
+        
+        for index in hits:
+            human = humans[index]
+            # Store human type in cargo - resources awarded at base
+            if not self.alien.consume_human(human.resource_type):
+                break  # Cargo full
+            # Create particle effect for collection
+            if self.particles:
+                self.particles.create_collection_burst(human.x, human.y, human.color)
+            human.consume()  # Remove human from world
     
     def check_base_interaction(self):
         distance_to_base = ((self.alien.x - self.base_x) ** 2 + (self.alien.y - self.base_y) ** 2) ** 0.5
@@ -117,55 +304,109 @@ class GameWorld:
             cargo_types = self.alien.return_to_base()
             
             # Create particle effect for base deposit
-            self.particles.create_base_deposit_effect(self.base_x, self.base_y, cargo_types)
+            if self.particles:
+                self.particles.create_base_deposit_effect(self.base_x, self.base_y, cargo_types)
             
-            # Award resources based on cargo types
+            # Award resources based on cargo types, plus efficiency bonus as extra meat
+            deposit = np.zeros(NUM_RESOURCES, dtype=np.int64)
             for resource_type in cargo_types:
-                if resource_type == "meat":
-                    self.resources.add_meat(1)
-                elif resource_type == "eggs":
-                    self.resources.add_eggs(1)
-                elif resource_type == "dna":
-                    self.resources.add_dna(1)
-                elif resource_type == "cells":
-                    self.resources.add_cells(1)
-            
-            # Apply efficiency bonus as extra meat
+                deposit[RESOURCE_INDEX[resource_type]] += 1
             efficiency_bonus = getattr(self.alien, 'efficiency_bonus', 0)
             if efficiency_bonus > 0:
-                self.resources.add_meat(efficiency_bonus)
+                deposit[RESOURCE_INDEX["meat"]] += efficiency_bonus
+            self.resources.grant(deposit)
     
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        """Draw the world; alpha interpolates moving entities between fixed ticks"""
+        self.render_static(screen)
+        self.render_dynamic(screen, alpha)
+    
+    def render_static(self, surface: pygame.Surface, area: pygame.Rect = None):
+        """Draw the layer that only changes when humans die or respawn: base and living humans.
+        
+        With an area, drawing is clipped to it and only nearby humans are visited.
+        """
+        if self.profiler:
+            self.profiler.push("render.static")
+        if area is not None:
+            surface.set_clip(area)
+        
         # Draw base (blue circle)
-        pygame.draw.circle(screen, BLUE, (self.base_x, self.base_y), self.base_size)
+        pygame.draw.circle(surface, BLUE, (self.base_x, self.base_y), self.base_size)
         
         # Draw base label
         try:
-            font = pygame.font.Font(None, 24)
-            base_text = font.render("BASE", True, WHITE)
+            base_text = text_cache.render("BASE", 24, WHITE)
             base_rect = base_text.get_rect(center=(self.base_x, self.base_y))
-            screen.blit(base_text, base_rect)
+            surface.blit(base_text, base_rect)
         except:
             pass  # Skip text if font fails
         
-        # Draw humans
-        for human in self.humans:
-            human.render(screen)
+        # Draw living humans
+        queue = self.render_queue
+        if area is None:
+            indices = self.humans.alive_indices()
+        else:
+            reach = math.hypot(area.width, area.height) / 2 + HUMAN_SIZE
+            indices = self.humans.grid.query(area.centerx, area.centery, reach)
+        queue.set_viewport(area)
+        self.humans.submit_sprites(queue, indices, LAYER_HUMANS)
+        queue.flush(surface, collect_rects=False)
+        queue.set_viewport()
         
-        # Draw alien
-        self.alien.render(screen)
+        if area is not None:
+            surface.set_clip(None)
+        if self.profiler:
+            self.profiler.pop()
+    
+    def render_dynamic(self, screen: pygame.Surface, alpha: float = 1.0):
+        """Draw everything that moves or animates; returns the screen areas touched"""
+        profiler = self.profiler
+        queue = self.render_queue
+        
+        # Fading respawn indicators and the alien are queued, then drawn in
+        # one batch per layer; the target indicator goes on top of them
+        if profiler:
+            profiler.push("render.humans")
+        self.humans.submit_sprites(queue, self.humans.dead_indices(), LAYER_HUMANS)
+        
+        if profiler:
+            profiler.switch("render.alien")
+        self.alien.submit_sprite(queue, LAYER_ALIEN, alpha)
+        
+        if profiler:
+            profiler.switch("render.queue")
+        rects = queue.flush(screen)
         
         # Draw target indicator if moving to mouse click
-        self.alien.render_target_indicator(screen)
+        if profiler:
+            profiler.switch("render.alien")
+        rect = self.alien.render_target_indicator(screen, alpha)
+        if rect is not None:
+            rects.append(rect)
         
         # Draw particles (behind HUD)
-        self.particles.render(screen)
+        if self.particles:
+            if profiler:
+                profiler.switch("render.particles")
+            self.particles.submit_sprites(queue, LAYER_EFFECTS)
+            if profiler:
+                profiler.switch("render.queue")
+            rects.extend(queue.flush(screen))
         
         # Draw enhanced HUD
-        self.hud.render(screen, self)
+        if profiler:
+            profiler.switch("render.hud")
+        if self.hud:
+            self.hud.render(screen, self)
+            rects.extend(self.hud.dirty_regions())
+        if profiler:
+            profiler.pop()
+        
+        return rects
     
     def render_ui(self, screen: pygame.Surface):
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         y_offset = 10
         
         meat_text = font.render(f"Meat: {self.resources.meat}", True, WHITE)
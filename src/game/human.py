@@ -1,103 +1,119 @@
 import pygame
-import random
 from enum import Enum
 from .constants import *
+from .sprite_cache import circle_sprites
 
 class HumanType(Enum):
     MEAT = "meat"      # Red humans give meat
-    EGGS = "eggs"      # Yellow humans give eggs  
+    EGGS = "eggs"      # Yellow humans give eggs
     DNA = "dna"        # Green humans give DNA
     CELLS = "cells"    # Blue humans give cells
 
+# Per-type tables indexed by the population's type code
+HUMAN_TYPES = (HumanType.MEAT, HumanType.EGGS, HumanType.DNA, HumanType.CELLS)
+TYPE_CODES = {human_type: code for code, human_type in enumerate(HUMAN_TYPES)}
+TYPE_PROBABILITIES = (0.4, 0.3, 0.2, 0.1)  # 40% meat, 30% eggs, 20% DNA, 10% cells
+TYPE_COLORS = (
+    (255, 100, 100),  # Red - matches HUD meat color
+    (255, 255, 100),  # Yellow - matches HUD eggs color
+    (100, 255, 100),  # Green - matches HUD DNA color
+    (100, 200, 255),  # Blue - matches HUD cells color
+)
+TYPE_RESOURCES = tuple(human_type.value for human_type in HUMAN_TYPES)
+
+def human_sprite(color, size: int) -> pygame.Surface:
+    """Living human: a circle in its type color with a white outline"""
+    return circle_sprites.get(("human", tuple(color), size), lambda: _draw_human(color, size))
+
+def _draw_human(color, size: int) -> pygame.Surface:
+    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    pygame.draw.circle(sprite, WHITE, (size, size), size, 1)
+    return sprite
+
 class Human:
-    def __init__(self, x: float, y: float, human_type: HumanType = None):
-        self.x = x
-        self.y = y
-        self.alive = True
-        
-        # Determine human type
-        if human_type is None:
-            # Equal distribution of resource types
-            rand = random.random()
-            if rand < 0.4:  # 40% meat
-                self.type = HumanType.MEAT
-            elif rand < 0.7:  # 30% eggs
-                self.type = HumanType.EGGS
-            elif rand < 0.9:  # 20% DNA
-                self.type = HumanType.DNA
-            else:  # 10% cells
-                self.type = HumanType.CELLS
-        else:
-            self.type = human_type
-        
-        # Set attributes based on type
-        self.setup_attributes()
-        
-        self.spawn_timer = 0.0
-        self.spawn_delay = random.uniform(1.0, 3.0)
-    
-    def setup_attributes(self):
-        if self.type == HumanType.MEAT:
-            self.size = HUMAN_SIZE
-            self.value = 1
-            self.color = (255, 100, 100)  # Red - matches HUD meat color
-            self.move_speed = 0
-            self.resource_type = "meat"
-        elif self.type == HumanType.EGGS:
-            self.size = HUMAN_SIZE
-            self.value = 1  
-            self.color = (255, 255, 100)  # Yellow - matches HUD eggs color
-            self.move_speed = 0
-            self.resource_type = "eggs"
-        elif self.type == HumanType.DNA:
-            self.size = HUMAN_SIZE
-            self.value = 1
-            self.color = (100, 255, 100)  # Green - matches HUD DNA color
-            self.move_speed = 0
-            self.resource_type = "dna"
-        elif self.type == HumanType.CELLS:
-            self.size = HUMAN_SIZE
-            self.value = 1
-            self.color = (100, 200, 255)  # Blue - matches HUD cells color
-            self.move_speed = 0
-            self.resource_type = "cells"
-        
-        # No movement - all humans are stationary for clear color identification
-        self.move_direction = 0
-        self.move_timer = 0.0
-    
+    """Lightweight view of one entry in a HumanPopulation.
+
+    All state lives in the population's arrays; constructing a Human
+    directly creates a private single-entry population for it.
+    """
+    __slots__ = ("population", "index")
+
+    # No movement - all humans are stationary for clear color identification
+    size = HUMAN_SIZE
+    value = HUMAN_VALUE
+    move_speed = 0
+
+    def __init__(self, x: float, y: float, human_type: HumanType = None, rng=None):
+        from .human_population import HumanPopulation
+        self.population = HumanPopulation(capacity=1, rng=rng)
+        self.index = self.population.add(x, y, human_type)
+
+    @classmethod
+    def view(cls, population, index: int) -> "Human":
+        human = cls.__new__(cls)
+        human.population = population
+        human.index = index
+        return human
+
+    @property
+    def x(self) -> float:
+        return float(self.population.x[self.index])
+
+    @property
+    def y(self) -> float:
+        return float(self.population.y[self.index])
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.population.alive[self.index])
+
+    @property
+    def spawn_timer(self) -> float:
+        return self.population.spawn_timer_of(self.index)
+
+    @property
+    def spawn_delay(self) -> float:
+        return float(self.population.spawn_delay[self.index])
+
+    @property
+    def type(self) -> HumanType:
+        return HUMAN_TYPES[self.population.type_code[self.index]]
+
+    @property
+    def color(self):
+        return TYPE_COLORS[self.population.type_code[self.index]]
+
+    @property
+    def resource_type(self) -> str:
+        return TYPE_RESOURCES[self.population.type_code[self.index]]
+
     def update(self, dt: float):
-        if not self.alive:
-            self.spawn_timer += dt
-            if self.spawn_timer >= self.spawn_delay:
-                self.respawn()
-    
+        self.population.update(dt)
+
     def respawn(self):
-        self.alive = True
-        self.spawn_timer = 0.0
-        self.spawn_delay = random.uniform(1.0, 3.0)
-        
-    
+        self.population.respawn([self.index])
+
     def consume(self):
-        if self.alive:
-            self.alive = False
-            return self.value
-        return 0
-    
+        return self.population.consume(self.index)
+
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x - self.size//2, self.y - self.size//2, self.size, self.size)
-    
+
     def render(self, screen: pygame.Surface):
+        """Draw the human; returns the screen area drawn, if any"""
+        x, y = int(self.x), int(self.y)
         if self.alive:
             # Draw main circle with resource-type color
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
-            
+            rect = pygame.draw.circle(screen, self.color, (x, y), self.size)
+
             # Add white outline for better visibility
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.size, 1)
+            pygame.draw.circle(screen, WHITE, (x, y), self.size, 1)
+            return rect
         else:
             # Fading respawn indicator
             alpha = max(0, 255 - int(self.spawn_timer * 127))
             if alpha > 0:
-                s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(s, (*self.color, alpha), (self.size, self.size), self.size)
-                screen.blit(s, (int(self.x - self.size), int(self.y - self.size)))
\ No newline at end of file
+                sprite = circle_sprites.get_circle(self.color, self.size, alpha)
+                return screen.blit(sprite, (x - self.size, y - self.size))
+        return None
@@ -0,0 +1,227 @@
+import numpy as np
+from typing import Iterator, List, Optional
+from .human import Human, HumanType, TYPE_CODES, TYPE_COLORS, TYPE_PROBABILITIES, human_sprite
+from .sprite_cache import circle_sprites
+from .spatial_hash import SpatialHash
+from .event_scheduler import EventScheduler
+from .constants import HUMAN_SIZE, HUMAN_VALUE, SPATIAL_CELL_SIZE
+
+class HumanPopulation:
+    """Struct-of-arrays store for every human in a world.
+
+    Positions, type codes, alive flags and respawn data are NumPy arrays so
+    type sampling and consume bookkeeping run vectorized over the whole
+    population. Respawns are deadline events on an EventScheduler (shared
+    with the world, or owned by the population when none is given), so dead
+    humans cost nothing until they are due. Living humans are also kept in a
+    spatial hash, updated on consume/respawn, for collision queries.
+    Indexing or iterating yields Human views.
+    """
+
+    def __init__(self, capacity: int = 32, rng: Optional[np.random.Generator] = None,
+                 scheduler: Optional[EventScheduler] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler if scheduler is not None else EventScheduler()
+        self.count = 0
+
+        capacity = max(1, capacity)
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.type_code = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.consumed_at = np.zeros(capacity, dtype=np.float64)
+        self.spawn_delay = np.zeros(capacity, dtype=np.float64)
+        # Bumped on every consume/respawn so stale respawn events are ignored
+        self.generation = np.zeros(capacity, dtype=np.int64)
+
+        # Broadphase index of living humans (humans never move)
+        self.grid = SpatialHash(SPATIAL_CELL_SIZE)
+
+        # Indices whose alive state changed, kept only while a renderer listens
+        self.change_log: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Human:
+        if not -self.count <= index < self.count:
+            raise IndexError("human index out of range")
+        return Human.view(self, index % self.count)
+
+    def __iter__(self) -> Iterator[Human]:
+        for index in range(self.count):
+            yield Human.view(self, index)
+
+    def _reserve(self, extra: int):
+        needed = self.count + extra
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ("x", "y", "type_code", "alive", "consumed_at", "spawn_delay", "generation"):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+
+    def sample_types(self, n: int) -> np.ndarray:
+        return self.rng.choice(len(TYPE_PROBABILITIES), size=n, p=TYPE_PROBABILITIES).astype(np.int8)
+
+    def sample_delays(self, n: int) -> np.ndarray:
+        return self.rng.uniform(1.0, 3.0, size=n)
+
+    def add(self, x: float, y: float, human_type: HumanType = None) -> int:
+        """Add a single living human and return its index"""
+        type_codes = None if human_type is None else [TYPE_CODES[human_type]]
+        return int(self.add_many([x], [y], type_codes)[0])
+
+    def add_many(self, xs, ys, type_codes=None) -> np.ndarray:
+        """Add living humans in bulk, sampling types when none are given"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        n = len(xs)
+        self._reserve(n)
+
+        start, end = self.count, self.count + n
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.type_code[start:end] = self.sample_types(n) if type_codes is None else type_codes
+        self.alive[start:end] = True
+        self.consumed_at[start:end] = 0.0
+        self.spawn_delay[start:end] = self.sample_delays(n)
+        self.count = end
+
+        indices = np.arange(start, end)
+        self.grid.insert_many(indices, xs, ys)
+        self._log_changes(indices)
+        return indices
+
+    def enable_change_log(self):
+        """Start recording which humans spawn, die or respawn (see drain_changes)"""
+        if self.change_log is None:
+            self.change_log = []
+
+    def drain_changes(self) -> List[int]:
+        """Return and forget the indices changed since the last drain"""
+        changes = self.change_log or []
+        if self.change_log is not None:
+            self.change_log = []
+        return changes
+
+    def _log_changes(self, indices):
+        if self.change_log is not None:
+            self.change_log.extend(np.asarray(indices).tolist())
+
+    @property
+    def time(self) -> float:
+        return self.scheduler.time
+
+    @property
+    def spawn_timer(self) -> np.ndarray:
+        """Seconds each human has been dead (0 for living humans)"""
+        n = self.count
+        return np.where(self.alive[:n], 0.0, self.time - self.consumed_at[:n])
+
+    def spawn_timer_of(self, index: int) -> float:
+        if self.alive[index]:
+            return 0.0
+        return self.time - float(self.consumed_at[index])
+
+    def update(self, dt: float):
+        """Advance a population-owned scheduler; shared schedulers are advanced by their owner"""
+        if self.owns_scheduler:
+            self.scheduler.advance(dt)
+
+    def respawn(self, indices):
+        indices = np.asarray(indices, dtype=np.intp)
+        self.grid.insert_many(indices, self.x[indices], self.y[indices])
+        self.alive[indices] = True
+        self.generation[indices] += 1
+        self.spawn_delay[indices] = self.sample_delays(len(indices))
+        self._log_changes(indices)
+
+    def _respawn_due(self, index: int, generation: int):
+        if not self.alive[index] and self.generation[index] == generation:
+            self.respawn([index])
+
+    def _schedule_respawn(self, index: int):
+        self.generation[index] += 1
+        self.consumed_at[index] = self.time
+        self.scheduler.schedule(float(self.spawn_delay[index]), self._respawn_due,
+                                index, int(self.generation[index]))
+
+    def consume(self, index: int) -> int:
+        if self.alive[index]:
+            self.alive[index] = False
+            self.grid.remove(index, self.x[index], self.y[index])
+            self._schedule_respawn(int(index))
+            self._log_changes([index])
+            return HUMAN_VALUE
+        return 0
+
+    def consume_many(self, indices) -> int:
+        """Consume every living human in indices, returning the total value"""
+        indices = np.asarray(indices, dtype=np.intp)
+        living = indices[self.alive[indices]]
+        self.alive[living] = False
+        self.grid.remove_many(living, self.x[living], self.y[living])
+        for index in living:
+            self._schedule_respawn(int(index))
+        self._log_changes(living)
+        return len(living) * HUMAN_VALUE
+
+    def query_circle(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Indices of living humans whose drawn circle overlaps the given circle"""
+        reach = radius + HUMAN_SIZE
+        candidates = self.grid.query(x, y, reach)
+        if not len(candidates):
+            return candidates
+
+        # Exact circle-circle narrowphase, matching how humans and aliens are drawn
+        dx = self.x[candidates] - x
+        dy = self.y[candidates] - y
+        return candidates[dx * dx + dy * dy < reach * reach]
+
+    def submit_sprites(self, queue, indices, layer: int):
+        """Queue sprites for the humans in indices, in order: living humans, and
+        fading respawn indicators for dead ones. Humans outside the queue's
+        viewport are culled here, vectorized, rather than one by one.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        size = HUMAN_SIZE
+        lefts = self.x[indices].astype(np.int64) - size
+        tops = self.y[indices].astype(np.int64) - size
+        viewport = queue.viewport
+        visible = ((lefts < viewport.right) & (tops < viewport.bottom) &
+                   (lefts + 2 * size > viewport.left) & (tops + 2 * size > viewport.top))
+        alive = self.alive[indices]
+        alphas = np.where(alive, 255, 255 - ((self.time - self.consumed_at[indices]) * 127).astype(np.int64))
+        culled = int(np.count_nonzero(~visible))
+        keep = visible & (alphas > 0)
+        if not keep.all():
+            indices, lefts, tops, alive, alphas = (
+                indices[keep], lefts[keep], tops[keep], alive[keep], alphas[keep])
+
+        living = [human_sprite(color, size) for color in TYPE_COLORS]
+        codes = self.type_code[indices].tolist()
+        if alive.all():
+            entries = [(living[code], (left, top))
+                       for code, left, top in zip(codes, lefts.tolist(), tops.tolist())]
+            queue.extend(layer, entries, culled)
+            return
+
+        get_circle = circle_sprites.get_circle
+        entries = [(living[code] if is_alive else get_circle(TYPE_COLORS[code], size, alpha), (left, top))
+                   for code, is_alive, alpha, left, top
+                   in zip(codes, alive.tolist(), alphas.tolist(), lefts.tolist(), tops.tolist())]
+        queue.extend(layer, entries, culled)
+
+    def alive_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self.count])
+
+    def dead_indices(self) -> np.ndarray:
+        return np.flatnonzero(~self.alive[:self.count])
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive[:self.count]))
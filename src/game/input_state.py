@@ -0,0 +1,34 @@
+import pygame
+from typing import Optional, Tuple
+
+class InputState:
+    """Player input for a single simulation tick, independent of pygame polling"""
+    __slots__ = ("up", "down", "left", "right", "target", "purchase", "claim_quests")
+
+    def __init__(self, up: bool = False, down: bool = False,
+                 left: bool = False, right: bool = False,
+                 target: Optional[Tuple[float, float]] = None,
+                 purchase: Optional[str] = None, claim_quests: bool = False):
+        self.up = up
+        self.down = down
+        self.left = left
+        self.right = right
+        self.target = target            # Move-to position (mouse click equivalent)
+        self.purchase = purchase        # Upgrade name to buy this tick
+        self.claim_quests = claim_quests
+
+    @classmethod
+    def from_keys(cls, keys_pressed) -> "InputState":
+        """Build input from a pygame.key.get_pressed() result"""
+        return cls(
+            up=bool(keys_pressed[pygame.K_w] or keys_pressed[pygame.K_UP]),
+            down=bool(keys_pressed[pygame.K_s] or keys_pressed[pygame.K_DOWN]),
+            left=bool(keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]),
+            right=bool(keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]),
+        )
+
+    def has_movement(self) -> bool:
+        return self.up or self.down or self.left or self.right
+
+# Shared "no input" instance for idle ticks
+NO_INPUT = InputState()
@@ -1,134 +1,173 @@
-import pygame
-import random
 import math
-from typing import List, Tuple
-
-class Particle:
-    def __init__(self, x: float, y: float, velocity_x: float, velocity_y: float, 
-                 color: Tuple[int, int, int], size: float = 3.0, lifetime: float = 1.0):
-        self.x = x
-        self.y = y
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.color = color
-        self.size = size
-        self.max_lifetime = lifetime
-        self.lifetime = lifetime
-        self.alive = True
-    
-    def update(self, dt: float):
-        if not self.alive:
-            return
-        
-        # Update position
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        
-        # Apply gravity/drag
-        self.velocity_y += 100 * dt  # Gravity
-        self.velocity_x *= 0.98  # Drag
-        self.velocity_y *= 0.98
-        
-        # Update lifetime
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.alive = False
-    
-    def render(self, screen: pygame.Surface):
-        if not self.alive:
-            return
-        
-        # Fade alpha based on remaining lifetime
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        current_size = int(self.size * (self.lifetime / self.max_lifetime))
-        
-        if alpha > 0 and current_size > 0:
-            # Create surface with alpha
-            particle_surface = pygame.Surface((current_size * 2, current_size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*self.color, alpha)
-            pygame.draw.circle(particle_surface, color_with_alpha, (current_size, current_size), current_size)
-            screen.blit(particle_surface, (int(self.x - current_size), int(self.y - current_size)))
+import numpy as np
+from typing import List, Optional, Tuple
+from .sprite_cache import circle_sprites
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Particle] = []
-    
+    """Fixed-capacity particle pool stored in NumPy arrays.
+
+    Live particles occupy the first `count` slots. Integration runs
+    vectorized over all of them, dead particles are swap-removed with live
+    ones from the tail, and emitters spawn whole bursts in one call. Bursts
+    that would exceed capacity are truncated.
+    """
+
+    GRAVITY = 100.0
+    DRAG = 0.98
+
+    def __init__(self, capacity: int = 4096, rng: Optional[np.random.Generator] = None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.max_lifetime = np.ones(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def emit(self, xs, ys, velocity_xs, velocity_ys, colors, sizes, lifetimes) -> int:
+        """Add a batch of particles; returns how many fit in the pool"""
+        n = min(len(xs), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        self.x[start:end] = xs[:n]
+        self.y[start:end] = ys[:n]
+        self.velocity_x[start:end] = velocity_xs[:n]
+        self.velocity_y[start:end] = velocity_ys[:n]
+        self.color[start:end] = colors[:n] if np.ndim(colors) == 2 else colors
+        self.size[start:end] = sizes[:n]
+        self.lifetime[start:end] = lifetimes[:n]
+        self.max_lifetime[start:end] = lifetimes[:n]
+        self.count = end
+        return n
+
     def add_particle(self, x: float, y: float, velocity_x: float, velocity_y: float,
                     color: Tuple[int, int, int], size: float = 3.0, lifetime: float = 1.0):
-        particle = Particle(x, y, velocity_x, velocity_y, color, size, lifetime)
-        self.particles.append(particle)
-    
+        self.emit([x], [y], [velocity_x], [velocity_y], color, [size], [lifetime])
+
     def create_collection_burst(self, x: float, y: float, color: Tuple[int, int, int]):
         """Create particles when alien collects a human"""
         num_particles = 8
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            self.add_particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
-                vel_x, vel_y, color,
-                size=random.uniform(2, 5),
-                lifetime=random.uniform(0.5, 1.0)
-            )
-    
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, num_particles)
+        speed = rng.uniform(50, 150, num_particles)
+
+        self.emit(
+            x + rng.uniform(-5, 5, num_particles),
+            y + rng.uniform(-5, 5, num_particles),
+            np.cos(angle) * speed, np.sin(angle) * speed, color,
+            sizes=rng.uniform(2, 5, num_particles),
+            lifetimes=rng.uniform(0.5, 1.0, num_particles)
+        )
+
     def create_base_deposit_effect(self, x: float, y: float, cargo_types: List[str]):
         """Create particles when depositing cargo at base"""
         color_map = {
             "meat": (255, 100, 100),
-            "eggs": (255, 255, 100), 
+            "eggs": (255, 255, 100),
             "dna": (100, 255, 100),
             "cells": (100, 200, 255)
         }
-        
-        for resource_type in cargo_types:
-            color = color_map.get(resource_type, (255, 255, 255))
-            
-            # Create upward floating particles
-            for _ in range(3):
-                vel_x = random.uniform(-30, 30)
-                vel_y = random.uniform(-100, -50)  # Upward movement
-                
-                self.add_particle(
-                    x + random.uniform(-20, 20),
-                    y + random.uniform(-10, 10),
-                    vel_x, vel_y, color,
-                    size=random.uniform(3, 6),
-                    lifetime=random.uniform(1.0, 1.5)
-                )
-    
+        if not cargo_types:
+            return
+
+        # Upward floating particles, 3 per deposited human, emitted as one batch
+        per_item = 3
+        n = len(cargo_types) * per_item
+        colors = np.repeat([color_map.get(t, (255, 255, 255)) for t in cargo_types], per_item, axis=0)
+        rng = self.rng
+        self.emit(
+            x + rng.uniform(-20, 20, n),
+            y + rng.uniform(-10, 10, n),
+            rng.uniform(-30, 30, n), rng.uniform(-100, -50, n), colors,
+            sizes=rng.uniform(3, 6, n),
+            lifetimes=rng.uniform(1.0, 1.5, n)
+        )
+
     def create_upgrade_effect(self, x: float, y: float):
         """Create particles when purchasing an upgrade"""
         color = (255, 215, 0)  # Gold
         num_particles = 15
-        
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 200)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            self.add_particle(
-                x, y, vel_x, vel_y, color,
-                size=random.uniform(4, 8),
-                lifetime=random.uniform(0.8, 1.5)
-            )
-    
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, num_particles)
+        speed = rng.uniform(80, 200, num_particles)
+
+        self.emit(
+            np.full(num_particles, x), np.full(num_particles, y),
+            np.cos(angle) * speed, np.sin(angle) * speed, color,
+            sizes=rng.uniform(4, 8, num_particles),
+            lifetimes=rng.uniform(0.8, 1.5, num_particles)
+        )
+
     def update(self, dt: float):
-        # Update all particles
-        for particle in self.particles:
-            particle.update(dt)
-        
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.alive]
-    
-    def render(self, screen: pygame.Surface):
-        for particle in self.particles:
-            particle.render(screen)
-    
+        n = self.count
+        if n == 0:
+            return
+
+        # Integrate position, then gravity and drag
+        vx = self.velocity_x[:n]
+        vy = self.velocity_y[:n]
+        self.x[:n] += vx * dt
+        self.y[:n] += vy * dt
+        vy += self.GRAVITY * dt
+        vx *= self.DRAG
+        vy *= self.DRAG
+
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        dead = np.flatnonzero(lifetime <= 0)
+        if len(dead):
+            self._swap_remove(dead)
+
+    def _swap_remove(self, dead: np.ndarray):
+        """Fill holes left by dead particles with live particles from the tail"""
+        n = self.count
+        keep = n - len(dead)
+        holes = dead[dead < keep]
+        tail_alive = np.ones(n - keep, dtype=bool)
+        tail_alive[dead[dead >= keep] - keep] = False
+        movers = np.flatnonzero(tail_alive) + keep
+
+        for array in (self.x, self.y, self.velocity_x, self.velocity_y, self.color,
+                      self.size, self.lifetime, self.max_lifetime):
+            array[holes] = array[movers]
+        self.count = keep
+
+    def submit_sprites(self, queue, layer: int):
+        """Queue a cached sprite per visible particle, culled to the queue's viewport"""
+        n = self.count
+        if n == 0:
+            return
+
+        # Fade alpha and shrink based on remaining lifetime
+        ratio = self.lifetime[:n] / self.max_lifetime[:n]
+        alphas = (255 * ratio).astype(np.int64)
+        sizes = (self.size[:n] * ratio).astype(np.int64)
+        lefts = (self.x[:n] - sizes).astype(np.int64)
+        tops = (self.y[:n] - sizes).astype(np.int64)
+
+        viewport = queue.viewport
+        drawn = (alphas > 0) & (sizes > 0)
+        visible = ((lefts < viewport.right) & (tops < viewport.bottom) &
+                   (lefts + 2 * sizes > viewport.left) & (tops + 2 * sizes > viewport.top))
+        keep = np.flatnonzero(drawn & visible)
+
+        get_circle = circle_sprites.get_circle
+        colors = self.color[keep].tolist()
+        entries = [(get_circle(color, size, alpha), (left, top))
+                   for color, size, alpha, left, top
+                   in zip(colors, sizes[keep].tolist(), alphas[keep].tolist(),
+                          lefts[keep].tolist(), tops[keep].tolist())]
+        queue.extend(layer, entries, int(np.count_nonzero(drawn & ~visible)))
+
     def clear(self):
         """Remove all particles"""
-        self.particles.clear()
\ No newline at end of file
+        self.count = 0
@@ -0,0 +1,119 @@
+import csv
+import os
+import time
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+# Percentiles shown by the overlay and written by export_csv
+PERCENTILES = (50, 95, 99)
+
+class Profiler:
+    """Per-phase frame timings kept in fixed-size ring buffers.
+
+    Phases nest: time is charged to the innermost open phase only, so a
+    parent's time excludes its children and the phases of a frame add up to
+    the work done in it. switch() closes one phase and opens its sibling
+    with a single clock read. A phase may run several times per frame (one
+    update per fixed tick); end_frame() records each phase's total for the
+    frame in milliseconds, plus the wall time of the whole frame as "frame".
+    """
+
+    def __init__(self, capacity: int = 600, clock: Callable[[], float] = time.perf_counter):
+        self.capacity = capacity
+        self.clock = clock
+        self.phases: List[str] = []  # In the order they were first seen
+        self.samples: Dict[str, np.ndarray] = {}
+        self.current: Dict[str, float] = {}
+        self.frames = 0
+
+        self.stack: List[str] = []
+        self.mark = 0.0
+        self.frame_start = None
+
+    def _charge(self, name: str, now: float):
+        self.current[name] = self.current.get(name, 0.0) + now - self.mark
+
+    def _mark(self, now: float):
+        # Start of the next charged interval (subclasses can sample other counters here)
+        self.mark = now
+
+    def push(self, name: str):
+        now = self.clock()
+        if self.stack:
+            self._charge(self.stack[-1], now)
+        self.stack.append(name)
+        self._mark(now)
+
+    def switch(self, name: str):
+        now = self.clock()
+        self._charge(self.stack[-1], now)
+        self.stack[-1] = name
+        self._mark(now)
+
+    def pop(self):
+        now = self.clock()
+        self._charge(self.stack.pop(), now)
+        self._mark(now)
+
+    def end_frame(self):
+        now = self.clock()
+        if self.frame_start is not None:
+            self.current["frame"] = now - self.frame_start
+        self.frame_start = now
+
+        for name in self.current:
+            if name not in self.samples:
+                self.samples[name] = np.zeros(self.capacity)
+                self.phases.append(name)
+
+        slot = self.frames % self.capacity
+        for name in self.phases:
+            self.samples[name][slot] = self.current.get(name, 0.0) * 1000.0
+        self.current.clear()
+        self.frames += 1
+
+    def history(self, name: str) -> np.ndarray:
+        """Recorded samples of a phase in ms, oldest first"""
+        samples = self.samples[name]
+        if self.frames < self.capacity:
+            return samples[:self.frames]
+        return np.roll(samples, -(self.frames % self.capacity))
+
+    def summary(self) -> List[Tuple[str, float, float, float, float, float]]:
+        """(phase, mean, p50, p95, p99, max) in ms for every phase, over the buffered frames"""
+        if not self.phases:
+            return []
+        window = min(self.frames, self.capacity)
+        table = np.array([self.samples[name][:window] for name in self.phases])
+        percentiles = np.percentile(table, PERCENTILES, axis=1)
+        means = table.mean(axis=1)
+        maxima = table.max(axis=1)
+        return [(name, float(means[i]), *(float(p) for p in percentiles[:, i]), float(maxima[i]))
+                for i, name in enumerate(self.phases)]
+
+    def export_csv(self, path: str, raw: bool = False):
+        """Write the summary table, or with raw every buffered frame's sample per phase"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            if raw:
+                writer.writerow(["frame"] + [f"{name}_ms" for name in self.phases])
+                columns = [self.history(name) for name in self.phases]
+                first = self.frames - (len(columns[0]) if columns else 0)
+                for i, row in enumerate(zip(*columns)):
+                    writer.writerow([first + i] + [f"{value:.4f}" for value in row])
+            else:
+                writer.writerow(["phase", "frames", "mean_ms"] +
+                                [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"])
+                frames = min(self.frames, self.capacity)
+                for name, *values in self.summary():
+                    writer.writerow([name, frames] + [f"{value:.4f}" for value in values])
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples.fill(0.0)
+        self.current.clear()
+        self.frames = 0
+        self.frame_start = None
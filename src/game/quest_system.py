@@ -1,5 +1,7 @@
-from typing import Dict, List, Optional
+import random
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from .resource_manager import RESOURCE_TYPES
 
 class QuestType(Enum):
     COLLECT_RESOURCES = "collect_resources"
@@ -55,96 +57,188 @@ class Quest:
             }
         return {}
 
+    def watch_key(self) -> Optional[Tuple[str, str]]:
+        """The counter this quest's progress follows, e.g. ("resource", "meat")"""
+        if self.quest_type == QuestType.COLLECT_RESOURCES:
+            return ("resource", self.resource_type)
+        if self.quest_type == QuestType.UPGRADE_STAT:
+            return ("upgrade", self.upgrade_name)
+        return None
+
+# Quest definitions, built into Quest objects only when a quest is handed out
+STARTING_QUEST_TEMPLATES = (
+    dict(title="First Harvest", description="Collect 5 meat", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=5, reward_eggs=2, resource_type='meat'),
+    dict(title="Golden Hunter", description="Collect 3 eggs", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=3, reward_dna=1, resource_type='eggs'),
+    dict(title="Speed Demon", description="Upgrade speed to level 2", quest_type=QuestType.UPGRADE_STAT,
+         target_value=2, reward_meat=10, upgrade_name='speed'),
+    dict(title="Cargo Master", description="Upgrade cargo capacity to level 1", quest_type=QuestType.UPGRADE_STAT,
+         target_value=1, reward_eggs=3, upgrade_name='cargo'),
+    dict(title="DNA Collector", description="Collect 2 DNA", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=2, reward_cells=1, resource_type='dna'),
+)
+
+QUEST_TEMPLATES = (
+    dict(title="Evolution Path", description="Collect 10 DNA", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=10, reward_meat=20, resource_type='dna'),
+    dict(title="Size Matters", description="Upgrade size to level 3", quest_type=QuestType.UPGRADE_STAT,
+         target_value=3, reward_eggs=5, upgrade_name='size'),
+    dict(title="Efficiency Expert", description="Upgrade efficiency to level 1", quest_type=QuestType.UPGRADE_STAT,
+         target_value=1, reward_dna=3, upgrade_name='efficiency'),
+    dict(title="Resource Hoarder", description="Collect 50 meat", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=50, reward_cells=5, resource_type='meat'),
+    dict(title="Cell Division", description="Collect 5 cells", quest_type=QuestType.COLLECT_RESOURCES,
+         target_value=5, reward_meat=30, resource_type='cells'),
+)
+
+
 class QuestSystem:
-    def __init__(self, resources, upgrade_system):
+    """Event-driven quest tracker.
+    
+    Active quests are indexed by the counter they follow (a resource type or
+    an upgrade name) and only re-evaluated when that counter changes, via
+    ResourceManager/UpgradeSystem listeners. Active and completed quests are
+    kept in incrementally maintained buckets; the lists returned by
+    get_active_quests/get_completed_quests are live and must not be mutated.
+    """
+    
+    def __init__(self, resources, upgrade_system, rng: random.Random = None):
         self.resources = resources
         self.upgrade_system = upgrade_system
+        self.rng = rng or random
         self.quests: List[Quest] = []
         self.completed_quests: List[Quest] = []
         
+        # Status buckets (subsets of self.quests, in the same order)
+        self.active_quests: List[Quest] = []
+        self.ready_quests: List[Quest] = []
+        
+        # Active quests by watched counter
+        self.watchers: Dict[Tuple[str, str], List[Quest]] = {}
+        
+        # Optional Profiler (see GameWorld.set_profiler)
+        self.profiler = None
+        
+        resources.add_listener(self.on_resources_changed)
+        upgrade_system.add_listener(self.on_upgrade_changed)
+        
         self.init_starting_quests()
     
     def init_starting_quests(self):
         """Create initial set of quests"""
-        starting_quests = [
-            Quest("First Harvest", "Collect 5 meat", QuestType.COLLECT_RESOURCES, 
-                  5, reward_eggs=2, resource_type='meat'),
-            Quest("Golden Hunter", "Collect 3 eggs", QuestType.COLLECT_RESOURCES,
-                  3, reward_dna=1, resource_type='eggs'),
-            Quest("Speed Demon", "Upgrade speed to level 2", QuestType.UPGRADE_STAT,
-                  2, reward_meat=10, upgrade_name='speed'),
-            Quest("Cargo Master", "Upgrade cargo capacity to level 1", QuestType.UPGRADE_STAT,
-                  1, reward_eggs=3, upgrade_name='cargo'),
-            Quest("DNA Collector", "Collect 2 DNA", QuestType.COLLECT_RESOURCES,
-                  2, reward_cells=1, resource_type='dna'),
-        ]
+        # Start with 3 active quests
+        for template in STARTING_QUEST_TEMPLATES[:3]:
+            self.add_quest(Quest(**template))
+    
+    def add_quest(self, quest: Quest):
+        self.quests.append(quest)
+        if quest.status != QuestStatus.ACTIVE:
+            if quest.is_completed():
+                self.ready_quests.append(quest)
+            return
         
-        # Add first few quests
-        self.quests = starting_quests[:3]  # Start with 3 active quests
+        self.active_quests.append(quest)
+        key = quest.watch_key()
+        if key is not None:
+            self.watchers.setdefault(key, []).append(quest)
+            self.advance_quest(quest, self.read_counter(key))
+    
+    def restore(self, quests: List[Quest], completed_quests: List[Quest]):
+        """Replace all quest state, e.g. when loading a save"""
+        self.quests = []
+        self.completed_quests = list(completed_quests)
+        self.active_quests = []
+        self.ready_quests = []
+        self.watchers = {}
+        for quest in quests:
+            self.add_quest(quest)
+    
+    def read_counter(self, key: Tuple[str, str]) -> int:
+        kind, name = key
+        if kind == "resource":
+            return getattr(self.resources, name, 0)
+        upgrade = self.upgrade_system.upgrades.get(name)
+        return upgrade.level if upgrade else 0
+    
+    def advance_quest(self, quest: Quest, value: int):
+        """Apply a new counter value to one quest, moving it to the completed bucket if done"""
+        quest.update_progress(value)
+        if quest.is_completed():
+            self.active_quests.remove(quest)
+            self.watchers[quest.watch_key()].remove(quest)
+            
+            # Keep the completed bucket in quest-list order
+            position = 0
+            for other in self.quests:
+                if other is quest:
+                    break
+                if other.is_completed():
+                    position += 1
+            self.ready_quests.insert(position, quest)
+    
+    def notify_counter(self, key: Tuple[str, str], value: int):
+        watching = self.watchers.get(key)
+        if watching:
+            for quest in list(watching):
+                self.advance_quest(quest, value)
+    
+    def on_resources_changed(self, resources, delta):
+        if self.profiler:
+            self.profiler.push("update.quests")
+        for index in delta.nonzero()[0]:
+            self.notify_counter(("resource", RESOURCE_TYPES[index]), int(resources.balances[index]))
+        if self.profiler:
+            self.profiler.pop()
+    
+    def on_upgrade_changed(self, upgrade_name: str):
+        if self.profiler:
+            self.profiler.push("update.quests")
+        self.notify_counter(("upgrade", upgrade_name), self.read_counter(("upgrade", upgrade_name)))
+        if self.profiler:
+            self.profiler.pop()
     
     def update(self):
-        """Update quest progress based on current game state"""
-        for quest in self.quests:
-            if quest.status == QuestStatus.ACTIVE:
-                if quest.quest_type == QuestType.COLLECT_RESOURCES:
-                    if quest.resource_type == 'meat':
-                        quest.update_progress(self.resources.meat)
-                    elif quest.resource_type == 'eggs':
-                        quest.update_progress(self.resources.eggs)
-                    elif quest.resource_type == 'dna':
-                        quest.update_progress(self.resources.dna)
-                    elif quest.resource_type == 'cells':
-                        quest.update_progress(self.resources.cells)
-                
-                elif quest.quest_type == QuestType.UPGRADE_STAT:
-                    upgrade = self.upgrade_system.upgrades.get(quest.upgrade_name)
-                    if upgrade:
-                        quest.update_progress(upgrade.level)
+        """Re-read every watched counter.
+        
+        Progress normally arrives through change notifications; this is only
+        needed after counters were changed without them (e.g. restored state).
+        """
+        for key in list(self.watchers):
+            self.notify_counter(key, self.read_counter(key))
     
     def claim_quest_reward(self, quest_index: int) -> bool:
         """Claim reward for completed quest"""
         if 0 <= quest_index < len(self.quests):
-            quest = self.quests[quest_index]
-            if quest.is_completed() and not quest.is_claimed():
-                rewards = quest.claim_reward()
-                
-                # Add rewards to resources
-                self.resources.add_meat(rewards['meat'])
-                self.resources.add_eggs(rewards['eggs'])
-                self.resources.add_dna(rewards['dna'])
-                self.resources.add_cells(rewards['cells'])
-                
-                # Move to completed quests and add new quest
-                self.completed_quests.append(quest)
-                self.quests.remove(quest)
-                self.add_new_quest()
-                
-                return True
+            return self.claim_quest(self.quests[quest_index])
+        return False
+    
+    def claim_quest(self, quest: Quest) -> bool:
+        if quest.is_completed() and not quest.is_claimed():
+            rewards = quest.claim_reward()
+            
+            # Move to completed quests before granting rewards so it is no longer tracked
+            self.completed_quests.append(quest)
+            self.quests.remove(quest)
+            self.ready_quests.remove(quest)
+            
+            # Add rewards to resources
+            self.resources.grant(rewards)
+            
+            # Add new quest
+            self.add_new_quest()
+            
+            return True
         return False
     
     def add_new_quest(self):
         """Add a new quest when one is completed"""
-        new_quests = [
-            Quest("Evolution Path", "Collect 10 DNA", QuestType.COLLECT_RESOURCES,
-                  10, reward_meat=20, resource_type='dna'),
-            Quest("Size Matters", "Upgrade size to level 3", QuestType.UPGRADE_STAT,
-                  3, reward_eggs=5, upgrade_name='size'),
-            Quest("Efficiency Expert", "Upgrade efficiency to level 1", QuestType.UPGRADE_STAT,
-                  1, reward_dna=3, upgrade_name='efficiency'),
-            Quest("Resource Hoarder", "Collect 50 meat", QuestType.COLLECT_RESOURCES,
-                  50, reward_cells=5, resource_type='meat'),
-            Quest("Cell Division", "Collect 5 cells", QuestType.COLLECT_RESOURCES,
-                  5, reward_meat=30, resource_type='cells'),
-        ]
-        
         # Add random new quest
-        if new_quests and len(self.quests) < 3:
-            import random
-            new_quest = random.choice(new_quests)
-            self.quests.append(new_quest)
+        if QUEST_TEMPLATES and len(self.quests) < 3:
+            self.add_quest(Quest(**self.rng.choice(QUEST_TEMPLATES)))
     
     def get_active_quests(self) -> List[Quest]:
-        return [q for q in self.quests if q.status == QuestStatus.ACTIVE]
+        return self.active_quests
     
     def get_completed_quests(self) -> List[Quest]:
-        return [q for q in self.quests if q.status == QuestStatus.COMPLETED]
\ No newline at end of file
+        return self.ready_quests
@@ -0,0 +1,74 @@
+import pygame
+from typing import Dict, List, Sequence, Tuple
+from .constants import *
+
+# Draw order, back to front
+LAYER_HUMANS = 0     # Living humans and fading respawn indicators
+LAYER_ALIEN = 10
+LAYER_EFFECTS = 20   # Particles
+
+Entry = Tuple[pygame.Surface, Tuple[int, int]]
+
+class RenderQueue:
+    """Sprites submitted as (sprite, position, layer), drawn back to front.
+
+    Systems submit pre-rendered sprites instead of drawing; flush() sorts
+    the layers and draws each one with a single Surface.blits call, so a
+    frame costs a few C-level batch calls rather than one Python call per
+    entity. Within a layer, entries draw in submission order. Entries
+    entirely outside the viewport are culled on submission; batch
+    producers can cull against `viewport` themselves and extend() a layer.
+    """
+
+    def __init__(self, viewport: pygame.Rect = None):
+        self.viewport = pygame.Rect(viewport or (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.layers: Dict[int, List[Entry]] = {}
+        self.submitted = 0
+        self.culled = 0
+
+    def set_viewport(self, viewport: pygame.Rect = None):
+        """Cull against viewport (the full screen when None) from now on"""
+        self.viewport = pygame.Rect(viewport or (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def submit(self, sprite: pygame.Surface, pos: Tuple[int, int], layer: int) -> bool:
+        """Queue sprite with its top-left corner at pos; returns False if it was culled"""
+        x, y = pos
+        width, height = sprite.get_size()
+        viewport = self.viewport
+        if (x >= viewport.right or y >= viewport.bottom or
+                x + width <= viewport.left or y + height <= viewport.top):
+            self.culled += 1
+            return False
+        self.layers.setdefault(layer, []).append((sprite, pos))
+        self.submitted += 1
+        return True
+
+    def extend(self, layer: int, entries: Sequence[Entry], culled: int = 0):
+        """Queue (sprite, position) entries the caller already culled, dropping `culled` others"""
+        self.layers.setdefault(layer, []).extend(entries)
+        self.submitted += len(entries)
+        self.culled += culled
+
+    def flush(self, surface: pygame.Surface, collect_rects: bool = True) -> List[pygame.Rect]:
+        """Draw and drop everything queued, layer by layer; returns the areas drawn.
+
+        Callers that don't need the areas pass collect_rects=False, which saves
+        allocating a Rect per entry.
+        """
+        rects = []
+        for layer in sorted(self.layers):
+            entries = self.layers[layer]
+            if entries:
+                if collect_rects:
+                    rects.extend(surface.blits(entries))
+                else:
+                    surface.blits(entries, False)
+        self.layers.clear()
+        return rects
+
+    def clear(self):
+        self.layers.clear()
+
+    def reset_stats(self):
+        self.submitted = 0
+        self.culled = 0
@@ -0,0 +1,218 @@
+import zlib
+import numpy as np
+from typing import List, Tuple
+from .constants import *
+from .input_state import InputState, NO_INPUT
+from .save_system import (KIND_FULL, KIND_DELTA, KIND_REPLAY, SaveFile, SaveSystem, build_world,
+                          encode_file, read_snapshot, write_file, _pack, _unpack)
+from .upgrade_system import UPGRADE_NAMES
+
+# A replay is a save file (KIND_REPLAY) with four sections:
+#   RPLY  replay meta
+#   INPT  zlib-compressed input rows, one per key-state change or discrete action, in order
+#   KIDX  keyframe index (tick, offset and length into KFRM)
+#   KFRM  zlib-compressed snapshots: the first is full, later ones are deltas against it
+INPUT_KEYS = 0      # arg: held movement keys as bits (up, down, left, right)
+INPUT_TARGET = 1    # x, y: alien move-to target
+INPUT_PURCHASE = 2  # arg: index into UPGRADE_NAMES
+INPUT_CLAIM = 3     # claim every completed quest
+INPUT_SKIP = 4      # x: max_seconds of a GameWorld.advance_idle fast-forward
+
+INPUT_DTYPE = np.dtype([("tick", "<u4"), ("kind", "u1"), ("arg", "u1"), ("x", "<f8"), ("y", "<f8")])
+REPLAY_DTYPE = np.dtype([("dt", "<f8"), ("start_tick", "<i8"), ("end_tick", "<i8"),
+                         ("keyframe_interval", "<u4")])
+KEYFRAME_DTYPE = np.dtype([("tick", "<i8"), ("offset", "<u8"), ("length", "<u8")])
+
+# Ticks between keyframes: bounds how far a seek has to re-simulate
+KEYFRAME_INTERVAL = 60 * FPS
+
+UPGRADE_INDEX = {name: index for index, name in enumerate(UPGRADE_NAMES)}
+
+def key_bits(controls: InputState) -> int:
+    return int(controls.up) | int(controls.down) << 1 | int(controls.left) << 2 | int(controls.right) << 3
+
+def controls_from_bits(bits: int) -> InputState:
+    if not bits:
+        return NO_INPUT
+    return InputState(up=bool(bits & 1), down=bool(bits & 2), left=bool(bits & 4), right=bool(bits & 8))
+
+class ReplayRecorder:
+    """Records a world's inputs plus periodic keyframes.
+
+    Constructing a recorder attaches it to the world, which then reports key
+    state every tick and every target, purchase and quest claim as it
+    happens. Actions taken between ticks (mouse clicks, menu purchases) are
+    logged against the next tick, which is where they take effect. Only key
+    changes are stored, so idle stretches cost nothing.
+    """
+
+    def __init__(self, world, keyframe_interval: int = KEYFRAME_INTERVAL, dt: float = FIXED_DT):
+        self.world = world
+        self.dt = dt
+        self.keyframe_interval = keyframe_interval
+        self.rows: List[Tuple] = []
+        self.keys = 0
+        self.ticking = False
+
+        self.snapshots = SaveSystem(world)
+        self.keyframes: List[Tuple[int, bytes]] = []
+        self.start_tick = world.frame_count
+        self.take_keyframe()
+
+        world.recorder = self
+
+    def detach(self):
+        if self.world.recorder is self:
+            self.world.recorder = None
+
+    def current_tick(self) -> int:
+        # Outside update() an action applies on the coming tick
+        return self.world.frame_count if self.ticking else self.world.frame_count + 1
+
+    def begin_tick(self, controls: InputState):
+        self.ticking = True
+        bits = key_bits(controls)
+        if bits != self.keys:
+            self.keys = bits
+            self.rows.append((self.world.frame_count, INPUT_KEYS, bits, 0.0, 0.0))
+
+    def end_tick(self):
+        self.ticking = False
+        if self.world.frame_count >= self.start_tick + len(self.keyframes) * self.keyframe_interval:
+            self.take_keyframe()
+
+    def record_target(self, x: float, y: float):
+        self.rows.append((self.current_tick(), INPUT_TARGET, 0, x, y))
+
+    def record_purchase(self, upgrade_name: str):
+        self.rows.append((self.current_tick(), INPUT_PURCHASE, UPGRADE_INDEX[upgrade_name], 0.0, 0.0))
+
+    def record_claim(self):
+        self.rows.append((self.current_tick(), INPUT_CLAIM, 0, 0.0, 0.0))
+
+    def record_skip(self, max_seconds: float):
+        self.rows.append((self.world.frame_count + 1, INPUT_SKIP, 0, max_seconds, 0.0))
+
+    def take_keyframe(self):
+        if self.keyframes:
+            data = encode_file(KIND_DELTA, self.snapshots.delta_sections())
+        else:
+            data = encode_file(KIND_FULL, self.snapshots.full_sections())
+        self.keyframes.append((self.world.frame_count, zlib.compress(data)))
+
+    def save(self, path: str) -> int:
+        """Write the recording so far; returns the CRC32 of the file"""
+        index = np.zeros(len(self.keyframes), dtype=KEYFRAME_DTYPE)
+        offset = 0
+        for i, (tick, blob) in enumerate(self.keyframes):
+            index[i] = (tick, offset, len(blob))
+            offset += len(blob)
+
+        sections = {
+            b"RPLY": _pack(REPLAY_DTYPE, dt=self.dt, start_tick=self.start_tick,
+                           end_tick=self.world.frame_count, keyframe_interval=self.keyframe_interval),
+            b"INPT": zlib.compress(np.array(self.rows, dtype=INPUT_DTYPE).tobytes()),
+            b"KIDX": index.tobytes(),
+            b"KFRM": b"".join(blob for _, blob in self.keyframes),
+        }
+        return write_file(path, KIND_REPLAY, sections)
+
+class ReplayPlayer:
+    """Plays back a recorded replay and seeks to any tick.
+
+    seek() restores the nearest keyframe at or before the target tick and
+    re-simulates forward headless, or just keeps stepping when the current
+    world is already between that keyframe and the target.
+    """
+
+    def __init__(self, path: str, headless: bool = True):
+        self.path = path
+        self.headless = headless
+        self.file = SaveFile(path)
+        if self.file.kind != KIND_REPLAY:
+            self.file.close()
+            raise ValueError(f"{path} is not a replay")
+
+        meta = _unpack(REPLAY_DTYPE, self.file.section(b"RPLY"))
+        self.dt = float(meta["dt"])
+        self.start_tick = int(meta["start_tick"])
+        self.end_tick = int(meta["end_tick"])
+
+        inputs = np.frombuffer(zlib.decompress(self.file.section(b"INPT")), dtype=INPUT_DTYPE)
+        self.rows = inputs.tolist()
+        self.row_ticks = inputs["tick"].astype(np.int64)
+        self.key_rows = np.flatnonzero(inputs["kind"] == INPUT_KEYS)
+
+        self.keyframes = np.frombuffer(self.file.section(b"KIDX"), dtype=KEYFRAME_DTYPE).copy()
+        self.blobs = self.file.section(b"KFRM")
+        self.base = SaveFile(f"{path}@{self.start_tick}", self.decompress(0))
+
+        self.world = None
+        self.row = 0
+        self.keys = NO_INPUT
+        self.seek(self.start_tick)
+
+    def decompress(self, index: int) -> bytes:
+        offset, length = int(self.keyframes[index]["offset"]), int(self.keyframes[index]["length"])
+        return zlib.decompress(self.blobs[offset:offset + length])
+
+    def load_keyframe(self, index: int):
+        if index == 0:
+            return build_world(*read_snapshot(self.base), headless=True)
+        tick = int(self.keyframes[index]["tick"])
+        keyframe = SaveFile(f"{self.path}@{tick}", self.decompress(index))
+        return build_world(*read_snapshot(keyframe, self.base), headless=True)
+
+    @property
+    def tick(self) -> int:
+        return self.world.frame_count
+
+    def seek(self, tick: int):
+        """Bring the world to `tick` (clamped to the recording); returns the world.
+
+        Lands on the first tick at or after `tick` when it falls inside a
+        recorded advance_idle fast-forward.
+        """
+        tick = max(self.start_tick, min(tick, self.end_tick))
+        index = int(np.searchsorted(self.keyframes["tick"], tick, side="right")) - 1
+        keyframe_tick = int(self.keyframes[index]["tick"])
+
+        if self.world is None or not keyframe_tick <= self.world.frame_count <= tick:
+            self.world = self.load_keyframe(index)
+            self.row = int(np.searchsorted(self.row_ticks, keyframe_tick, side="right"))
+            # Keys held at the keyframe: the last key change at or before it
+            held = int(np.searchsorted(self.row_ticks[self.key_rows], keyframe_tick, side="right"))
+            self.keys = controls_from_bits(self.rows[self.key_rows[held - 1]][2]) if held else NO_INPUT
+
+        while self.world.frame_count < tick:
+            self.step()
+
+        if not self.headless:
+            self.world.attach_presentation()
+        return self.world
+
+    def step(self):
+        """Simulate one recorded tick (or one recorded fast-forward)"""
+        world = self.world
+        tick = world.frame_count + 1
+        rows = self.rows
+        while self.row < len(rows) and rows[self.row][0] <= tick:
+            _, kind, arg, x, y = rows[self.row]
+            self.row += 1
+            if kind == INPUT_KEYS:
+                self.keys = controls_from_bits(arg)
+            elif kind == INPUT_TARGET:
+                world.set_alien_target(x, y)
+            elif kind == INPUT_PURCHASE:
+                world.purchase_upgrade(UPGRADE_NAMES[arg])
+            elif kind == INPUT_CLAIM:
+                world.claim_completed_quests()
+            elif kind == INPUT_SKIP:
+                world.advance_idle(x, self.dt)
+                return
+        world.update(self.dt, controls=self.keys)
+
+    def close(self):
+        # Drop views into the mapped file before closing it
+        self.blobs = None
+        self.file.close()
@@ -1,61 +1,253 @@
+import math
+import numpy as np
+from typing import Callable, Dict, List, Optional
+
+# Ledger slot order, shared with cargo types, quests and vectorized engines
+RESOURCE_TYPES = ("meat", "eggs", "dna", "cells")
+RESOURCE_INDEX = {name: index for index, name in enumerate(RESOURCE_TYPES)}
+NUM_RESOURCES = len(RESOURCE_TYPES)
+
+# Rolling income rate: granted amounts summed over a window of fixed buckets
+RATE_WINDOW = 10.0
+RATE_BUCKETS = 10
+
+def resource_vector(amounts=None, **named) -> np.ndarray:
+    """Build a ledger vector from a dict, a sequence in RESOURCE_TYPES order, or keywords"""
+    vector = np.zeros(NUM_RESOURCES, dtype=np.int64)
+    if isinstance(amounts, dict):
+        named = {**amounts, **named}
+    elif amounts is not None:
+        amounts = np.asarray(amounts)
+        if amounts.dtype.kind not in "iub":
+            raise ValueError(f"resource amounts must be integers, got {amounts.dtype}")
+        vector[:] = amounts
+    for name, amount in named.items():
+        if not isinstance(amount, (int, np.integer)):
+            raise ValueError(f"{name} amount must be an integer, got {amount!r}")
+        vector[RESOURCE_INDEX[name]] += amount
+    return vector
+
+def ledger_vector(amounts) -> np.ndarray:
+    """resource_vector(amounts), checked for use as a grant or cost: integers, none negative"""
+    if not isinstance(amounts, np.ndarray):
+        amounts = resource_vector(amounts)
+    elif amounts.shape != (NUM_RESOURCES,) or amounts.dtype.kind not in "iu":
+        raise ValueError(f"resource vectors must be {NUM_RESOURCES} integers, "
+                         f"got {amounts.dtype} with shape {amounts.shape}")
+    if (amounts < 0).any():
+        raise ValueError(f"resource amounts must not be negative: {amounts.tolist()}")
+    return amounts
+
+def _balance(index: int):
+    def getter(self) -> int:
+        return int(self.balances[index])
+
+    def setter(self, value: int):
+        self.set_balance(index, value)
+    return property(getter, setter)
+
 class ResourceManager:
-    def __init__(self):
-        self.meat = 0
-        self.eggs = 0
-        self.dna = 0
-        self.cells = 0
-        
+    """Vector-backed resource ledger.
+
+    Balances live in one int64 slot per resource type. grant/spend apply a
+    whole vector at once (spend is all-or-nothing) and raise ValueError for
+    negative or non-integer amounts, listeners are called as
+    callback(manager, delta) after every change, and granted income feeds a
+    bucketed rolling rate per resource. The per-resource properties and
+    add_*/spend_* helpers are thin wrappers over the vector operations.
+    """
+
+    # Idle income is paid out once per interval
+    IDLE_INTERVAL = 1.0
+
+    meat = _balance(0)
+    eggs = _balance(1)
+    dna = _balance(2)
+    cells = _balance(3)
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        self.balances = np.zeros(NUM_RESOURCES, dtype=np.int64)
+
         self.meat_per_second = 0.0
         self.eggs_per_second = 0.0
-        
+
         self.idle_timer = 0.0
-    
+
+        # Fractional idle income not yet paid out as whole units
+        self.meat_carry = 0.0
+        self.eggs_carry = 0.0
+
+        # Called as callback(manager, delta) whenever a balance changes
+        self.listeners: List[Callable] = []
+
+        # Time source for income rates; defaults to time passed to advance()
+        self.clock = clock
+        self.elapsed = 0.0
+        self.rate_buckets = np.zeros((RATE_BUCKETS, NUM_RESOURCES), dtype=np.int64)
+        self.rate_total = np.zeros(NUM_RESOURCES, dtype=np.int64)
+        self.rate_bucket = 0  # Absolute number of the newest bucket
+        self.rate_origin = self.now()  # Rates cover no time before this
+
+    def add_listener(self, callback: Callable):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback: Callable):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def notify(self, delta: np.ndarray):
+        for callback in self.listeners:
+            callback(self, delta)
+
+    def now(self) -> float:
+        return self.clock() if self.clock is not None else self.elapsed
+
+    def grant(self, amounts, record_rate: bool = True) -> np.ndarray:
+        """Add a vector of resources in one operation; returns the vector applied.
+
+        record_rate=False leaves the amounts out of the rolling income rate.
+        """
+        delta = ledger_vector(amounts)
+        if not delta.any():
+            return delta
+        self.balances += delta
+        if record_rate:
+            self._record_income(delta)
+        self.notify(delta)
+        return delta
+
+    def can_spend(self, amounts) -> bool:
+        cost = ledger_vector(amounts)
+        return bool((self.balances >= cost).all())
+
+    def spend(self, amounts) -> bool:
+        """Atomically pay a vector of resources; nothing is taken unless all of it is affordable"""
+        cost = ledger_vector(amounts)
+        if not (self.balances >= cost).all():
+            return False
+        if cost.any():
+            self.balances -= cost
+            self.notify(-cost)
+        return True
+
+    def set_balance(self, resource, value: int):
+        index = RESOURCE_INDEX[resource] if isinstance(resource, str) else resource
+        delta = np.zeros(NUM_RESOURCES, dtype=np.int64)
+        delta[index] = value - self.balances[index]
+        if delta[index]:
+            self.balances[index] = value
+            self.notify(delta)
+
+    def _roll_rate_window(self):
+        """Retire buckets that fell out of the window since the last call"""
+        bucket = int(self.now() // (RATE_WINDOW / RATE_BUCKETS))
+        stale = bucket - self.rate_bucket
+        if stale <= 0:
+            return
+        if stale >= RATE_BUCKETS:
+            self.rate_buckets.fill(0)
+            self.rate_total.fill(0)
+        else:
+            for number in range(self.rate_bucket + 1, bucket + 1):
+                slot = number % RATE_BUCKETS
+                self.rate_total -= self.rate_buckets[slot]
+                self.rate_buckets[slot] = 0
+        self.rate_bucket = bucket
+
+    def _record_income(self, delta: np.ndarray):
+        self._roll_rate_window()
+        self.rate_buckets[self.rate_bucket % RATE_BUCKETS] += delta
+        self.rate_total += delta
+
+    def rates(self) -> np.ndarray:
+        """Income per second for every resource over the last RATE_WINDOW seconds.
+
+        Divides by the time the buckets actually cover: the newest bucket is
+        only partly elapsed, and early on the window reaches back past
+        rate_origin. At least one bucket's length is assumed, so a grant
+        right at the start doesn't read as an enormous rate.
+        """
+        self._roll_rate_window()
+        bucket_length = RATE_WINDOW / RATE_BUCKETS
+        window_start = max((self.rate_bucket - RATE_BUCKETS + 1) * bucket_length, self.rate_origin)
+        return self.rate_total / max(self.now() - window_start, bucket_length)
+
+    def rate(self, resource: str) -> float:
+        return float(self.rates()[RESOURCE_INDEX[resource]])
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(zip(RESOURCE_TYPES, self.balances.tolist()))
+
     def update(self, dt: float):
-        self.idle_timer += dt
-        
-        if self.idle_timer >= 1.0:
-            self.meat += int(self.meat_per_second)
-            self.eggs += int(self.eggs_per_second)
-            self.idle_timer = 0.0
-    
+        self.advance(dt)
+
+    def advance(self, seconds: float, record_rate: bool = True) -> Dict[str, int]:
+        """Apply idle income for any elapsed interval in constant time.
+
+        Equivalent to ticking update() through every frame: income is paid
+        once per whole IDLE_INTERVAL, and fractional rates carry over
+        instead of being truncated. Returns the amounts granted.
+        """
+        self.elapsed += seconds
+        self.idle_timer += seconds
+        payouts = math.floor(self.idle_timer / self.IDLE_INTERVAL + 1e-9)
+        if payouts <= 0:
+            return {}
+        self.idle_timer = max(0.0, self.idle_timer - payouts * self.IDLE_INTERVAL)
+
+        meat_income = self.meat_per_second * self.IDLE_INTERVAL * payouts + self.meat_carry
+        eggs_income = self.eggs_per_second * self.IDLE_INTERVAL * payouts + self.eggs_carry
+        # Small epsilon so accumulated float error can't swallow a whole unit
+        meat_gained = math.floor(meat_income + 1e-9)
+        eggs_gained = math.floor(eggs_income + 1e-9)
+        self.meat_carry = max(0.0, meat_income - meat_gained)
+        self.eggs_carry = max(0.0, eggs_income - eggs_gained)
+
+        self.grant(resource_vector(meat=meat_gained, eggs=eggs_gained), record_rate)
+        return {"meat": meat_gained, "eggs": eggs_gained}
+
+    def catch_up(self, offline_seconds: float, max_seconds: float = None) -> Dict[str, int]:
+        """Grant offline progress (e.g. after loading a save), optionally capped.
+
+        Offline income is not counted in rates(): it was not earned in the
+        last RATE_WINDOW seconds of play.
+        """
+        if max_seconds is not None:
+            offline_seconds = min(offline_seconds, max_seconds)
+        return self.advance(max(0.0, offline_seconds), record_rate=False)
+
+    def has_idle_income(self) -> bool:
+        return self.meat_per_second > 0 or self.eggs_per_second > 0
+
+    def time_until_next_payout(self) -> float:
+        return self.IDLE_INTERVAL - self.idle_timer
+
     def add_meat(self, amount: int):
-        self.meat += amount
-    
+        self.grant(resource_vector(meat=amount))
+
     def add_eggs(self, amount: int):
-        self.eggs += amount
-    
+        self.grant(resource_vector(eggs=amount))
+
     def add_dna(self, amount: int):
-        self.dna += amount
-    
+        self.grant(resource_vector(dna=amount))
+
     def add_cells(self, amount: int):
-        self.cells += amount
-    
+        self.grant(resource_vector(cells=amount))
+
     def spend_meat(self, amount: int) -> bool:
-        if self.meat >= amount:
-            self.meat -= amount
-            return True
-        return False
-    
+        return self.spend(resource_vector(meat=amount))
+
     def spend_eggs(self, amount: int) -> bool:
-        if self.eggs >= amount:
-            self.eggs -= amount
-            return True
-        return False
-    
+        return self.spend(resource_vector(eggs=amount))
+
     def spend_dna(self, amount: int) -> bool:
-        if self.dna >= amount:
-            self.dna -= amount
-            return True
-        return False
-    
+        return self.spend(resource_vector(dna=amount))
+
     def spend_cells(self, amount: int) -> bool:
-        if self.cells >= amount:
-            self.cells -= amount
-            return True
-        return False
-    
+        return self.spend(resource_vector(cells=amount))
+
     def can_afford(self, meat: int = 0, eggs: int = 0, dna: int = 0, cells: int = 0) -> bool:
-        return (self.meat >= meat and 
-                self.eggs >= eggs and 
-                self.dna >= dna and 
-                self.cells >= cells)
\ No newline at end of file
+        return bool(self.balances[0] >= meat and
+                    self.balances[1] >= eggs and
+                    self.balances[2] >= dna and
+                    self.balances[3] >= cells)
@@ -0,0 +1,23 @@
+import hashlib
+import random
+import numpy as np
+from typing import Optional
+
+def make_rng(seed: Optional[int], stream: str) -> random.Random:
+    """Create an independent RNG stream for one subsystem of a world.
+
+    The same (seed, stream) pair always yields the same sequence, and streams
+    never share state, so e.g. cosmetic particles drawn only in rendered
+    worlds cannot perturb the simulation. A seed of None gives an
+    unseeded (non-reproducible) stream.
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{stream}")
+
+def make_np_rng(seed: Optional[int], stream: str) -> np.random.Generator:
+    """NumPy counterpart of make_rng for vectorized sampling"""
+    if seed is None:
+        return np.random.default_rng()
+    digest = hashlib.sha256(f"{seed}:{stream}".encode()).digest()
+    return np.random.default_rng(int.from_bytes(digest[:16], "little"))
@@ -0,0 +1,61 @@
+import numpy as np
+from typing import Dict, Set, Tuple
+
+class SpatialHash:
+    """Uniform grid index over stationary points.
+
+    Points are bucketed by the cell containing them, so a circle query only
+    visits the cells its bounding box overlaps. Entries are inserted and
+    removed individually as humans are consumed and respawn.
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        self.cell_size = float(cell_size)
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, index: int, x: float, y: float):
+        cell = self.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = set()
+        bucket.add(int(index))
+
+    def remove(self, index: int, x: float, y: float):
+        cell = self.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is not None:
+            bucket.discard(int(index))
+            if not bucket:
+                del self.cells[cell]
+
+    def insert_many(self, indices, xs, ys):
+        for index, x, y in zip(indices, xs, ys):
+            self.insert(index, x, y)
+
+    def remove_many(self, indices, xs, ys):
+        for index, x, y in zip(indices, xs, ys):
+            self.remove(index, x, y)
+
+    def query(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Indices of all points in cells overlapping the circle's bounding box"""
+        size = self.cell_size
+        min_cx, max_cx = int((x - radius) // size), int((x + radius) // size)
+        min_cy, max_cy = int((y - radius) // size), int((y + radius) // size)
+
+        found = []
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return np.array(sorted(found), dtype=np.intp)
+
+    def clear(self):
+        self.cells.clear()
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.cells.values())
@@ -0,0 +1,61 @@
+import pygame
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+
+class SpriteCache:
+    """Bounded LRU cache of pre-rendered sprites.
+
+    Circles are keyed by (color, radius, quantized alpha) so fading entities
+    reuse a handful of surfaces instead of allocating one per frame; other
+    sprites go through get() with their own key and build function. Once a
+    display mode is set, sprites are converted to the display's pixel format
+    for fast blitting.
+    """
+
+    def __init__(self, max_entries: int = 2048, alpha_levels: int = 32):
+        self.max_entries = max_entries
+        self.alpha_step = 256 // alpha_levels
+        self.sprites: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize_alpha(self, alpha: int) -> int:
+        step = self.alpha_step
+        return min(255, (alpha + step // 2) // step * step)
+
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached sprite for key, calling build() to draw it on a miss"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = build()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)  # Evict least recently used
+        return sprite
+
+    def get_circle(self, color: Tuple[int, int, int], radius: int, alpha: int) -> pygame.Surface:
+        key = (tuple(color), radius, self.quantize_alpha(alpha))
+        return self.get(key, lambda: self._draw_circle(*key))
+
+    @staticmethod
+    def _draw_circle(color: Tuple[int, int, int], radius: int, alpha: int) -> pygame.Surface:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+# Shared cache for all fading circles (particles, respawning humans)
+circle_sprites = SpriteCache()
+
+# Shared cache for alien bodies, keyed by evolution tier, size, glow and cargo
+alien_sprites = SpriteCache(max_entries=512)
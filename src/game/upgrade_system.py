@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 from .resource_manager import ResourceManager
 
 class Upgrade:
@@ -16,6 +16,48 @@ class Upgrade:
         self.effect_target = effect_target  # "speed", "cargo", "size", etc.
         self.level = 0
         self.max_level = 5
+    
+    def cost_at(self, level: int) -> Tuple[int, int, int, int]:
+        """Cost of buying the level after `level` (increases each level)"""
+        level_multiplier = level + 1
+        return (
+            self.cost_meat * level_multiplier,
+            self.cost_eggs * level_multiplier,
+            self.cost_dna * level_multiplier,
+            self.cost_cells * level_multiplier
+        )
+
+def create_default_upgrades() -> Dict[str, Upgrade]:
+    """Build the standard upgrade table (shared by worlds, batch engines and planners)"""
+    upgrades: Dict[str, Upgrade] = {}
+    
+    # Speed upgrades
+    upgrades["speed"] = Upgrade(
+        "Alien Speed", "Move faster to hunt more efficiently",
+        cost_meat=5, effect_type="stat", effect_value=50, effect_target="speed"
+    )
+    
+    # Cargo capacity upgrades
+    upgrades["cargo"] = Upgrade(
+        "Stomach Capacity", "Carry more humans before returning to base",
+        cost_meat=10, effect_type="stat", effect_value=2, effect_target="cargo"
+    )
+    
+    # Size upgrades
+    upgrades["size"] = Upgrade(
+        "Alien Growth", "Grow larger to consume humans more easily",
+        cost_meat=8, cost_eggs=2, effect_type="stat", effect_value=3, effect_target="size"
+    )
+    
+    # Collection efficiency
+    upgrades["efficiency"] = Upgrade(
+        "Feeding Efficiency", "Convert humans to more meat",
+        cost_meat=15, cost_dna=1, effect_type="stat", effect_value=1, effect_target="efficiency"
+    )
+    return upgrades
+
+# Upgrade names in table order
+UPGRADE_NAMES = tuple(create_default_upgrades())
 
 class UpgradeSystem:
     def __init__(self, alien, resources: ResourceManager):
@@ -23,80 +65,65 @@ class UpgradeSystem:
         self.resources = resources
         self.upgrades: Dict[str, Upgrade] = {}
         
+        # Per-upgrade cost of each purchasable level, indexed by current level
+        self.cost_table: Dict[str, List[Tuple[int, int, int, int]]] = {}
+        
+        # Called with the upgrade name whenever an upgrade's level changes
+        self.listeners: List[Callable] = []
+        
         # Link alien to upgrade system for evolution visuals
         self.alien._upgrade_system_ref = self
+        self.add_listener(self.alien.invalidate_evolution)
         
         self.init_upgrades()
     
     def init_upgrades(self):
-        # Speed upgrades
-        self.upgrades["speed"] = Upgrade(
-            "Alien Speed", "Move faster to hunt more efficiently",
-            cost_meat=5, effect_type="stat", effect_value=50, effect_target="speed"
-        )
-        
-        # Cargo capacity upgrades
-        self.upgrades["cargo"] = Upgrade(
-            "Stomach Capacity", "Carry more humans before returning to base",
-            cost_meat=10, effect_type="stat", effect_value=2, effect_target="cargo"
-        )
-        
-        # Size upgrades
-        self.upgrades["size"] = Upgrade(
-            "Alien Growth", "Grow larger to consume humans more easily",
-            cost_meat=8, cost_eggs=2, effect_type="stat", effect_value=3, effect_target="size"
-        )
-        
-        # Collection efficiency
-        self.upgrades["efficiency"] = Upgrade(
-            "Feeding Efficiency", "Convert humans to more meat",
-            cost_meat=15, cost_dna=1, effect_type="stat", effect_value=1, effect_target="efficiency"
-        )
+        self.upgrades = create_default_upgrades()
+        self.alien.invalidate_evolution()
+        self.cost_table = {
+            name: [upgrade.cost_at(level) for level in range(upgrade.max_level + 1)]
+            for name, upgrade in self.upgrades.items()
+        }
+    
+    def add_listener(self, callback: Callable):
+        self.listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
     
     def can_afford(self, upgrade_name: str) -> bool:
         upgrade = self.upgrades.get(upgrade_name)
         if not upgrade or upgrade.level >= upgrade.max_level:
             return False
         
-        # Calculate cost based on level (increases each level)
-        level_multiplier = upgrade.level + 1
-        cost_meat = upgrade.cost_meat * level_multiplier
-        cost_eggs = upgrade.cost_eggs * level_multiplier
-        cost_dna = upgrade.cost_dna * level_multiplier
-        cost_cells = upgrade.cost_cells * level_multiplier
-        
-        return self.resources.can_afford(cost_meat, cost_eggs, cost_dna, cost_cells)
+        return self.resources.can_afford(*self.get_upgrade_cost(upgrade_name))
     
     def get_upgrade_cost(self, upgrade_name: str) -> Tuple[int, int, int, int]:
         upgrade = self.upgrades.get(upgrade_name)
         if not upgrade:
             return (0, 0, 0, 0)
         
-        level_multiplier = upgrade.level + 1
-        return (
-            upgrade.cost_meat * level_multiplier,
-            upgrade.cost_eggs * level_multiplier,
-            upgrade.cost_dna * level_multiplier,
-            upgrade.cost_cells * level_multiplier
-        )
+        costs = self.cost_table.get(upgrade_name)
+        if costs is None or upgrade.level >= len(costs):
+            return upgrade.cost_at(upgrade.level)
+        return costs[upgrade.level]
     
     def purchase_upgrade(self, upgrade_name: str) -> bool:
-        if not self.can_afford(upgrade_name):
+        upgrade = self.upgrades.get(upgrade_name)
+        if not upgrade or upgrade.level >= upgrade.max_level:
             return False
         
-        upgrade = self.upgrades[upgrade_name]
-        cost_meat, cost_eggs, cost_dna, cost_cells = self.get_upgrade_cost(upgrade_name)
-        
-        # Pay the cost
-        self.resources.spend_meat(cost_meat)
-        self.resources.spend_eggs(cost_eggs)
-        self.resources.spend_dna(cost_dna)
-        self.resources.spend_cells(cost_cells)
+        # Pay the whole cost in one atomic ledger operation
+        if not self.resources.spend(self.get_upgrade_cost(upgrade_name)):
+            return False
         
         # Apply the upgrade
         upgrade.level += 1
         self.apply_upgrade_effect(upgrade)
         
+        for callback in self.listeners:
+            callback(upgrade_name)
         return True
     
     def apply_upgrade_effect(self, upgrade: Upgrade):
@@ -106,6 +133,8 @@ class UpgradeSystem:
             elif upgrade.effect_target == "cargo":
                 self.alien.max_cargo += int(upgrade.effect_value)
             elif upgrade.effect_target == "size":
+                # base_size too, or the cargo pulse animation would reset it
+                self.alien.base_size += int(upgrade.effect_value)
                 self.alien.size += int(upgrade.effect_value)
             elif upgrade.effect_target == "efficiency":
                 self.alien.efficiency_bonus += int(upgrade.effect_value)
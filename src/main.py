@@ -8,7 +8,11 @@ def main():
     pygame.init()
     pygame.font.init()
     
-    game = GameManager()
+    # --dirty-rects redraws only changed screen areas (for low-power displays)
+    # --record PATH writes a seekable input replay of the session (see game/replay.py);
+    # each restart or quick load continues in PATH with a segment number appended
+    record_path = sys.argv[sys.argv.index("--record") + 1] if "--record" in sys.argv[:-1] else None
+    game = GameManager(dirty_rects="--dirty-rects" in sys.argv, record_path=record_path)
     game.run()
     
     pygame.quit()
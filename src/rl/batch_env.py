@@ -0,0 +1,265 @@
+import numpy as np
+from typing import Optional, Tuple
+from game.constants import *
+from game.human import TYPE_PROBABILITIES, TYPE_RESOURCES
+from game.upgrade_system import create_default_upgrades, UPGRADE_NAMES
+from game.rng import make_np_rng
+
+# Discrete actions: 0 = idle, 1-8 = move (keyboard directions), 9+ = buy upgrade
+_DIAGONAL = 0.707  # Same diagonal normalization as Alien.update
+ACTION_MOVES = np.array([
+    (0.0, 0.0),                      # 0: idle
+    (0.0, -1.0),                     # 1: up
+    (0.0, 1.0),                      # 2: down
+    (-1.0, 0.0),                     # 3: left
+    (1.0, 0.0),                      # 4: right
+    (-_DIAGONAL, -_DIAGONAL),        # 5: up-left
+    (_DIAGONAL, -_DIAGONAL),         # 6: up-right
+    (-_DIAGONAL, _DIAGONAL),         # 7: down-left
+    (_DIAGONAL, _DIAGONAL),          # 8: down-right
+])
+NUM_MOVE_ACTIONS = len(ACTION_MOVES)
+NUM_ACTIONS = NUM_MOVE_ACTIONS + len(UPGRADE_NAMES)
+
+NUM_RESOURCES = len(TYPE_RESOURCES)
+NEAREST_HUMANS = 5  # Humans reported per observation, nearest first
+
+# Observation layout (all float32, roughly normalized)
+OBS_ALIEN = slice(0, 3)                                    # x, y, cargo fill
+OBS_CARGO = slice(3, 3 + NUM_RESOURCES)                    # cargo per resource type
+OBS_RESOURCES = slice(OBS_CARGO.stop, OBS_CARGO.stop + NUM_RESOURCES)
+OBS_LEVELS = slice(OBS_RESOURCES.stop, OBS_RESOURCES.stop + len(UPGRADE_NAMES))
+OBS_BASE = slice(OBS_LEVELS.stop, OBS_LEVELS.stop + 2)     # base offset from alien
+OBS_HUMANS = slice(OBS_BASE.stop, OBS_BASE.stop + 3 * NEAREST_HUMANS)  # dx, dy, type
+OBS_SIZE = OBS_HUMANS.stop
+RESOURCE_SCALE = 100.0
+
+class BatchWorld:
+    """N independent worlds stepped in lockstep with NumPy.
+
+    Mirrors the GameWorld rules (keyboard movement, cargo pulse, collisions,
+    respawns, base deposits, upgrades) but keeps every world's state in
+    stacked arrays so a single step() advances all of them. Worlds that
+    finish an episode are reset automatically.
+    """
+
+    def __init__(self, num_worlds: int, num_humans: int = 20, max_steps: int = 3600,
+                 seed: Optional[int] = None, dt: float = FIXED_DT,
+                 reward_weights: Tuple[float, ...] = (1.0, 1.0, 1.0, 1.0)):
+        self.num_worlds = num_worlds
+        self.num_humans = num_humans
+        self.max_steps = max_steps
+        self.dt = dt
+        self.rng = make_np_rng(seed, "batch")
+        self.reward_weights = np.asarray(reward_weights, dtype=np.float64)
+
+        self.base_x = 50
+        self.base_y = 50
+        self.base_size = 40
+
+        # Upgrade table as arrays: base costs (U, R), effect values (U,), level caps (U,)
+        upgrades = create_default_upgrades()
+        self.upgrade_costs = np.array([
+            (u.cost_meat, u.cost_eggs, u.cost_dna, u.cost_cells) for u in upgrades.values()
+        ], dtype=np.int64)
+        self.upgrade_effects = np.array([u.effect_value for u in upgrades.values()])
+        self.upgrade_max = np.array([u.max_level for u in upgrades.values()], dtype=np.int64)
+        self.upgrade_targets = [u.effect_target for u in upgrades.values()]
+
+        n, h = num_worlds, num_humans
+        # Alien state
+        self.alien_x = np.zeros(n)
+        self.alien_y = np.zeros(n)
+        self.speed = np.zeros(n)
+        self.base_alien_size = np.zeros(n, dtype=np.int64)
+        self.alien_size = np.zeros(n, dtype=np.int64)
+        self.max_cargo = np.zeros(n, dtype=np.int64)
+        self.efficiency = np.zeros(n, dtype=np.int64)
+        self.animation_timer = np.zeros(n)
+        self.cargo = np.zeros((n, NUM_RESOURCES), dtype=np.int64)
+
+        # Economy
+        self.resources = np.zeros((n, NUM_RESOURCES), dtype=np.int64)
+        self.levels = np.zeros((n, len(UPGRADE_NAMES)), dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+
+        # Human populations
+        self.human_x = np.zeros((n, h))
+        self.human_y = np.zeros((n, h))
+        self.human_type = np.zeros((n, h), dtype=np.int8)
+        self.human_alive = np.zeros((n, h), dtype=bool)
+        self.spawn_timer = np.zeros((n, h))
+        self.spawn_delay = np.zeros((n, h))
+
+        self._obs = np.zeros((n, OBS_SIZE), dtype=np.float32)
+        self.reset()
+
+    @property
+    def cargo_total(self) -> np.ndarray:
+        return self.cargo.sum(axis=1)
+
+    def reset(self, worlds=None) -> np.ndarray:
+        """Reset the given worlds (all by default) and return observations"""
+        worlds = np.arange(self.num_worlds) if worlds is None else np.asarray(worlds)
+        if len(worlds):
+            self.alien_x[worlds] = SCREEN_WIDTH // 2
+            self.alien_y[worlds] = SCREEN_HEIGHT // 2
+            self.speed[worlds] = ALIEN_SPEED
+            self.base_alien_size[worlds] = ALIEN_SIZE
+            self.alien_size[worlds] = ALIEN_SIZE
+            self.max_cargo[worlds] = ALIEN_MAX_CARGO
+            self.efficiency[worlds] = 0
+            self.animation_timer[worlds] = 0.0
+            self.cargo[worlds] = 0
+            self.resources[worlds] = 0
+            self.levels[worlds] = 0
+            self.steps[worlds] = 0
+            self._spawn_humans(worlds)
+        return self.observe()
+
+    def _spawn_humans(self, worlds: np.ndarray):
+        n, h = len(worlds), self.num_humans
+        xs = np.zeros((n, h))
+        ys = np.zeros((n, h))
+        missing = np.ones((n, h), dtype=bool)
+        alien_x = self.alien_x[worlds, None]
+        alien_y = self.alien_y[worlds, None]
+
+        # Rejection-sample positions away from the alien and the base, all worlds at once
+        while missing.any():
+            cx = self.rng.integers(100, SCREEN_WIDTH - 100, size=(n, h), endpoint=True)
+            cy = self.rng.integers(100, SCREEN_HEIGHT - 100, size=(n, h), endpoint=True)
+            valid = (missing
+                     & (np.hypot(cx - alien_x, cy - alien_y) > 100)
+                     & (np.hypot(cx - self.base_x, cy - self.base_y) > 80))
+            xs[valid] = cx[valid]
+            ys[valid] = cy[valid]
+            missing &= ~valid
+
+        self.human_x[worlds] = xs
+        self.human_y[worlds] = ys
+        self.human_type[worlds] = self.rng.choice(NUM_RESOURCES, size=(n, h), p=TYPE_PROBABILITIES)
+        self.human_alive[worlds] = True
+        self.spawn_timer[worlds] = 0.0
+        self.spawn_delay[worlds] = self.rng.uniform(1.0, 3.0, size=(n, h))
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance every world one tick; returns (observations, rewards, dones)"""
+        actions = np.asarray(actions, dtype=np.int64)
+        dt = self.dt
+
+        self._apply_purchases(actions)
+
+        # Keyboard-style movement (purchase actions leave the alien idle)
+        moves = ACTION_MOVES[np.where(actions < NUM_MOVE_ACTIONS, actions, 0)]
+        self.alien_x += moves[:, 0] * self.speed * dt
+        self.alien_y += moves[:, 1] * self.speed * dt
+        np.clip(self.alien_x, self.alien_size, SCREEN_WIDTH - self.alien_size, out=self.alien_x)
+        np.clip(self.alien_y, self.alien_size, SCREEN_HEIGHT - self.alien_size, out=self.alien_y)
+
+        # Pulse effect when carrying cargo (clock is ticks * dt, as Alien keeps it)
+        self.animation_timer = (self.steps + 1) * dt
+        carrying = self.cargo_total > 0
+        pulse = 1.0 + 0.2 * np.sin(self.animation_timer * 4)
+        self.alien_size = np.where(carrying, (self.base_alien_size * pulse).astype(np.int64),
+                                   self.base_alien_size)
+
+        # Respawn timers of dead humans
+        dead = ~self.human_alive
+        self.spawn_timer[dead] += dt
+        due = dead & (self.spawn_timer >= self.spawn_delay)
+        if due.any():
+            self.human_alive[due] = True
+            self.spawn_timer[due] = 0.0
+            self.spawn_delay[due] = self.rng.uniform(1.0, 3.0, size=int(due.sum()))
+
+        self._check_collisions()
+        rewards = self._check_base_interaction()
+
+        self.steps += 1
+        dones = self.steps >= self.max_steps
+        if dones.any():
+            self.reset(np.flatnonzero(dones))
+        return self.observe(), rewards, dones
+
+    def _apply_purchases(self, actions: np.ndarray):
+        upgrade = actions - NUM_MOVE_ACTIONS
+        buying = np.flatnonzero((upgrade >= 0) & (upgrade < len(UPGRADE_NAMES)))
+        if not len(buying):
+            return
+
+        u = upgrade[buying]
+        level = self.levels[buying, u]
+        cost = self.upgrade_costs[u] * (level + 1)[:, None]
+        ok = (level < self.upgrade_max[u]) & (self.resources[buying] >= cost).all(axis=1)
+        worlds, u, cost = buying[ok], u[ok], cost[ok]
+
+        self.resources[worlds] -= cost
+        self.levels[worlds, u] += 1
+        effect = self.upgrade_effects[u]
+        for index, target in enumerate(self.upgrade_targets):
+            chosen = u == index
+            if not chosen.any():
+                continue
+            w = worlds[chosen]
+            if target == "speed":
+                self.speed[w] += effect[chosen]
+            elif target == "cargo":
+                self.max_cargo[w] += effect[chosen].astype(np.int64)
+            elif target == "size":
+                self.base_alien_size[w] += effect[chosen].astype(np.int64)
+                self.alien_size[w] += effect[chosen].astype(np.int64)
+            elif target == "efficiency":
+                self.efficiency[w] += effect[chosen].astype(np.int64)
+
+    def _check_collisions(self):
+        reach = (self.alien_size + HUMAN_SIZE)[:, None]
+        dx = self.human_x - self.alien_x[:, None]
+        dy = self.human_y - self.alien_y[:, None]
+        hits = self.human_alive & (dx * dx + dy * dy < reach * reach)
+        if not hits.any():
+            return
+
+        # Consume hits in index order until each alien's cargo is full
+        room = (self.max_cargo - self.cargo_total)[:, None]
+        taken = hits & (np.cumsum(hits, axis=1) <= room)
+        self.human_alive &= ~taken
+        for resource in range(NUM_RESOURCES):
+            self.cargo[:, resource] += (taken & (self.human_type == resource)).sum(axis=1)
+
+    def _check_base_interaction(self) -> np.ndarray:
+        distance = np.hypot(self.alien_x - self.base_x, self.alien_y - self.base_y)
+        depositing = (distance < self.base_size) & (self.cargo_total > 0)
+
+        gained = np.where(depositing[:, None], self.cargo, 0)
+        gained[:, 0] += np.where(depositing, self.efficiency, 0)  # Efficiency bonus as extra meat
+        self.resources += gained
+        self.cargo[depositing] = 0
+        return gained @ self.reward_weights
+
+    def observe(self) -> np.ndarray:
+        """Fill and return the shared (num_worlds, OBS_SIZE) observation buffer"""
+        obs = self._obs
+        obs[:, 0] = self.alien_x / SCREEN_WIDTH
+        obs[:, 1] = self.alien_y / SCREEN_HEIGHT
+        obs[:, 2] = self.cargo_total / self.max_cargo
+        obs[:, OBS_CARGO] = self.cargo / self.max_cargo[:, None]
+        obs[:, OBS_RESOURCES] = self.resources / RESOURCE_SCALE
+        obs[:, OBS_LEVELS] = self.levels / self.upgrade_max
+        obs[:, OBS_BASE.start] = (self.base_x - self.alien_x) / SCREEN_WIDTH
+        obs[:, OBS_BASE.start + 1] = (self.base_y - self.alien_y) / SCREEN_HEIGHT
+
+        # Nearest living humans (missing slots stay zero)
+        dx = self.human_x - self.alien_x[:, None]
+        dy = self.human_y - self.alien_y[:, None]
+        distance = np.where(self.human_alive, dx * dx + dy * dy, np.inf)
+        k = min(NEAREST_HUMANS, self.num_humans)
+        nearest = np.argsort(distance, axis=1)[:, :k]
+        rows = np.arange(self.num_worlds)[:, None]
+        valid = np.isfinite(distance[rows, nearest])
+        humans = obs[:, OBS_HUMANS].reshape(self.num_worlds, NEAREST_HUMANS, 3)  # View into obs
+        humans[:] = 0.0
+        humans[:, :k, 0] = np.where(valid, dx[rows, nearest] / SCREEN_WIDTH, 0.0)
+        humans[:, :k, 1] = np.where(valid, dy[rows, nearest] / SCREEN_HEIGHT, 0.0)
+        humans[:, :k, 2] = np.where(valid, (self.human_type[rows, nearest] + 1) / NUM_RESOURCES, 0.0)
+        return obs
@@ -0,0 +1,127 @@
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from typing import Optional, Tuple
+from game.constants import *
+from game.game_world import GameWorld
+from game.human import TYPE_RESOURCES
+from game.input_state import InputState
+from game.resource_manager import RESOURCE_INDEX
+from game.upgrade_system import UPGRADE_NAMES
+from .batch_env import (ACTION_MOVES, NUM_ACTIONS, NUM_MOVE_ACTIONS, NEAREST_HUMANS,
+                        OBS_CARGO, OBS_RESOURCES, OBS_LEVELS, OBS_BASE, OBS_HUMANS,
+                        OBS_SIZE, RESOURCE_SCALE)
+
+def _movement_input(move_x: float, move_y: float) -> InputState:
+    return InputState(up=move_y < 0, down=move_y > 0, left=move_x < 0, right=move_x > 0)
+
+# One reusable InputState per discrete action (same action table as BatchWorld)
+ACTION_INPUTS = tuple(_movement_input(mx, my) for mx, my in ACTION_MOVES)
+
+class AlienInvasionEnv(gym.Env):
+    """Gymnasium environment around a headless GameWorld.
+
+    Uses the BatchWorld action set and observation layout so policies move
+    freely between the two. The observation array is allocated once and
+    filled in place every step: callers that keep observations across steps
+    must copy them, or pass copy_observations=True (as Gymnasium's
+    env_checker expects).
+    """
+    metadata = {"render_modes": []}
+
+    def __init__(self, max_steps: int = 3600, num_humans: int = 20,
+                 reward_weights: Tuple[float, ...] = (1.0, 1.0, 1.0, 1.0),
+                 copy_observations: bool = False):
+        super().__init__()
+        self.max_steps = max_steps
+        self.copy_observations = copy_observations
+        self.num_humans = num_humans
+        self.reward_weights = reward_weights
+
+        self.action_space = spaces.Discrete(NUM_ACTIONS)
+        self.observation_space = spaces.Box(-np.inf, np.inf, shape=(OBS_SIZE,), dtype=np.float32)
+
+        self._obs = np.zeros(OBS_SIZE, dtype=np.float32)
+        self._humans_obs = self._obs[OBS_HUMANS].reshape(NEAREST_HUMANS, 3)  # View into _obs
+        self.world: Optional[GameWorld] = None
+        self.steps = 0
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        super().reset(seed=seed)
+        world_seed = int(self.np_random.integers(2 ** 63))
+        self.world = GameWorld(headless=True, seed=world_seed, num_humans=self.num_humans)
+        self.steps = 0
+        return self._observation(), {}
+
+    def step(self, action: int):
+        world = self.world
+        before = self._resource_score()
+        spent = 0.0
+
+        action = int(action)
+        if action >= NUM_MOVE_ACTIONS:
+            # Upgrade purchase: idle this tick, and don't count the cost as negative reward
+            upgrade_name = UPGRADE_NAMES[action - NUM_MOVE_ACTIONS]
+            cost = world.upgrade_system.get_upgrade_cost(upgrade_name)
+            if world.purchase_upgrade(upgrade_name):
+                spent = sum(c * w for c, w in zip(cost, self.reward_weights))
+            controls = ACTION_INPUTS[0]
+        else:
+            controls = ACTION_INPUTS[action]
+
+        world.update(FIXED_DT, controls=controls)
+        self.steps += 1
+
+        reward = self._resource_score() - before + spent
+        truncated = self.steps >= self.max_steps
+        return self._observation(), reward, False, truncated, {}
+
+    def _resource_score(self) -> float:
+        resources = self.world.resources
+        weights = self.reward_weights
+        return float(resources.balances @ weights)
+
+    def _observation(self) -> np.ndarray:
+        obs = self._fill_observation()
+        return obs.copy() if self.copy_observations else obs
+
+    def _fill_observation(self) -> np.ndarray:
+        obs = self._obs
+        world = self.world
+        alien = world.alien
+
+        obs[0] = alien.x / SCREEN_WIDTH
+        obs[1] = alien.y / SCREEN_HEIGHT
+        obs[2] = alien.cargo / alien.max_cargo
+
+        cargo = obs[OBS_CARGO]
+        cargo[:] = 0.0
+        for resource_type in alien.cargo_types:
+            cargo[RESOURCE_INDEX[resource_type]] += 1.0
+        cargo /= alien.max_cargo
+
+        resources = world.resources
+        obs[OBS_RESOURCES] = resources.balances / RESOURCE_SCALE
+
+        for offset, upgrade in enumerate(world.upgrade_system.upgrades.values()):
+            obs[OBS_LEVELS.start + offset] = upgrade.level / upgrade.max_level
+
+        obs[OBS_BASE.start] = (world.base_x - alien.x) / SCREEN_WIDTH
+        obs[OBS_BASE.start + 1] = (world.base_y - alien.y) / SCREEN_HEIGHT
+
+        # Nearest living humans, written straight into the observation view
+        humans_obs = self._humans_obs
+        humans_obs[:] = 0.0
+        humans = world.humans
+        alive = humans.alive_indices()
+        if len(alive):
+            dx = humans.x[alive] - alien.x
+            dy = humans.y[alive] - alien.y
+            distance = dx * dx + dy * dy
+            k = min(NEAREST_HUMANS, len(alive))
+            nearest = np.argpartition(distance, k - 1)[:k] if len(alive) > k else np.arange(k)
+            nearest = nearest[np.argsort(distance[nearest])]
+            humans_obs[:k, 0] = dx[nearest] / SCREEN_WIDTH
+            humans_obs[:k, 1] = dy[nearest] / SCREEN_HEIGHT
+            humans_obs[:k, 2] = (humans.type_code[alive[nearest]] + 1) / len(TYPE_RESOURCES)
+        return obs
@@ -1,4 +1,5 @@
 import pygame
+from .text_cache import get_font, text_cache
 from typing import Callable, Optional, Tuple
 
 class Button:
@@ -10,7 +11,7 @@ class Button:
                  callback: Optional[Callable] = None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
@@ -19,9 +20,14 @@ class Button:
         self.enabled = True
         
         # Pre-render text
-        self.text_surface = self.font.render(text, True, text_color)
+        self.text_surface = text_cache.render(text, font_size, text_color)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
     
+    @property
+    def font(self) -> pygame.font.Font:
+        # Looked up on use: a button whose label is already cached never loads its font
+        return get_font(self.font_size)
+    
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.enabled:
             return False
@@ -36,8 +42,11 @@ class Button:
         return False
     
     def update_text(self, new_text: str):
+        surface = text_cache.render(new_text, self.font_size, self.text_color)
+        if surface is self.text_surface:
+            return  # Unchanged text and color
         self.text = new_text
-        self.text_surface = self.font.render(new_text, True, self.text_color)
+        self.text_surface = surface
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
     
     def render(self, screen: pygame.Surface):
@@ -1,11 +1,7 @@
 import pygame
 from typing import Tuple
-import sys
-import os
-
-# Add game module to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from game.constants import *
+from .text_cache import get_font, text_cache
 
 class ProgressBar:
     def __init__(self, x: int, y: int, width: int, height: int,
@@ -24,18 +20,20 @@ class ProgressBar:
         if max_value is not None:
             self.max_value = max_value
     
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, origin: Tuple[int, int] = (0, 0)):
+        rect = self.rect.move(-origin[0], -origin[1])
+        
         # Background
-        pygame.draw.rect(screen, self.bg_color, self.rect)
+        pygame.draw.rect(screen, self.bg_color, rect)
         
         # Fill
         if self.max_value > 0:
-            fill_width = int((self.value / self.max_value) * self.rect.width)
-            fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
+            fill_width = int((self.value / self.max_value) * rect.width)
+            fill_rect = pygame.Rect(rect.x, rect.y, fill_width, rect.height)
             pygame.draw.rect(screen, self.fill_color, fill_rect)
         
         # Border
-        pygame.draw.rect(screen, self.border_color, self.rect, 2)
+        pygame.draw.rect(screen, self.border_color, rect, 2)
 
 class ResourceDisplay:
     def __init__(self, x: int, y: int, label: str, color: Tuple[int, int, int] = WHITE, font_size: int = 24):
@@ -43,13 +41,14 @@ class ResourceDisplay:
         self.y = y
         self.label = label
         self.color = color
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(font_size)
         self.value = 0
         self.last_value = 0
         self.highlight_timer = 0.0
         
         # Pre-render label
-        self.label_surface = self.font.render(f"{label}:", True, self.color)
+        self.label_surface = text_cache.render(f"{label}:", font_size, self.color)
     
     def update_value(self, value: int, dt: float = 0.0):
         if value > self.last_value:
@@ -60,37 +59,76 @@ class ResourceDisplay:
         if self.highlight_timer > 0:
             self.highlight_timer -= dt
     
-    def render(self, screen: pygame.Surface):
+    def value_color(self) -> Tuple[int, int, int]:
+        if self.highlight_timer > 0:
+            # Flash effect when value increases (quantized so glyphs stay cached)
+            flash_intensity = int(255 * (self.highlight_timer / 1.0)) & ~0xF
+            return (255, 255, flash_intensity)
+        return WHITE
+    
+    def state(self) -> tuple:
+        """Everything that affects how this display looks"""
+        return (self.value, self.value_color())
+    
+    def render(self, screen: pygame.Surface, origin: Tuple[int, int] = (0, 0)):
+        x, y = self.x - origin[0], self.y - origin[1]
+        
         # Label
-        screen.blit(self.label_surface, (self.x, self.y))
+        screen.blit(self.label_surface, (x, y))
         
         # Value with highlight effect
-        value_color = WHITE
-        if self.highlight_timer > 0:
-            # Flash effect when value increases
-            flash_intensity = int(255 * (self.highlight_timer / 1.0))
-            value_color = (255, 255, flash_intensity)
-        
-        value_text = self.font.render(str(self.value), True, value_color)
-        screen.blit(value_text, (self.x + 60, self.y))
+        text_cache.blit_number(screen, self.value, (x + 60, y), self.font_size, self.value_color())
+
+# Cargo breakdown labels, in display order
+CARGO_LABELS = (("meat", "R"), ("eggs", "Y"), ("dna", "G"), ("cells", "B"))
+
+def make_panel(size: Tuple[int, int], background: pygame.Rect = None) -> pygame.Surface:
+    """Transparent surface with an optional translucent black background area"""
+    panel = pygame.Surface(size, pygame.SRCALPHA)
+    if background is not None:
+        panel.fill((0, 0, 0, 180), background)
+    return panel
 
 class HUD:
+    """Retained-mode HUD.
+    
+    Each HUD area (stats panel, quest panel, bottom bar) is composed into a
+    cached surface together with a key of the values it shows. A frame where
+    no key changed costs three blits; an area is recomposed only when one of
+    its values changes or a highlight animation is running.
+    """
+    
     def __init__(self):
         # Resource displays with proper colors
         self.meat_display = ResourceDisplay(10, 10, "Meat", (255, 100, 100))  # Red
         self.eggs_display = ResourceDisplay(10, 40, "Eggs", (255, 255, 100))  # Yellow
         self.dna_display = ResourceDisplay(10, 70, "DNA", (100, 255, 100))    # Green
         self.cells_display = ResourceDisplay(10, 100, "Cells", (100, 200, 255))  # Blue
+        self.displays = (self.meat_display, self.eggs_display, self.dna_display, self.cells_display)
         
         # Progress bars
         self.cargo_bar = ProgressBar(200, 10, 200, 20, fill_color=(255, 165, 0))
         
         # Labels
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_large = pygame.font.Font(None, 36)
+        self.font_small = get_font(24)
+        self.font_large = get_font(36)
         
         # Cargo label
-        self.cargo_label = self.font_small.render("Cargo:", True, WHITE)
+        self.cargo_label = text_cache.render("Cargo:", 24, WHITE)
+        
+        # Screen areas the HUD draws into: stats panel + base hint, quest panel, bottom bar
+        self.panel_rect = pygame.Rect(5, 5, 450, 170)
+        self.quest_rect = pygame.Rect(SCREEN_WIDTH - 250, 10, 250, 240)
+        self.bottom_rect = pygame.Rect(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH, 50)
+        self.regions = [self.panel_rect, self.quest_rect, self.bottom_rect]
+        
+        # Cached compositions and the values they were drawn from
+        self.panel = None
+        self.panel_key = None
+        self.quest_panel = None
+        self.quest_key = None
+        self.bottom_panel = None
+        self.bottom_key = None
     
     def update(self, game_world, dt: float = 0.0):
         # Update resource displays with delta time for animations
@@ -102,87 +140,114 @@ class HUD:
         # Update progress bars
         self.cargo_bar.set_value(game_world.alien.cargo, game_world.alien.max_cargo)
     
+    def dirty_regions(self):
+        return self.regions
+    
+    def invalidate(self):
+        """Force every HUD area to be recomposed on the next render"""
+        self.panel_key = self.quest_key = self.bottom_key = None
+    
     def render(self, screen: pygame.Surface, game_world):
-        # Semi-transparent HUD background
-        hud_bg = pygame.Surface((450, 140))
-        hud_bg.set_alpha(180)
-        hud_bg.fill((0, 0, 0))
-        screen.blit(hud_bg, (5, 5))
-        
-        # Resource displays  
-        self.meat_display.render(screen)
-        self.eggs_display.render(screen)
-        self.dna_display.render(screen)
-        self.cells_display.render(screen)
+        alien = game_world.alien
+        
+        # Base proximity hint (squared distance, no sqrt)
+        near_base = False
+        if alien.cargo > 0:
+            dx = alien.x - game_world.base_x
+            dy = alien.y - game_world.base_y
+            near_base = dx * dx + dy * dy < (game_world.base_size * 2) ** 2
+        
+        panel_key = (tuple(display.state() for display in self.displays),
+                     alien.cargo, alien.max_cargo, near_base)
+        if panel_key != self.panel_key:
+            self.panel = self.compose_panel(game_world, near_base)
+            self.panel_key = panel_key
+        screen.blit(self.panel, self.panel_rect)
+        
+        # Quest display
+        self.render_quests(screen, game_world)
+        
+        # Size shows base_size: alien.size pulses every tick while carrying cargo
+        bottom_key = (round(alien.speed), alien.base_size)
+        if bottom_key != self.bottom_key:
+            self.bottom_panel = self.compose_bottom(game_world)
+            self.bottom_key = bottom_key
+        screen.blit(self.bottom_panel, self.bottom_rect)
+    
+    def compose_panel(self, game_world, near_base: bool) -> pygame.Surface:
+        """Draw resources, cargo and base hint into a fresh panel surface"""
+        origin = self.panel_rect.topleft
+        panel = make_panel(self.panel_rect.size, pygame.Rect(0, 0, 450, 140))
+        
+        # Resource displays
+        for display in self.displays:
+            display.render(panel, origin)
         
         # Cargo section
-        screen.blit(self.cargo_label, (200, 35))
-        self.cargo_bar.render(screen)
-        
-        # Cargo text with resource breakdown
-        cargo_text = f"{game_world.alien.cargo}/{game_world.alien.max_cargo}"
-        if hasattr(game_world.alien, 'cargo_types') and game_world.alien.cargo_types:
-            # Count each resource type in cargo
-            meat_count = game_world.alien.cargo_types.count("meat")
-            eggs_count = game_world.alien.cargo_types.count("eggs")
-            dna_count = game_world.alien.cargo_types.count("dna")
-            cells_count = game_world.alien.cargo_types.count("cells")
-            
-            breakdown = []
-            if meat_count > 0: breakdown.append(f"R:{meat_count}")
-            if eggs_count > 0: breakdown.append(f"Y:{eggs_count}")
-            if dna_count > 0: breakdown.append(f"G:{dna_count}")
-            if cells_count > 0: breakdown.append(f"B:{cells_count}")
-            
+        panel.blit(self.cargo_label, (200 - origin[0], 35 - origin[1]))
+        self.cargo_bar.render(panel, origin)
+        
+        # Cargo text with resource breakdown, counted in one pass
+        alien = game_world.alien
+        cargo_text = f"{alien.cargo}/{alien.max_cargo}"
+        if alien.cargo_types:
+            counts = {}
+            for resource_type in alien.cargo_types:
+                counts[resource_type] = counts.get(resource_type, 0) + 1
+            breakdown = [f"{label}:{counts[resource_type]}"
+                         for resource_type, label in CARGO_LABELS if resource_type in counts]
             if breakdown:
                 cargo_text += f" ({', '.join(breakdown)})"
         
-        cargo_surface = self.font_small.render(cargo_text, True, WHITE)
-        cargo_rect = cargo_surface.get_rect(center=(300, 20))
-        screen.blit(cargo_surface, cargo_rect)
-        
-        # Base proximity hint
-        distance_to_base = ((game_world.alien.x - game_world.base_x) ** 2 + 
-                           (game_world.alien.y - game_world.base_y) ** 2) ** 0.5
+        cargo_surface = text_cache.render(cargo_text, 24, WHITE)
+        cargo_rect = cargo_surface.get_rect(center=(300 - origin[0], 20 - origin[1]))
+        panel.blit(cargo_surface, cargo_rect)
         
-        if game_world.alien.cargo > 0 and distance_to_base < game_world.base_size * 2:
-            hint_text = self.font_small.render("Near base - cargo will be deposited!", True, (255, 255, 0))
-            screen.blit(hint_text, (10, 150))
+        if near_base:
+            hint_text = text_cache.render("Near base - cargo will be deposited!", 24, (255, 255, 0))
+            panel.blit(hint_text, (10 - origin[0], 150 - origin[1]))
+        return panel
+    
+    def compose_bottom(self, game_world) -> pygame.Surface:
+        """Draw the stats line and controls reminder into a fresh bottom bar"""
+        top = self.bottom_rect.top
+        panel = make_panel(self.bottom_rect.size)
         
         # Speed/Stats info
-        stats_text = f"Speed: {game_world.alien.speed:.0f} | Size: {game_world.alien.size}"
-        stats_surface = self.font_small.render(stats_text, True, (200, 200, 200))
-        screen.blit(stats_surface, (10, SCREEN_HEIGHT - 50))
-        
-        # Quest display
-        self.render_quests(screen, game_world)
+        stats_text = f"Speed: {game_world.alien.speed:.0f} | Size: {game_world.alien.base_size}"
+        stats_surface = text_cache.render(stats_text, 24, (200, 200, 200))
+        panel.blit(stats_surface, (10, SCREEN_HEIGHT - 50 - top))
         
         # Controls reminder - split into two lines for better readability
         controls_text1 = "WASD/Mouse: Move | ESC: Menu | U: Upgrades | Q: Claim Quests"
         controls_text2 = "Left Click: Move to position | Right Click: Future abilities"
         
-        controls_surface1 = self.font_small.render(controls_text1, True, (150, 150, 150))
-        controls_surface2 = self.font_small.render(controls_text2, True, (120, 120, 120))
+        controls_surface1 = text_cache.render(controls_text1, 24, (150, 150, 150))
+        controls_surface2 = text_cache.render(controls_text2, 24, (120, 120, 120))
         
-        screen.blit(controls_surface1, (10, SCREEN_HEIGHT - 45))
-        screen.blit(controls_surface2, (10, SCREEN_HEIGHT - 25))
+        panel.blit(controls_surface1, (10, SCREEN_HEIGHT - 45 - top))
+        panel.blit(controls_surface2, (10, SCREEN_HEIGHT - 25 - top))
+        return panel
     
     def render_quests(self, screen: pygame.Surface, game_world):
         """Render active quests on the right side of screen"""
-        quest_x = SCREEN_WIDTH - 250
-        quest_y = 10
-        
-        # Quest background
-        quest_bg = pygame.Surface((240, 200))
-        quest_bg.set_alpha(180)
-        quest_bg.fill((0, 0, 0))
-        screen.blit(quest_bg, (quest_x, quest_y))
+        quests = game_world.quest_system.quests
+        quest_key = tuple((quest.title, quest.current_value, quest.target_value, quest.status)
+                          for quest in quests)
+        if quest_key != self.quest_key:
+            self.quest_panel = self.compose_quests(game_world)
+            self.quest_key = quest_key
+        screen.blit(self.quest_panel, self.quest_rect)
+    
+    def compose_quests(self, game_world) -> pygame.Surface:
+        """Draw the quest list into a fresh quest panel surface"""
+        panel = make_panel(self.quest_rect.size, pygame.Rect(0, 0, 240, 200))
         
         # Quest title
-        title_text = self.font_small.render("QUESTS", True, (255, 255, 0))
-        screen.blit(title_text, (quest_x + 10, quest_y + 5))
+        title_text = text_cache.render("QUESTS", 24, (255, 255, 0))
+        panel.blit(title_text, (10, 5))
         
-        y_offset = quest_y + 30
+        y_offset = 30
         for i, quest in enumerate(game_world.quest_system.get_active_quests()):
             if i >= 3:  # Limit to 3 visible quests
                 break
@@ -196,12 +261,12 @@ class HUD:
                 status_text = f"{quest.current_value}/{quest.target_value}"
             
             # Quest title
-            title_surface = self.font_small.render(quest.title, True, color)
-            screen.blit(title_surface, (quest_x + 10, y_offset))
+            title_surface = text_cache.render(quest.title, 24, color)
+            panel.blit(title_surface, (10, y_offset))
             
             # Quest progress
-            progress_surface = self.font_small.render(status_text, True, color)
-            screen.blit(progress_surface, (quest_x + 10, y_offset + 20))
+            progress_surface = text_cache.render(status_text, 24, color)
+            panel.blit(progress_surface, (10, y_offset + 20))
             
             y_offset += 50
         
@@ -209,5 +274,6 @@ class HUD:
         completed_quests = game_world.quest_system.get_completed_quests()
         if completed_quests:
             claim_text = f"Press Q to claim {len(completed_quests)} quest(s)!"
-            claim_surface = self.font_small.render(claim_text, True, (255, 255, 0))
-            screen.blit(claim_surface, (quest_x + 10, y_offset + 10))
\ No newline at end of file
+            claim_surface = text_cache.render(claim_text, 24, (255, 255, 0))
+            panel.blit(claim_surface, (10, y_offset + 10))
+        return panel
@@ -1,17 +1,14 @@
 import pygame
-import sys
-import os
 from typing import List, Optional
 from .button import Button
-
-# Add game module to path  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from .text_cache import text_cache
 from game.constants import *
 
 class Menu:
     def __init__(self):
         self.buttons: List[Button] = []
         self.visible = True
+        self.overlay = None
     
     def add_button(self, button: Button):
         self.buttons.append(button)
@@ -31,6 +28,14 @@ class Menu:
             
         for button in self.buttons:
             button.render(screen)
+    
+    def render_overlay(self, screen: pygame.Surface):
+        # Semi-transparent backdrop, built on first use
+        if self.overlay is None:
+            self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.overlay.set_alpha(128)
+            self.overlay.fill((0, 0, 0))
+        screen.blit(self.overlay, (0, 0))
 
 class MainMenu(Menu):
     def __init__(self, game_manager):
@@ -38,13 +43,11 @@ class MainMenu(Menu):
         self.game_manager = game_manager
         
         # Title
-        self.title_font = pygame.font.Font(None, 72)
-        self.title_text = self.title_font.render("AI INVASION RPG", True, WHITE)
+        self.title_text = text_cache.render("AI INVASION RPG", 72, WHITE)
         self.title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH//2, 150))
         
         # Subtitle
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.subtitle_text = self.subtitle_font.render("Phase 2: Enhanced UI & Game Feel", True, (200, 200, 200))
+        self.subtitle_text = text_cache.render("Phase 2: Enhanced UI & Game Feel", 36, (200, 200, 200))
         self.subtitle_rect = self.subtitle_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         
         # Buttons
@@ -63,8 +66,7 @@ class MainMenu(Menu):
         self.add_button(quit_button)
     
     def start_game(self):
-        from game.game_manager import GameState
-        self.game_manager.state = GameState.PLAYING
+        self.game_manager.start_game()
         self.visible = False
     
     def open_settings(self):
@@ -78,10 +80,7 @@ class MainMenu(Menu):
             return
             
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        self.render_overlay(screen)
         
         # Title and subtitle
         screen.blit(self.title_text, self.title_rect)
@@ -96,8 +95,7 @@ class PauseMenu(Menu):
         self.game_manager = game_manager
         
         # Title
-        self.title_font = pygame.font.Font(None, 72)
-        self.title_text = self.title_font.render("PAUSED", True, WHITE)
+        self.title_text = text_cache.render("PAUSED", 72, WHITE)
         self.title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         
         # Buttons
@@ -133,10 +131,7 @@ class PauseMenu(Menu):
             return
             
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        self.render_overlay(screen)
         
         # Title
         screen.blit(self.title_text, self.title_rect)
@@ -0,0 +1,63 @@
+import pygame
+from typing import List
+from .hud import make_panel
+from game.constants import FPS
+from .text_cache import get_font, text_cache
+
+class ProfilerOverlay:
+    """On-screen table of per-phase frame times (p50/p95/p99 in ms).
+
+    The table is recomposed every refresh_frames frames rather than every
+    frame, so showing it barely shows up in its own numbers.
+    """
+
+    def __init__(self, profiler, refresh_frames: int = 30, pos=(10, 140)):
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.pos = pos
+        self.visible = False
+        self.surface = None
+        self.refreshed_at = None
+
+    @property
+    def font(self) -> pygame.font.Font:
+        # Only needed once the overlay is shown
+        return get_font(18)
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.surface = None
+
+    def compose(self) -> pygame.Surface:
+        rows = [("phase", "p50", "p95", "p99")]
+        # Group subsystems under their phase; whole-frame time goes last
+        summary = sorted(self.profiler.summary(), key=lambda row: (row[0] == "frame", row[0]))
+        for name, mean, p50, p95, p99, peak in summary:
+            rows.append((name, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        columns = (0, 150, 200, 250)
+        line_height = self.font.get_linesize()
+        height = 10 + line_height * len(rows)
+        panel = make_panel((310, height), pygame.Rect(0, 0, 310, height))
+        for i, row in enumerate(rows):
+            # Highlight phases whose p99 alone exceeds a 60 FPS frame budget
+            over_budget = i and row[0] != "frame" and float(row[3]) > 1000.0 / FPS
+            color = (255, 120, 120) if over_budget else (220, 220, 220)
+            for x, text in zip(columns, row):
+                # Labels are stable and cached; changing numbers are rendered directly
+                if x == 0 or i == 0:
+                    surface = text_cache.render(text, 18, color)
+                else:
+                    surface = self.font.render(text, True, color)
+                panel.blit(surface, (5 + x, 5 + i * line_height))
+        return panel
+
+    def render(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Draw the table if visible; returns the area drawn"""
+        if not self.visible:
+            return []
+        frames = self.profiler.frames
+        if self.surface is None or frames - self.refreshed_at >= self.refresh_frames:
+            self.surface = self.compose()
+            self.refreshed_at = frames
+        return [screen.blit(self.surface, self.pos)]
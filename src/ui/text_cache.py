@@ -0,0 +1,62 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Shared font registry: each (name, size) font is constructed once
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+def get_font(size: int, name: Optional[str] = None) -> pygame.font.Font:
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = pygame.font.Font(name, size)
+    return font
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color).
+
+    Static labels render once; numbers that change every frame go through
+    blit_number, which composes cached per-character glyphs instead of
+    rasterizing a new string each time.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def render(self, text: str, size: int, color: Tuple[int, int, int],
+               font_name: Optional[str] = None) -> pygame.Surface:
+        key = (font_name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = get_font(size, font_name).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Evict least recently used
+        return surface
+
+    def blit_number(self, screen: pygame.Surface, value, pos: Tuple[int, int], size: int,
+                    color: Tuple[int, int, int], center: bool = False,
+                    font_name: Optional[str] = None) -> pygame.Rect:
+        """Draw a number from cached digit glyphs; pos is top-left unless center is set"""
+        glyphs = [self.render(char, size, color, font_name) for char in str(value)]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max(glyph.get_height() for glyph in glyphs)
+
+        x, y = pos
+        if center:
+            x -= width // 2
+            y -= height // 2
+        rect = pygame.Rect(x, y, width, height)
+        for glyph in glyphs:
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return rect
+
+    def clear(self):
+        self.surfaces.clear()
+
+# Shared cache for HUD, world labels and menus
+text_cache = TextCache()
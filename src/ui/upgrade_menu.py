@@ -1,30 +1,106 @@
 import pygame
-import sys
-import os
 from typing import Dict, List
 from .button import Button
-
-# Add game module to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from .text_cache import get_font, text_cache
 from game.constants import *
 
+class UpgradeCard:
+    """Cached presentation of one upgrade: button state plus description and cost text"""
+    
+    def __init__(self, upgrade_name: str, button: Button):
+        self.upgrade_name = upgrade_name
+        self.button = button
+        self.can_afford = None
+        self.desc_surface = None
+        self.cost_surface = None
+    
+    def rebuild(self, upgrade_system):
+        info = upgrade_system.get_upgrade_info(self.upgrade_name)
+        if not info:
+            return
+        button = self.button
+        self.can_afford = info["can_afford"]
+        
+        # Update button color based on affordability
+        if info["maxed"]:
+            button.color = (50, 100, 50)
+            button.text_color = (200, 255, 200)
+            button.enabled = False
+            button.update_text(f"{info['name']} (MAX)")
+        elif info["can_afford"]:
+            button.color = (0, 150, 0)
+            button.text_color = WHITE
+            button.enabled = True
+            button.update_text(f"{info['name']} Lv.{info['level']}")
+        else:
+            button.color = (150, 50, 50)
+            button.text_color = (200, 200, 200)
+            button.enabled = True
+            button.update_text(f"{info['name']} Lv.{info['level']}")
+        
+        self.desc_surface = text_cache.render(info["description"], 24, WHITE)
+        
+        self.cost_surface = None
+        if not info["maxed"]:
+            cost_text = f"Cost: {info['cost_meat']} Meat"
+            if info['cost_eggs'] > 0:
+                cost_text += f", {info['cost_eggs']} Eggs"
+            if info['cost_dna'] > 0:
+                cost_text += f", {info['cost_dna']} DNA"
+            if info['cost_cells'] > 0:
+                cost_text += f", {info['cost_cells']} Cells"
+            
+            cost_color = (0, 255, 0) if info["can_afford"] else (255, 100, 100)
+            self.cost_surface = text_cache.render(cost_text, 24, cost_color)
+    
+    def render(self, screen: pygame.Surface):
+        # Draw upgrade info below button
+        rect = self.button.rect
+        info_y = rect.y + rect.height + 5
+        if self.desc_surface:
+            screen.blit(self.desc_surface, (rect.x, info_y))
+        if self.cost_surface:
+            screen.blit(self.cost_surface, (rect.x, info_y + 25))
+
 class UpgradeMenu:
+    """Upgrade shop overlay.
+    
+    Cards are rebuilt from resource and upgrade-level change notifications
+    rather than every frame: a level change rebuilds that card, a balance
+    change rebuilds only cards whose affordability flipped. Rendering blits
+    the cached surfaces.
+    """
+    
     def __init__(self, game_world):
         self.game_world = game_world
         self.visible = False
         self.buttons: List[Button] = []
         
-        self.font = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font = get_font(36)
+        self.font_small = get_font(24)
+        
+        # Semi-transparent overlay, built once
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay.set_alpha(200)
+        self.overlay.fill((0, 0, 0))
         
         self.create_upgrade_buttons()
         
         # Close button
         close_button = Button(SCREEN_WIDTH - 120, 10, 100, 40, "CLOSE", callback=self.close)
         self.buttons.append(close_button)
+        
+        # Pending work, applied lazily on the next visible render
+        self.resources_surface = None
+        self.resources_changed = True
+        self.dirty_cards = set(self.cards)
+        
+        game_world.resources.add_listener(self.on_resources_changed)
+        game_world.upgrade_system.add_listener(self.on_upgrade_changed)
     
     def create_upgrade_buttons(self):
         self.upgrade_buttons = []
+        self.cards: Dict[str, UpgradeCard] = {}
         upgrades = ["speed", "cargo", "size", "efficiency"]
         
         for i, upgrade_name in enumerate(upgrades):
@@ -34,16 +110,24 @@ class UpgradeMenu:
             button = Button(x, y, 250, 100, upgrade_name.upper(),
                           callback=lambda u=upgrade_name: self.purchase_upgrade(u))
             self.upgrade_buttons.append((upgrade_name, button))
+            self.cards[upgrade_name] = UpgradeCard(upgrade_name, button)
             self.buttons.append(button)
     
+    def on_resources_changed(self, resources, delta):
+        self.resources_changed = True
+    
+    def on_upgrade_changed(self, upgrade_name: str):
+        if upgrade_name in self.cards:
+            self.dirty_cards.add(upgrade_name)
+    
+    def detach(self):
+        """Stop listening to the world (call before discarding the menu)"""
+        self.game_world.resources.remove_listener(self.on_resources_changed)
+        self.game_world.upgrade_system.remove_listener(self.on_upgrade_changed)
+    
     def purchase_upgrade(self, upgrade_name: str):
-        success = self.game_world.upgrade_system.purchase_upgrade(upgrade_name)
+        success = self.game_world.purchase_upgrade(upgrade_name)
         if success:
-            # Create particle effect at alien location
-            self.game_world.particles.create_upgrade_effect(
-                self.game_world.alien.x, 
-                self.game_world.alien.y
-            )
             print(f"Purchased {upgrade_name} upgrade!")
         else:
             print(f"Cannot afford {upgrade_name} upgrade")
@@ -60,72 +144,50 @@ class UpgradeMenu:
                 return True
         return False
     
+    def refresh(self):
+        """Apply pending resource and upgrade changes to the cached cards"""
+        upgrade_system = self.game_world.upgrade_system
+        
+        if self.resources_changed:
+            self.resources_changed = False
+            resources = self.game_world.resources
+            resources_text = (f"Meat: {resources.meat} | "
+                             f"Eggs: {resources.eggs} | "
+                             f"DNA: {resources.dna} | "
+                             f"Cells: {resources.cells}")
+            self.resources_surface = text_cache.render(resources_text, 24, (200, 200, 200))
+            
+            # Only cards whose affordability flipped need new colors
+            for upgrade_name, card in self.cards.items():
+                if upgrade_system.can_afford(upgrade_name) != card.can_afford:
+                    self.dirty_cards.add(upgrade_name)
+        
+        for upgrade_name in self.dirty_cards:
+            self.cards[upgrade_name].rebuild(upgrade_system)
+        self.dirty_cards.clear()
+    
     def render(self, screen: pygame.Surface):
         if not self.visible:
             return
         
+        self.refresh()
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.overlay, (0, 0))
         
         # Title
-        title = self.font.render("ALIEN UPGRADES", True, WHITE)
+        title = text_cache.render("ALIEN UPGRADES", 36, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         screen.blit(title, title_rect)
         
         # Resource display
-        resources_text = (f"Meat: {self.game_world.resources.meat} | "
-                         f"Eggs: {self.game_world.resources.eggs} | "
-                         f"DNA: {self.game_world.resources.dna} | "
-                         f"Cells: {self.game_world.resources.cells}")
-        resources_surface = self.font_small.render(resources_text, True, (200, 200, 200))
-        resources_rect = resources_surface.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        screen.blit(resources_surface, resources_rect)
+        resources_rect = self.resources_surface.get_rect(center=(SCREEN_WIDTH // 2, 120))
+        screen.blit(self.resources_surface, resources_rect)
         
         # Upgrade information
-        for upgrade_name, button in self.upgrade_buttons:
-            info = self.game_world.upgrade_system.get_upgrade_info(upgrade_name)
-            if not info:
-                continue
-            
-            # Update button color based on affordability
-            if info["maxed"]:
-                button.color = (50, 100, 50)
-                button.text_color = (200, 255, 200)
-                button.enabled = False
-                button.update_text(f"{info['name']} (MAX)")
-            elif info["can_afford"]:
-                button.color = (0, 150, 0)
-                button.text_color = WHITE
-                button.enabled = True
-                button.update_text(f"{info['name']} Lv.{info['level']}")
-            else:
-                button.color = (150, 50, 50)
-                button.text_color = (200, 200, 200)
-                button.enabled = True
-                button.update_text(f"{info['name']} Lv.{info['level']}")
-            
-            # Draw upgrade info below button
-            info_y = button.rect.y + button.rect.height + 5
-            
-            desc_text = self.font_small.render(info["description"], True, WHITE)
-            screen.blit(desc_text, (button.rect.x, info_y))
-            
-            if not info["maxed"]:
-                cost_text = f"Cost: {info['cost_meat']} Meat"
-                if info['cost_eggs'] > 0:
-                    cost_text += f", {info['cost_eggs']} Eggs"
-                if info['cost_dna'] > 0:
-                    cost_text += f", {info['cost_dna']} DNA"
-                if info['cost_cells'] > 0:
-                    cost_text += f", {info['cost_cells']} Cells"
-                
-                cost_color = (0, 255, 0) if info["can_afford"] else (255, 100, 100)
-                cost_surface = self.font_small.render(cost_text, True, cost_color)
-                screen.blit(cost_surface, (button.rect.x, info_y + 25))
+        for card in self.cards.values():
+            card.render(screen)
         
         # Render buttons
         for button in self.buttons:
-            button.render(screen)
\ No newline at end of file
+            button.render(screen)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The game packages (game, ui, ai, ...) import each other as top-level packages
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
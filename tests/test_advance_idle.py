@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from game.constants import FIXED_DT
+from game.game_world import GameWorld
+
+TICKS = 3000
+
+def make_world(seed: int, meat_rate: float, cargo: bool) -> GameWorld:
+    world = GameWorld(headless=True, seed=seed)
+    world.resources.meat_per_second = meat_rate
+    world.resources.eggs_per_second = meat_rate / 3
+    if cargo:
+        world.alien.cargo = 1
+        world.alien.cargo_types = ["meat"]
+    return world
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("meat_rate", [0.33, 0.7, 1.0, 2.5])
+@pytest.mark.parametrize("cargo", [False, True])
+def test_skip_matches_stepping(seed, meat_rate, cargo):
+    stepped = make_world(seed, meat_rate, cargo)
+    for _ in range(TICKS):
+        stepped.update(FIXED_DT)
+
+    skipped = make_world(seed, meat_rate, cargo)
+    while skipped.frame_count < TICKS:
+        skipped.advance_idle((TICKS - skipped.frame_count) * FIXED_DT)
+
+    assert skipped.frame_count == stepped.frame_count
+    np.testing.assert_array_equal(skipped.resources.balances, stepped.resources.balances)
+    assert skipped.time == stepped.time
+    assert skipped.alien.animation_timer == stepped.alien.animation_timer
+    np.testing.assert_array_equal(skipped.humans.alive, stepped.humans.alive)
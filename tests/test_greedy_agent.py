@@ -0,0 +1,15 @@
+from ai.greedy_agent import GreedyAgent
+from game.constants import FIXED_DT
+from game.game_world import GameWorld
+
+def test_empty_plan_is_revisited():
+    # Starting broke, no upgrade pays for itself within 120 seconds; once
+    # some meat is banked, one does
+    world = GameWorld(headless=True, seed=1)
+    agent = GreedyAgent.with_planner(plan_horizon=120.0, replan_every=5.0)
+    assert agent.planner.plan_for_world(world, 120.0).next_upgrade() is None
+    for _ in range(int(120 / FIXED_DT)):
+        world.update(FIXED_DT, controls=agent.act(world))
+
+    levels = [upgrade.level for upgrade in world.upgrade_system.upgrades.values()]
+    assert sum(levels) > 0
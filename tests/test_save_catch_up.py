@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from game import save_system
+from game.constants import FIXED_DT
+from game.game_world import GameWorld
+
+OFFLINE = 3600.25
+
+@pytest.fixture
+def saved(tmp_path, monkeypatch):
+    world = GameWorld(headless=True, seed=3)
+    world.resources.meat_per_second = 2.0
+    for _ in range(600):
+        world.update(FIXED_DT)
+    path = str(tmp_path / "catch_up.sav")
+    monkeypatch.setattr(save_system.time, "time", lambda: 1000.0)
+    save_system.save_world(world, path)
+    monkeypatch.setattr(save_system.time, "time", lambda: 1000.0 + OFFLINE)
+    return world, path
+
+def test_catch_up_income_is_not_a_rate(saved):
+    world, path = saved
+    loaded = save_system.load_world(path, headless=True, catch_up=True)
+
+    assert loaded.resources.meat - world.resources.meat == 7200
+    np.testing.assert_allclose(loaded.resources.rates(), world.resources.rates())
+    assert loaded.resources.rate("meat") == pytest.approx(2.0, abs=0.25)
+
+def test_catch_up_reschedules_idle_payout(saved):
+    world, path = saved
+    loaded = save_system.load_world(path, headless=True, catch_up=True)
+
+    # The quarter second left over offline counts toward the next payout
+    expected = loaded.time + loaded.resources.time_until_next_payout()
+    assert loaded.next_idle_payout == pytest.approx(expected)
+    assert loaded.next_idle_payout == pytest.approx(world.next_idle_payout - 0.25)
+
+    meat = loaded.resources.meat
+    while loaded.time + FIXED_DT < expected - 1e-9:
+        loaded.update(FIXED_DT)
+        assert loaded.resources.meat == meat
+    loaded.update(FIXED_DT)
+    assert loaded.resources.meat == meat + 2
@@ -0,0 +1,62 @@
+import time
+import numpy as np
+import pytest
+from ai.upgrade_planner import UpgradePlanner
+from game.upgrade_system import create_default_upgrades
+
+def exhaustive_score(planner: UpgradePlanner, horizon: float, resources) -> float:
+    """Best score over every purchase order, each purchase made as soon as affordable"""
+    best = -np.inf
+
+    def visit(levels, time, holdings):
+        nonlocal best
+        code = planner.encode(levels)
+        rate = planner.rate_table[code]
+        best = max(best, holdings @ planner.weights + planner.value_rates[code] * (horizon - time))
+        for u, level in enumerate(levels):
+            if level >= planner.max_levels[u]:
+                continue
+            cost = planner.costs[u, level]
+            missing = cost - holdings
+            with np.errstate(divide="ignore", invalid="ignore"):
+                waits = np.where(missing > 1e-9, missing / rate, 0.0)
+            waits[np.isnan(waits)] = np.inf
+            wait = waits.max()
+            if time + wait <= horizon:
+                child = list(levels)
+                child[u] += 1
+                visit(tuple(child), time + wait, holdings + rate * wait - cost)
+
+    visit((0,) * len(planner.names), 0.0, np.asarray(resources, dtype=np.float64))
+    return best
+
+@pytest.mark.parametrize("weights", [(1, 0, 0, 0), (1, 0.5, 2, 3), (0, 1, 0, 0)])
+@pytest.mark.parametrize("horizon", [300, 1200])
+@pytest.mark.parametrize("resources", [(0, 0, 0, 0), (30, 10, 5, 0)])
+def test_plan_is_optimal(weights, horizon, resources):
+    upgrades = create_default_upgrades()
+    for upgrade in upgrades.values():
+        upgrade.max_level = 2
+    planner = UpgradePlanner(upgrades=upgrades, weights=weights, max_width=None)
+
+    plan = planner.plan(horizon, resources=resources)
+    assert plan.score == pytest.approx(exhaustive_score(planner, horizon, resources))
+
+@pytest.mark.parametrize("weights", [(1, 0, 0, 0), (1, 0.5, 2, 3)])
+@pytest.mark.parametrize("horizon", [600, 3600])
+def test_plan_is_fast(weights, horizon):
+    planner = UpgradePlanner(weights=weights)
+    planner.plan(horizon)  # Builds the bound table for this horizon
+
+    elapsed = min(timed(planner.plan, horizon) for _ in range(3))
+    assert elapsed < 0.1
+
+def test_beam_matches_exact_search():
+    beam = UpgradePlanner(weights=(1, 0.5, 2, 3))
+    exact = UpgradePlanner(weights=(1, 0.5, 2, 3), max_width=None)
+    assert beam.plan(600).score == pytest.approx(exact.plan(600).score)
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start